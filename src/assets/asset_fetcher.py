@@ -52,6 +52,9 @@ class AssetFetcher:
         
         # リクエスト間隔制御用
         self.last_request_time = 0
+
+        # BGMファイル一覧のキャッシュ（ディレクトリのmtime, ファイル名一覧）
+        self._bgm_cache: Tuple[float, List[str]] = (0, [])
     
     def _respect_rate_limit(self):
         """リクエスト間隔を制御"""
@@ -232,14 +235,21 @@ class AssetFetcher:
         Returns:
             選択したBGMのファイルパス、なければNone
         """
-        if not os.path.exists(self.bgm_dir):
+        try:
+            dir_mtime = os.stat(self.bgm_dir).st_mtime
+        except FileNotFoundError:
             logger.warning(f"BGMディレクトリが見つかりません: {self.bgm_dir}")
             return None
         
-        bgm_files = [
-            f for f in os.listdir(self.bgm_dir)
-            if f.endswith(('.mp3', '.wav', '.m4a'))
-        ]
+        # ディレクトリが更新されたときだけ一覧を作り直す
+        cached_mtime, bgm_files = self._bgm_cache
+        if dir_mtime != cached_mtime:
+            with os.scandir(self.bgm_dir) as entries:
+                bgm_files = [
+                    entry.name for entry in entries
+                    if entry.name.endswith(('.mp3', '.wav', '.m4a'))
+                ]
+            self._bgm_cache = (dir_mtime, bgm_files)
         
         if not bgm_files:
             logger.warning(f"BGMファイルが見つかりません: {self.bgm_dir}")
@@ -0,0 +1,33 @@
+"""
+@file: async_utils.py
+@desc: 同期APIから非同期処理を呼び出すための共通モジュール
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run_sync(coro: Coroutine[Any, Any, T]) -> T:
+    """
+    コルーチンを同期的に実行して結果を返す
+
+    呼び出し元のスレッドでイベントループが動いている場合（Jupyter や非同期アプリから
+    同期APIを呼んだ場合）は asyncio.run が RuntimeError になるため、
+    別スレッドの新しいイベントループで実行して完了を待つ
+
+    Args:
+        coro: 実行するコルーチン
+
+    Returns:
+        コルーチンの戻り値
+    """
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return asyncio.run(coro)
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        return executor.submit(asyncio.run, coro).result()
@@ -0,0 +1,168 @@
+"""
+@file: oauth_cache.py
+@desc: OAuthアクセストークンの有効期限管理・更新・永続化を行う共通モジュール
+"""
+
+import os
+import json
+import time
+import logging
+import threading
+from typing import Any, Callable, Dict, Optional
+
+# ロガー設定
+logger = logging.getLogger(__name__)
+
+
+class OAuthTokenCache:
+    """
+    OAuthトークンをキャッシュし、有効期限が近づいたら更新するクラス
+
+    - 有効期限は絶対時刻（expires_at）で保持
+    - 残り時間がトークン寿命の一定割合を下回ったら更新
+    - 同時に複数スレッドから呼ばれても更新リクエストは1回だけ
+    - 更新結果はJSONファイルにアトミックに保存
+    """
+
+    def __init__(
+        self,
+        refresh_fn: Callable[[Optional[str]], Optional[Dict[str, Any]]],
+        store_path: Optional[str] = None,
+        access_token: Optional[str] = None,
+        refresh_token: Optional[str] = None,
+        refresh_ratio: float = 0.1,
+        min_buffer_secs: int = 60
+    ):
+        """
+        初期化
+
+        Args:
+            refresh_fn: リフレッシュトークンを受け取り、
+                {"access_token", "refresh_token", "expires_in"} を返す関数（失敗時はNone）
+            store_path: トークン保存先JSONファイルのパス（省略時は保存しない）
+            access_token: 初期アクセストークン
+            refresh_token: 初期リフレッシュトークン
+            refresh_ratio: 残り時間が寿命のこの割合を下回ったら更新
+            min_buffer_secs: 寿命が不明な場合も含めた最低限の更新猶予（秒）
+        """
+        self._refresh_fn = refresh_fn
+        self.store_path = os.path.expanduser(store_path) if store_path else None
+        self.access_token = access_token
+        self.refresh_token = refresh_token
+        self.expires_at: Optional[float] = None
+        self.lifetime: Optional[float] = None
+        self.refresh_ratio = refresh_ratio
+        self.min_buffer_secs = min_buffer_secs
+        self._lock = threading.Lock()
+
+        self._load()
+
+    def _load(self) -> None:
+        """保存済みトークンファイルがあれば読み込む（引数・環境変数より優先）"""
+        if not self.store_path or not os.path.exists(self.store_path):
+            return
+        try:
+            with open(self.store_path, "r", encoding="utf-8") as f:
+                stored = json.load(f)
+            self.access_token = stored.get("access_token") or self.access_token
+            self.refresh_token = stored.get("refresh_token") or self.refresh_token
+            self.expires_at = stored.get("expires_at")
+            self.lifetime = stored.get("lifetime")
+            logger.info(f"保存済みトークンを読み込みました: {self.store_path}")
+        except Exception as e:
+            logger.warning(f"トークンファイル読み込みエラー: {str(e)}")
+
+    def _save(self) -> None:
+        """現在のトークンを一時ファイル経由でアトミックに保存"""
+        if not self.store_path:
+            return
+        data = {
+            "access_token": self.access_token,
+            "refresh_token": self.refresh_token,
+            "expires_at": self.expires_at,
+            "lifetime": self.lifetime,
+        }
+        tmp_path = f"{self.store_path}.tmp"
+        try:
+            os.makedirs(os.path.dirname(self.store_path) or ".", exist_ok=True)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(data, f)
+            os.replace(tmp_path, self.store_path)
+        except Exception as e:
+            logger.error(f"トークンファイル保存エラー: {str(e)}")
+
+    def set_expiry(self, expires_in: float, lifetime: Optional[float] = None) -> None:
+        """
+        外部から判明した残り有効期間（秒）を反映
+
+        残り時間はトークンの寿命ではないため、寿命は別途判明している場合のみ更新する
+        （寿命が不明な間は min_buffer_secs を更新猶予として使う）
+
+        Args:
+            expires_in: 残り有効期間（秒）
+            lifetime: 発行から失効までのトークン寿命（秒、不明ならNone）
+        """
+        self.expires_at = time.time() + expires_in
+        if lifetime:
+            self.lifetime = lifetime
+
+    def invalidate(self) -> None:
+        """アクセストークンを無効扱いにし、次回取得時に更新させる"""
+        self.expires_at = 0
+
+    def needs_refresh(self) -> bool:
+        """
+        更新が必要かどうか
+
+        Returns:
+            残り時間が更新猶予を下回っている、またはトークンがない場合True
+        """
+        if not self.access_token:
+            return True
+        # 有効期限が不明な場合は有効とみなす
+        if self.expires_at is None:
+            return False
+        buffer = max(self.min_buffer_secs, (self.lifetime or 0) * self.refresh_ratio)
+        return self.expires_at - time.time() < buffer
+
+    def refresh(self) -> bool:
+        """
+        リフレッシュトークンでアクセストークンを強制更新
+
+        Returns:
+            更新成功かどうか
+        """
+        with self._lock:
+            return self._refresh_locked()
+
+    def _refresh_locked(self) -> bool:
+        """ロック取得済みの状態で更新処理を行う"""
+        result = self._refresh_fn(self.refresh_token)
+        if not result or not result.get("access_token"):
+            return False
+
+        expires_in = result.get("expires_in", 0)
+        self.access_token = result["access_token"]
+        self.refresh_token = result.get("refresh_token") or self.refresh_token
+        self.expires_at = time.time() + expires_in
+        self.lifetime = expires_in or self.lifetime
+        self._save()
+        return True
+
+    def get_valid_token(self) -> Optional[str]:
+        """
+        有効なアクセストークンを取得（必要なら更新）
+
+        Returns:
+            アクセストークン（更新に失敗した場合は現在のトークン）
+        """
+        if not self.needs_refresh():
+            return self.access_token
+
+        with self._lock:
+            # 他スレッドが更新済みなら再利用
+            if self.needs_refresh() and self.refresh_token:
+                logger.info("アクセストークンの有効期限が近いため更新します")
+                if not self._refresh_locked():
+                    logger.error("アクセストークンの更新に失敗しました")
+            return self.access_token
@@ -7,6 +7,7 @@ import os
 import sys
 import logging
 import time
+import asyncio
 import schedule
 import json
 import argparse
@@ -18,6 +19,7 @@ import gspread
 from google.oauth2.service_account import Credentials
 from google.cloud import storage
 
+from async_utils import run_sync
 from tiktok_poster import TikTokPoster
 from instagram_poster import InstagramPoster
 from twitter_poster import TwitterPoster
@@ -261,13 +263,19 @@ class SocialMediaScheduler:
             logger.error(f"動画読み込みエラー: {str(e)}")
             return []
     
-    def download_video_from_gcs(self, video_uri: str, video_id: int) -> Optional[str]:
+    def download_video_from_gcs(
+        self,
+        video_uri: str,
+        video_id: int,
+        platform: Optional[str] = None
+    ) -> Optional[str]:
         """
         GCSから動画をダウンロード
         
         Args:
             video_uri: GCS URI
             video_id: 動画ID
+            platform: 投稿先プラットフォーム名（並行投稿時にファイル名が衝突しないよう付与）
             
         Returns:
             ダウンロードされた動画のローカルパス
@@ -289,7 +297,10 @@ class SocialMediaScheduler:
                 return None
             
             # 保存先パス
-            local_filename = f"video_{video_id}.mp4"
+            if platform:
+                local_filename = f"video_{video_id}_{platform}.mp4"
+            else:
+                local_filename = f"video_{video_id}.mp4"
             local_path = os.path.join(self.videos_folder, local_filename)
             
             # ディレクトリ作成
@@ -432,6 +443,18 @@ class SocialMediaScheduler:
         """
         YouTubeに動画を投稿
         
+        Args:
+            video: 動画情報
+            
+        Returns:
+            投稿結果
+        """
+        return run_sync(self.post_to_youtube_async(video))
+    
+    async def post_to_youtube_async(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        YouTubeに動画を投稿（非同期版）
+        
         Args:
             video: 動画情報
             
@@ -451,7 +474,9 @@ class SocialMediaScheduler:
                 return {"success": True, "already_posted": True}
             
             # 動画をダウンロード
-            local_video_path = self.download_video_from_gcs(video["video_uri"], video_id)
+            local_video_path = await asyncio.to_thread(
+                self.download_video_from_gcs, video["video_uri"], video_id, "youtube"
+            )
             if not local_video_path:
                 logger.error(f"動画ID {video_id} のダウンロードに失敗しました")
                 return {"success": False, "error": "動画ダウンロード失敗"}
@@ -459,7 +484,9 @@ class SocialMediaScheduler:
             # サムネイルをダウンロード（あれば）
             thumbnail_path = None
             if video.get("thumbnail_uri"):
-                thumbnail_path = self.download_thumbnail_from_gcs(video["thumbnail_uri"], video_id)
+                thumbnail_path = await asyncio.to_thread(
+                    self.download_thumbnail_from_gcs, video["thumbnail_uri"], video_id
+                )
             
             # YouTubeに投稿
             logger.info(f"YouTubeに投稿開始: 動画ID {video_id}")
@@ -468,7 +495,7 @@ class SocialMediaScheduler:
             title = video["title"] 
             description = video["description"]
             
-            result = self.youtube_poster.post_video(
+            result = await self.youtube_poster.post_video_async(
                 video_path=local_video_path,
                 title=title,
                 description=description,
@@ -479,7 +506,8 @@ class SocialMediaScheduler:
             
             # 投稿成功した場合はスプレッドシートを更新
             if result["success"]:
-                self.update_spreadsheet_status(
+                await asyncio.to_thread(
+                    self.update_spreadsheet_status,
                     video_id=video_id,
                     row_index=video["row_index"],
                     platform="youtube",
@@ -640,6 +668,18 @@ class SocialMediaScheduler:
         """
         Twitter(X)に動画を投稿
         
+        Args:
+            video: 動画情報
+            
+        Returns:
+            投稿結果
+        """
+        return run_sync(self.post_to_twitter_async(video))
+    
+    async def post_to_twitter_async(self, video: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Twitter(X)に動画を投稿（非同期版）
+        
         Args:
             video: 動画情報
             
@@ -659,7 +699,9 @@ class SocialMediaScheduler:
                 return {"success": True, "already_posted": True}
             
             # 動画をダウンロード
-            local_video_path = self.download_video_from_gcs(video["video_uri"], video_id)
+            local_video_path = await asyncio.to_thread(
+                self.download_video_from_gcs, video["video_uri"], video_id, "twitter"
+            )
             if not local_video_path:
                 logger.error(f"動画ID {video_id} のダウンロードに失敗しました")
                 return {"success": False, "error": "動画ダウンロード失敗"}
@@ -669,14 +711,15 @@ class SocialMediaScheduler:
             
             # Twitterに投稿
             logger.info(f"Twitterに投稿開始: 動画ID {video_id}")
-            result = self.twitter_poster.post_video(
+            result = await self.twitter_poster.post_video_async(
                 video_path=local_video_path,
                 text=f"{title} {description}"
             )
             
             # 投稿成功した場合はスプレッドシートを更新
             if result["success"]:
-                self.update_spreadsheet_status(
+                await asyncio.to_thread(
+                    self.update_spreadsheet_status,
                     video_id=video_id,
                     row_index=video["row_index"],
                     platform="twitter",
@@ -711,12 +754,22 @@ class SocialMediaScheduler:
         """
         results = {}
         
-        # YouTubeに投稿（環境変数がtrueの場合のみ）
+        # YouTube と Twitter は独立したアップロードなので並行して投稿
+        # （環境変数がtrueの場合のみ）
+        concurrent_posts = {}
         if "youtube" in self.platforms and os.environ.get("ENABLE_YOUTUBE_SHORTS", "false").lower() == "true":
-            results["youtube"] = self.post_to_youtube(video)
+            concurrent_posts["youtube"] = self.post_to_youtube_async
         else:
             logging.info("Youtube投稿をスキップ")
         
+        if "twitter" in self.platforms and os.environ.get("ENABLE_TWITTER_SHORTS", "false").lower() == "true":
+            concurrent_posts["twitter"] = self.post_to_twitter_async
+        else:
+            logging.info("Twitter投稿をスキップ")
+        
+        if concurrent_posts:
+            results.update(run_sync(self._gather_posts(concurrent_posts, video)))
+        
         # TikTokに投稿（環境変数がtrueの場合のみ）
         if "tiktok" in self.platforms and os.environ.get("ENABLE_TIKTOK_SHORTS", "false").lower() == "true":
             results["tiktok"] = self.post_to_tiktok(video)
@@ -729,12 +782,33 @@ class SocialMediaScheduler:
         else:
             logging.info("Instagram投稿をスキップ")
         
-        # Twitterに投稿（環境変数がtrueの場合のみ）
-        if "twitter" in self.platforms and os.environ.get("ENABLE_TWITTER_SHORTS", "false").lower() == "true":
-            results["twitter"] = self.post_to_twitter(video)
-        else:
-            logging.info("Twitter投稿をスキップ")
+        return results
+    
+    async def _gather_posts(
+        self,
+        posts: Dict[str, Any],
+        video: Dict[str, Any]
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        複数プラットフォームへの投稿を並行実行
         
+        Args:
+            posts: プラットフォーム名と非同期投稿メソッドの対応
+            video: 動画情報
+            
+        Returns:
+            プラットフォーム別投稿結果
+        """
+        outcomes = await asyncio.gather(
+            *(post(video) for post in posts.values()),
+            return_exceptions=True
+        )
+        results = {}
+        for platform, outcome in zip(posts, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"{platform}投稿エラー: {str(outcome)}")
+                outcome = {"success": False, "error": str(outcome)}
+            results[platform] = outcome
         return results
     
     def process_posting_job(self, time_slot: str):
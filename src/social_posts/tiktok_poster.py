@@ -5,15 +5,60 @@
 
 import os
 import logging
-import json
 import time
+import asyncio
+import httpx
+import jwt
+import orjson
 import requests
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
+from async_utils import run_sync
+from oauth_cache import OAuthTokenCache
+
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+# 投稿状態確認の設定
+STATUS_POLL_SECS = 30
+STATUS_MAX_ATTEMPTS = 10
+STATUS_TIMEOUT = 30.0
+UPLOAD_TIMEOUT = 600.0
+# アクセストークンの寿命（TikTokの仕様で24時間）
+# 残り時間しか分からない場合も、この寿命を基準に早めに更新する
+ACCESS_TOKEN_LIFETIME = 24 * 60 * 60
+
+def _response_text(response: Any) -> str:
+    """エラーログ用にレスポンス本文を文字コード推定なしで文字列化"""
+    return response.content.decode("utf-8", errors="replace")
+
+def _jwt_expiry(token: str) -> Optional[Tuple[float, Optional[float]]]:
+    """
+    トークンがJWTの場合に exp クレーム（UNIX時刻）とトークン寿命を返す
+    
+    署名は検証しない（有効期限の判定にのみ使用し、失効はAPI側の401で検知する）
+    
+    Args:
+        token: アクセストークン
+        
+    Returns:
+        (有効期限のUNIX時刻, 寿命（秒、iatがなければNone）)
+        （JWTでない、またはexpがない場合はNone）
+    """
+    try:
+        claims = jwt.decode(token, options={"verify_signature": False})
+        exp = float(claims["exp"])
+        iat = claims.get("iat")
+        return exp, (exp - float(iat)) if iat is not None else None
+    except Exception:
+        return None
+
+def _read_file(path: str) -> bytes:
+    """ファイル全体をバイト列で読み込む"""
+    with open(path, "rb") as f:
+        return f.read()
+
 class TikTokPoster:
     """TikTokに動画を投稿するクラス"""
     
@@ -22,7 +67,8 @@ class TikTokPoster:
         client_key: Optional[str] = None,
         client_secret: Optional[str] = None,
         access_token: Optional[str] = None,
-        refresh_token: Optional[str] = None
+        refresh_token: Optional[str] = None,
+        token_store_path: Optional[str] = None
     ):
         """
         初期化
@@ -32,21 +78,46 @@ class TikTokPoster:
             client_secret: TikTok APIのClient Secret（環境変数から読み込み可能）
             access_token: TikTok APIのアクセストークン（環境変数から読み込み可能）
             refresh_token: TikTok APIのリフレッシュトークン（環境変数から読み込み可能）
+            token_store_path: 更新したトークンの保存先JSONファイル（デフォルト: ~/.tiktok_tokens.json）
         """
         # API認証情報
         self.client_key = client_key or os.environ.get("TIKTOK_CLIENT_KEY")
         self.client_secret = client_secret or os.environ.get("TIKTOK_CLIENT_SECRET")
-        self.access_token = access_token or os.environ.get("TIKTOK_ACCESS_TOKEN")
-        self.refresh_token = refresh_token or os.environ.get("TIKTOK_REFRESH_TOKEN")
+        
+        # トークン保存ファイル（再起動後も更新済みトークンを使うため、環境変数より優先）
+        self.token_store_path = os.path.expanduser(
+            token_store_path or os.environ.get("TIKTOK_TOKEN_STORE", "~/.tiktok_tokens.json")
+        )
+        
+        # トークンキャッシュ（有効期限管理・更新・保存）
+        self._cache = OAuthTokenCache(
+            refresh_fn=self._refresh_impl,
+            store_path=self.token_store_path,
+            access_token=access_token or os.environ.get("TIKTOK_ACCESS_TOKEN"),
+            refresh_token=refresh_token or os.environ.get("TIKTOK_REFRESH_TOKEN")
+        )
         
         # APIエンドポイント
         self.api_base_url = "https://open.tiktokapis.com/v2"
         
+        # 非同期HTTPクライアント（投稿処理で遅延生成）
+        self._async_client: Optional[httpx.AsyncClient] = None
+        
         # トークンの有効期限確認
         self.check_and_refresh_token()
         
         logger.info("TikTok投稿モジュール初期化完了")
     
+    @property
+    def access_token(self) -> Optional[str]:
+        """現在のアクセストークン"""
+        return self._cache.access_token
+    
+    @property
+    def refresh_token(self) -> Optional[str]:
+        """現在のリフレッシュトークン"""
+        return self._cache.refresh_token
+    
     def check_and_refresh_token(self) -> bool:
         """
         アクセストークンの有効期限を確認し、必要に応じて更新
@@ -60,39 +131,42 @@ class TikTokPoster:
                 logger.warning("TikTok APIトークンが設定されていません")
                 return False
             
-            # トークン情報取得エンドポイント
-            url = f"{self.api_base_url}/oauth/token/info/"
-            
-            # リクエスト
-            headers = {
-                "Authorization": f"Bearer {self.access_token}"
-            }
-            
-            response = requests.get(url, headers=headers)
-            
-            # レスポンスの確認
-            if response.status_code == 200:
-                data = response.json().get("data", {})
+            # トークンがJWTなら exp クレームから有効期限をローカルで判定
+            if self._cache.expires_at is None:
+                jwt_expiry = _jwt_expiry(self.access_token)
+                if jwt_expiry is not None:
+                    jwt_exp, jwt_lifetime = jwt_expiry
+                    self._cache.set_expiry(
+                        jwt_exp - time.time(),
+                        lifetime=jwt_lifetime or ACCESS_TOKEN_LIFETIME
+                    )
+            
+            # 有効期限が不明な場合のみトークン情報を問い合わせる
+            if self._cache.expires_at is None:
+                url = f"{self.api_base_url}/oauth/token/info/"
+                headers = {
+                    "Authorization": f"Bearer {self.access_token}"
+                }
                 
-                # 残り有効期間（秒）を確認
-                expires_in = data.get("expires_in", 0)
+                response = requests.get(url, headers=headers)
+                
+                if response.status_code == 200:
+                    # 残り有効期間（秒）をキャッシュに反映
+                    expires_in = orjson.loads(response.content).get("data", {}).get("expires_in", 0)
+                    self._cache.set_expiry(expires_in, lifetime=ACCESS_TOKEN_LIFETIME)
+                    logger.info(f"TikTokアクセストークンの残り有効期間: {expires_in}秒")
+                
+                # 401エラーの場合はトークン無効なので更新
+                elif response.status_code == 401:
+                    logger.warning("TikTokアクセストークンが無効です。更新を試みます。")
+                    self._cache.invalidate()
                 
-                # 有効期限が24時間未満の場合は更新
-                if expires_in < 24 * 60 * 60:
-                    logger.info(f"TikTokアクセストークンの有効期限が近いため更新します（残り{expires_in}秒）")
-                    return self.refresh_access_token()
                 else:
-                    logger.info(f"TikTokアクセストークンは有効です（残り{expires_in}秒）")
-                    return True
+                    logger.error(f"TikTokトークン情報取得エラー: {response.status_code} {_response_text(response)}")
+                    return False
             
-            # 401エラーの場合はトークン無効なので更新
-            elif response.status_code == 401:
-                logger.warning("TikTokアクセストークンが無効です。更新を試みます。")
-                return self.refresh_access_token()
-            
-            else:
-                logger.error(f"TikTokトークン情報取得エラー: {response.status_code} {response.text}")
-                return False
+            self._cache.get_valid_token()
+            return not self._cache.needs_refresh()
             
         except Exception as e:
             logger.error(f"TikTokトークン確認エラー: {str(e)}")
@@ -105,6 +179,18 @@ class TikTokPoster:
         Returns:
             更新成功かどうか
         """
+        return self._cache.refresh()
+    
+    def _refresh_impl(self, refresh_token: Optional[str]) -> Optional[Dict[str, Any]]:
+        """
+        トークン更新エンドポイントを呼び出す（OAuthTokenCacheから使用）
+        
+        Args:
+            refresh_token: リフレッシュトークン
+            
+        Returns:
+            新しいトークン情報（失敗時はNone）
+        """
         try:
             # トークン更新エンドポイント
             url = f"{self.api_base_url}/oauth/token/"
@@ -114,7 +200,7 @@ class TikTokPoster:
                 "client_key": self.client_key,
                 "client_secret": self.client_secret,
                 "grant_type": "refresh_token",
-                "refresh_token": self.refresh_token
+                "refresh_token": refresh_token
             }
             
             # リクエスト
@@ -122,25 +208,60 @@ class TikTokPoster:
             
             # レスポンスの確認
             if response.status_code == 200:
-                result = response.json()
-                
-                # 新しいトークンを保存
-                self.access_token = result.get("access_token")
-                self.refresh_token = result.get("refresh_token")
-                
-                # 環境変数にも設定（次回起動時のために）
-                os.environ["TIKTOK_ACCESS_TOKEN"] = self.access_token
-                os.environ["TIKTOK_REFRESH_TOKEN"] = self.refresh_token
-                
                 logger.info("TikTokアクセストークンの更新に成功しました")
-                return True
+                return orjson.loads(response.content)
             else:
-                logger.error(f"TikTokトークン更新エラー: {response.status_code} {response.text}")
-                return False
+                logger.error(f"TikTokトークン更新エラー: {response.status_code} {_response_text(response)}")
+                return None
             
         except Exception as e:
             logger.error(f"TikTokトークン更新処理エラー: {str(e)}")
-            return False
+            return None
+    
+    def _build_init_payload(
+        self,
+        title: str,
+        tags: Optional[List[str]],
+        privacy_level: str
+    ) -> Dict[str, Any]:
+        """
+        投稿初期化リクエストのボディを作成
+        
+        Args:
+            title: キャプション
+            tags: ハッシュタグリスト
+            privacy_level: 公開設定
+            
+        Returns:
+            リクエストボディ
+        """
+        init_data = {
+            "post_info": {
+                "title": title,
+                "privacy_level": privacy_level,
+                "disable_duet": False,
+                "disable_comment": False,
+                "disable_stitch": False,
+            }
+        }
+        
+        # タグが指定されている場合は追加
+        if tags and isinstance(tags, list):
+            init_data["post_info"]["title"] = title + " " + " ".join(f"#{tag}" for tag in tags)
+        
+        return init_data
+    
+    def _get_async_client(self) -> httpx.AsyncClient:
+        """接続を使い回すための非同期HTTPクライアントを取得"""
+        if self._async_client is None:
+            self._async_client = httpx.AsyncClient(http2=True, timeout=STATUS_TIMEOUT)
+        return self._async_client
+    
+    async def aclose(self) -> None:
+        """非同期HTTPクライアントを閉じる"""
+        if self._async_client is not None:
+            await self._async_client.aclose()
+            self._async_client = None
     
     def post_video(
         self,
@@ -150,7 +271,39 @@ class TikTokPoster:
         privacy_level: str = "PUBLIC"
     ) -> Dict[str, Any]:
         """
-        TikTokに動画を投稿
+        TikTokに動画を投稿（post_video_async の同期ラッパー）
+        
+        イベントループ実行中に呼ばれた場合は別スレッドのイベントループで実行する
+        
+        Args:
+            video_path: 動画ファイルパス
+            title: キャプション
+            tags: ハッシュタグリスト
+            privacy_level: 公開設定（'PUBLIC', 'SELF_ONLY', 'FOLLOWINGS_ONLY'）
+            
+        Returns:
+            投稿結果
+        """
+        async def _run() -> Dict[str, Any]:
+            try:
+                return await self.post_video_async(video_path, title, tags, privacy_level)
+            finally:
+                # クライアントはイベントループに紐づくため、ループ終了前に閉じる
+                await self.aclose()
+        
+        return run_sync(_run())
+    
+    async def post_video_async(
+        self,
+        video_path: str,
+        title: str,
+        tags: Optional[List[str]] = None,
+        privacy_level: str = "PUBLIC"
+    ) -> Dict[str, Any]:
+        """
+        TikTokに動画を投稿（非同期版）
+        
+        他プラットフォームの投稿と asyncio.gather で並行実行できる
         
         Args:
             video_path: 動画ファイルパス
@@ -163,6 +316,7 @@ class TikTokPoster:
         """
         try:
             logger.info(f"TikTok動画投稿開始: {video_path}")
+            client = self._get_async_client()
             
             # 1. 動画アップロード準備（インテント作成）
             # APIエンドポイント: POST /v2/post/publish/video/init/
@@ -172,40 +326,24 @@ class TikTokPoster:
             file_size = os.path.getsize(video_path)
             
             # リクエストヘッダー
+            access_token = await asyncio.to_thread(self._cache.get_valid_token)
             headers = {
-                "Authorization": f"Bearer {self.access_token}",
+                "Authorization": f"Bearer {access_token}",
                 "Content-Type": "application/json"
             }
             
-            # リクエストボディ
-            init_data = {
-                "post_info": {
-                    "title": title,
-                    "privacy_level": privacy_level,
-                    "disable_duet": False,
-                    "disable_comment": False,
-                    "disable_stitch": False,
-                }
-            }
-            
-            # タグが指定されている場合は追加
-            if tags and isinstance(tags, list):
-                title_with_tags = title
-                for tag in tags:
-                    title_with_tags += f" #{tag}"
-                init_data["post_info"]["title"] = title_with_tags
-            
             # リクエスト送信
-            init_response = requests.post(init_url, headers=headers, json=init_data)
+            init_data = self._build_init_payload(title, tags, privacy_level)
+            init_response = await client.post(init_url, headers=headers, json=init_data)
             
             if init_response.status_code != 200:
-                logger.error(f"TikTok動画投稿初期化エラー: {init_response.status_code} {init_response.text}")
+                logger.error(f"TikTok動画投稿初期化エラー: {init_response.status_code} {_response_text(init_response)}")
                 return {
                     "success": False,
-                    "error": f"投稿初期化エラー: {init_response.text}"
+                    "error": f"投稿初期化エラー: {_response_text(init_response)}"
                 }
             
-            init_result = init_response.json()
+            init_result = orjson.loads(init_response.content)
             
             # アップロードパラメータを取得
             publish_id = init_result.get("data", {}).get("publish_id")
@@ -220,8 +358,7 @@ class TikTokPoster:
             
             # 2. 動画ファイルをアップロード
             # 動画ファイルを読み込み
-            with open(video_path, "rb") as f:
-                video_data = f.read()
+            video_data = await asyncio.to_thread(_read_file, video_path)
             
             # アップロードリクエスト
             upload_headers = {
@@ -229,13 +366,15 @@ class TikTokPoster:
                 "Content-Length": str(file_size)
             }
             
-            upload_response = requests.put(upload_url, headers=upload_headers, data=video_data)
+            upload_response = await client.put(
+                upload_url, headers=upload_headers, content=video_data, timeout=UPLOAD_TIMEOUT
+            )
             
             if upload_response.status_code not in [200, 201, 204]:
-                logger.error(f"TikTok動画アップロードエラー: {upload_response.status_code} {upload_response.text}")
+                logger.error(f"TikTok動画アップロードエラー: {upload_response.status_code} {_response_text(upload_response)}")
                 return {
                     "success": False,
-                    "error": f"動画アップロードエラー: {upload_response.text}"
+                    "error": f"動画アップロードエラー: {_response_text(upload_response)}"
                 }
             
             # 3. 投稿完了確認
@@ -248,24 +387,25 @@ class TikTokPoster:
             }
             
             # 投稿状態を確認（最大10回、30秒間隔）
-            for attempt in range(10):
-                # 少し待機
-                time.sleep(30)
+            for attempt in range(STATUS_MAX_ATTEMPTS):
+                # 少し待機（イベントループはブロックしない）
+                await asyncio.sleep(STATUS_POLL_SECS)
                 
                 # リクエスト送信
-                status_response = requests.post(status_url, headers=headers, json=status_data)
+                status_response = await client.post(status_url, headers=headers, json=status_data)
                 
                 if status_response.status_code != 200:
-                    logger.warning(f"TikTok投稿状態確認エラー: {status_response.status_code} {status_response.text}")
+                    logger.warning(f"TikTok投稿状態確認エラー: {status_response.status_code} {_response_text(status_response)}")
                     continue
                 
-                status_result = status_response.json()
+                status_result = orjson.loads(status_response.content)
                 status = status_result.get("data", {}).get("status")
                 
                 # 投稿成功の場合
                 if status == "PUBLISH_COMPLETE":
                     post_id = status_result.get("data", {}).get("post_id")
-                    url = f"https://www.tiktok.com/@{self.get_user_info().get('username', 'user')}/video/{post_id}"
+                    user_info = await self._get_user_info_async()
+                    url = f"https://www.tiktok.com/@{user_info.get('username', 'user')}/video/{post_id}"
                     
                     logger.info(f"TikTok投稿成功: {post_id}")
                     return {
@@ -285,7 +425,7 @@ class TikTokPoster:
                 
                 # まだ処理中の場合
                 else:
-                    logger.info(f"TikTok投稿処理中... ステータス: {status} (試行: {attempt+1}/10)")
+                    logger.info(f"TikTok投稿処理中... ステータス: {status} (試行: {attempt+1}/{STATUS_MAX_ATTEMPTS})")
             
             # タイムアウト
             logger.error("TikTok投稿タイムアウト: 処理完了を確認できませんでした")
@@ -301,6 +441,33 @@ class TikTokPoster:
                 "error": str(e)
             }
     
+    async def _get_user_info_async(self) -> Dict[str, Any]:
+        """
+        ユーザー情報を取得（非同期版）
+        
+        Returns:
+            ユーザー情報
+        """
+        try:
+            url = f"{self.api_base_url}/user/info/"
+            
+            access_token = await asyncio.to_thread(self._cache.get_valid_token)
+            headers = {
+                "Authorization": f"Bearer {access_token}"
+            }
+            
+            response = await self._get_async_client().get(url, headers=headers)
+            
+            if response.status_code == 200:
+                return orjson.loads(response.content).get("data", {})
+            else:
+                logger.error(f"TikTokユーザー情報取得エラー: {response.status_code} {_response_text(response)}")
+                return {}
+                
+        except Exception as e:
+            logger.error(f"TikTokユーザー情報取得処理エラー: {str(e)}")
+            return {}
+    
     def get_user_info(self) -> Dict[str, Any]:
         """
         ユーザー情報を取得
@@ -312,15 +479,15 @@ class TikTokPoster:
             url = f"{self.api_base_url}/user/info/"
             
             headers = {
-                "Authorization": f"Bearer {self.access_token}"
+                "Authorization": f"Bearer {self._cache.get_valid_token()}"
             }
             
             response = requests.get(url, headers=headers)
             
             if response.status_code == 200:
-                return response.json().get("data", {})
+                return orjson.loads(response.content).get("data", {})
             else:
-                logger.error(f"TikTokユーザー情報取得エラー: {response.status_code} {response.text}")
+                logger.error(f"TikTokユーザー情報取得エラー: {response.status_code} {_response_text(response)}")
                 return {}
                 
         except Exception as e:
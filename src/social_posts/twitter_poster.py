@@ -5,21 +5,77 @@
 
 import os
 import time
+import asyncio
 import mimetypes
 import logging
 import math
-from typing import Optional, Dict, Any
-
+import mmap
+import random
+import uuid
+import functools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, Tuple
+
+import aiofiles
+import aiohttp
 import requests
-from requests_oauthlib import OAuth1
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from requests_oauthlib import OAuth1Session
 import tweepy   # v4.14 以降推奨
 
 logger = logging.getLogger(__name__)
 
 BASE_UPLOAD_URL = "https://api.x.com/2/media/upload"
 CHUNK_SIZE = 4 * 1024 * 1024 
-PROCESSING_POLL_SECS = 5 
+PROCESSING_MIN_POLL_SECS = 1
 PROCESSING_TIMEOUT = 180
+PROCESSING_MAX_POLL_SECS = 15
+APPEND_WORKERS = 4
+ASYNC_APPEND_CONCURRENCY = 8
+HTTP_POOL_SIZE = 16
+
+
+def _next_poll_delay(delay: float, processing_info: Dict[str, Any]) -> float:
+    """次回 STATUS までの待機秒数（倍々に伸ばして上限で頭打ち、サーバー指定値を下限とする）"""
+    delay = min(delay * 2, PROCESSING_MAX_POLL_SECS)
+    return max(delay, processing_info.get("check_after_secs", 0))
+
+
+def _with_jitter(delay: float) -> float:
+    """待機秒数に最大10%のジッターを加える"""
+    return delay + random.uniform(0, delay * 0.1)
+
+
+def _encode_append_body(
+    media_id: str, seg_index: int, chunk: memoryview
+) -> Tuple[bytes, str]:
+    """
+    APPEND 用の multipart 本文を組み立てる。
+    チャンクは join で 1 回だけコピーする（requests の files= 経由だと 2 回コピーされる）。
+    本文と Content-Type を返す。
+    """
+    boundary = uuid.uuid4().hex
+    head = (
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="command"\r\n\r\nAPPEND\r\n'
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="media_id"\r\n\r\n{media_id}\r\n'
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="segment_index"\r\n\r\n{seg_index}\r\n'
+        f'--{boundary}\r\n'
+        f'Content-Disposition: form-data; name="media"; filename="media"\r\n'
+        f"Content-Type: application/octet-stream\r\n\r\n"
+    ).encode()
+    tail = f"\r\n--{boundary}--\r\n".encode()
+    return b"".join((head, chunk, tail)), f"multipart/form-data; boundary={boundary}"
+
+
+@functools.lru_cache(maxsize=32)
+def _guess_mime_type(ext: str) -> str:
+    """拡張子から MIME タイプを推定（同じ拡張子は再計算しない）"""
+    mime_type, _ = mimetypes.guess_type(f"media{ext}")
+    return mime_type or "video/mp4"
 
 
 class TwitterPoster:
@@ -31,6 +87,7 @@ class TwitterPoster:
         access_token: Optional[str] = None,
         access_token_secret: Optional[str] = None,
         bearer_token: Optional[str] = None,
+        username: Optional[str] = None,
     ):
         # 認証情報
         self.api_key = api_key or os.getenv("TWITTER_API_KEY")
@@ -55,17 +112,52 @@ class TwitterPoster:
             access_token_secret=self.access_token_secret,
         )
 
-        # OAuth1 署名ヘルパ（メディアアップロード用）
-        self.oauth1 = OAuth1(
+        # api.x.com への接続を使い回す OAuth1 署名付きセッション（メディアアップロード用）
+        # 5xx / 429 は自動リトライ
+        self._session = OAuth1Session(
             self.api_key,
-            self.api_secret,
-            self.access_token,
-            self.access_token_secret,
+            client_secret=self.api_secret,
+            resource_owner_key=self.access_token,
+            resource_owner_secret=self.access_token_secret,
             signature_type="AUTH_HEADER",
         )
+        self._session.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_SIZE,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=Retry(
+                    total=5,
+                    backoff_factor=0.3,
+                    status_forcelist=[429, 500, 502, 503, 504],
+                    allowed_methods=["GET", "POST"],
+                ),
+            ),
+        )
+        # 署名ヘルパはセッションのものを共有（aiohttp 経由の送信でも使う）
+        self.oauth1 = self._session.auth
+
+        # 投稿 URL 用の @username を事前に取得（初回投稿時の往復を省く）
+        self._cached_username = username or os.getenv("TWITTER_USERNAME")
+        if not self._cached_username:
+            try:
+                me = self.client.get_me(user_fields=["username"])
+                self._cached_username = me.data.username
+            except Exception as e:
+                logger.warning(f"username の事前取得に失敗（投稿時に再取得）: {e}")
 
         logger.info("TwitterPoster: 初期化完了")
 
+    def close(self) -> None:
+        """HTTP セッションを閉じる"""
+        self._session.close()
+
+    def __enter__(self) -> "TwitterPoster":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
     def post_text(self, text: str) -> Dict[str, Any]:
         """テキストのみのポスト"""
         try:
@@ -115,6 +207,41 @@ class TwitterPoster:
             logger.exception("動画投稿で例外発生")
             return {"success": False, "error": str(e)}
 
+    async def post_video_async(
+        self,
+        video_path: str,
+        text: str = "",
+        media_category: str = "tweet_video",
+    ) -> Dict[str, Any]:
+        """
+        post_video の非同期版
+        アップロードは aiohttp で行い、Tweepy の同期呼び出しはスレッドで実行する
+        """
+        try:
+            media_id = await self._upload_video_async(video_path, media_category)
+            if not media_id:
+                return {
+                    "success": False,
+                    "error": "media_id が取得できませんでした",
+                }
+
+            res = await asyncio.to_thread(
+                self.client.create_tweet, text=text, media_ids=[media_id]
+            )
+            tweet_id = res.data["id"]
+            username = await asyncio.to_thread(self._get_username)
+
+            logger.info(f"動画付きツイート投稿成功: {tweet_id}")
+            return {
+                "success": True,
+                "tweet_id": tweet_id,
+                "url": f"https://x.com/{username}/status/{tweet_id}",
+            }
+
+        except Exception as e:
+            logger.exception("動画投稿で例外発生")
+            return {"success": False, "error": str(e)}
+
     def _upload_video(self, path: str, media_category: str) -> Optional[str]:
         """
         v2 /2/media/upload を使ったチャンクアップロード。
@@ -122,14 +249,15 @@ class TwitterPoster:
         """
 
         file_size = os.path.getsize(path)
-        mime_type, _ = mimetypes.guess_type(path)
-        mime_type = mime_type or "video/mp4"
+        if file_size == 0:
+            # 空ファイルは mmap できず、アップロードしても失敗するので先に弾く
+            raise ValueError(f"動画ファイルが空です: {path}")
+        mime_type = _guess_mime_type(os.path.splitext(path)[1].lower())
 
         logger.info(f"INIT: size={file_size}, mime={mime_type}")
 
-        init_resp = requests.post(
+        init_resp = self._session.post(
             BASE_UPLOAD_URL,
-            auth=self.oauth1,
             data={
                 "command": "INIT",
                 "media_type": mime_type,
@@ -140,32 +268,28 @@ class TwitterPoster:
         init_resp.raise_for_status()
         media_id = init_resp.json()["data"]["id"]
 
-        with open(path, "rb") as f:
-            seg_index = 0
-            while True:
-                chunk = f.read(CHUNK_SIZE)
-                if not chunk:
-                    break
-
-                files = {"media": chunk}
-                data = {
-                    "command": "APPEND",
-                    "media_id": media_id,
-                    "segment_index": seg_index,
-                }
-                resp = requests.post(
-                    BASE_UPLOAD_URL,
-                    auth=self.oauth1,
-                    data=data,
-                    files=files,
-                )
-                resp.raise_for_status()
-                logger.debug(f"APPEND {seg_index}: {len(chunk)} bytes OK")
-                seg_index += 1
-
-        fin_resp = requests.post(
+        # APPEND はセグメント番号付きなので並列に送信できる
+        # ファイルは mmap し、各セグメントはコピーせず memoryview のスライスで渡す
+        num_chunks = math.ceil(file_size / CHUNK_SIZE)
+        with open(path, "rb") as f, mmap.mmap(
+            f.fileno(), 0, access=mmap.ACCESS_READ
+        ) as mm, memoryview(mm) as view:
+            with ThreadPoolExecutor(max_workers=APPEND_WORKERS) as executor:
+                futures = [
+                    executor.submit(
+                        self._append_chunk,
+                        media_id,
+                        seg_index,
+                        view[seg_index * CHUNK_SIZE:(seg_index + 1) * CHUNK_SIZE],
+                    )
+                    for seg_index in range(num_chunks)
+                ]
+                # 最初に発生した例外をそのまま送出
+                for future in futures:
+                    future.result()
+
+        fin_resp = self._session.post(
             BASE_UPLOAD_URL,
-            auth=self.oauth1,
             data={"command": "FINALIZE", "media_id": media_id},
         )
         fin_resp.raise_for_status()
@@ -178,24 +302,54 @@ class TwitterPoster:
         logger.info(f"UPLOAD 完了 media_id={media_id}")
         return media_id
 
+    def _append_chunk(
+        self, media_id: str, seg_index: int, chunk: memoryview
+    ) -> None:
+        """セグメントを APPEND する（ワーカースレッドで実行）"""
+        size = len(chunk)
+        try:
+            body, content_type = _encode_append_body(media_id, seg_index, chunk)
+            resp = self._session.post(
+                BASE_UPLOAD_URL,
+                data=body,
+                headers={"Content-Type": content_type},
+            )
+            resp.raise_for_status()
+        finally:
+            # 例外のトレースバックに残っても mmap を閉じられるよう参照を解放
+            chunk.release()
+        logger.debug(f"APPEND {seg_index}: {size} bytes OK")
+
     def _wait_processing(
         self, media_id: str, processing_info: Dict[str, Any]
     ) -> bool:
         """STATUS でエンコード完了を待機"""
         start = time.time()
 
+        # 処理不要 or 既に完了していれば待機せずに返す
+        if not processing_info:
+            return True
         state = processing_info.get("state")
-        check_after = processing_info.get("check_after_secs", PROCESSING_POLL_SECS)
-        time.sleep(check_after)
+        if state == "succeeded":
+            return True
+        elif state == "failed":
+            logger.error(f"動画処理失敗: {processing_info}")
+            return False
+
+        # 最初は密にポーリングし、以降は間隔を倍々に広げる
+        delay = max(
+            PROCESSING_MIN_POLL_SECS,
+            processing_info.get("check_after_secs", PROCESSING_MIN_POLL_SECS),
+        )
+        time.sleep(_with_jitter(delay))
 
         while state in ("pending", "in_progress"):
             if time.time() - start > PROCESSING_TIMEOUT:
                 logger.error("動画処理タイムアウト")
                 return False
 
-            status_resp = requests.get(
+            status_resp = self._session.get(
                 BASE_UPLOAD_URL,
-                auth=self.oauth1,
                 params={"command": "STATUS", "media_id": media_id},
             )
             status_resp.raise_for_status()
@@ -212,13 +366,183 @@ class TwitterPoster:
                 logger.error(f"動画処理失敗: {processing_info}")
                 return False
 
-            time.sleep(processing_info.get("check_after_secs", PROCESSING_POLL_SECS))
+            delay = _next_poll_delay(delay, processing_info)
+            time.sleep(_with_jitter(delay))
+
+        return state == "succeeded"
+
+    def _sign(
+        self,
+        method: str,
+        url: str,
+        data: Optional[Dict[str, Any]] = None,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> requests.PreparedRequest:
+        """OAuth1 署名済みリクエストを生成（aiohttp で送信するため）"""
+        prepared = requests.Request(method, url, data=data, params=params).prepare()
+        return self.oauth1(prepared)
+
+    async def _post_form_async(
+        self, session: aiohttp.ClientSession, data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """フォーム形式のコマンド（INIT / FINALIZE）を非同期で送信"""
+        signed = self._sign("POST", BASE_UPLOAD_URL, data=data)
+        headers = {
+            "Authorization": signed.headers["Authorization"],
+            "Content-Type": signed.headers["Content-Type"],
+        }
+        async with session.post(signed.url, data=signed.body, headers=headers) as resp:
+            resp.raise_for_status()
+            return await resp.json()
+
+    async def _upload_video_async(
+        self, path: str, media_category: str
+    ) -> Optional[str]:
+        """
+        _upload_video の非同期版。
+        APPEND を asyncio.gather で同時送信し、成功すれば media_id を返す。
+        """
+        file_size = os.path.getsize(path)
+        if file_size == 0:
+            raise ValueError(f"動画ファイルが空です: {path}")
+        mime_type = _guess_mime_type(os.path.splitext(path)[1].lower())
+
+        logger.info(f"INIT (async): size={file_size}, mime={mime_type}")
+
+        async with aiohttp.ClientSession() as session:
+            init_json = await self._post_form_async(
+                session,
+                {
+                    "command": "INIT",
+                    "media_type": mime_type,
+                    "total_bytes": file_size,
+                    "media_category": media_category,
+                },
+            )
+            media_id = init_json["data"]["id"]
+
+            # ファイルを先頭から読みつつ APPEND を投げ、ディスク読み込みと送信を重ねる
+            # セマフォで同時送信数（= 読み込み済みチャンク数）を制限する
+            semaphore = asyncio.Semaphore(ASYNC_APPEND_CONCURRENCY)
+            tasks = []
+            try:
+                async with aiofiles.open(path, "rb") as f:
+                    seg_index = 0
+                    while True:
+                        await semaphore.acquire()
+                        chunk = await f.read(CHUNK_SIZE)
+                        if not chunk:
+                            semaphore.release()
+                            break
+                        tasks.append(
+                            asyncio.create_task(
+                                self._append_chunk_async(
+                                    session, semaphore, media_id, seg_index, chunk
+                                )
+                            )
+                        )
+                        seg_index += 1
+                await asyncio.gather(*tasks)
+            except BaseException:
+                for task in tasks:
+                    task.cancel()
+                raise
+
+            fin_json = await self._post_form_async(
+                session, {"command": "FINALIZE", "media_id": media_id}
+            )
+            processing_info = fin_json.get("data", {}).get("processing_info")
+
+            if processing_info:
+                if not await self._wait_processing_async(
+                    session, media_id, processing_info
+                ):
+                    raise RuntimeError("動画エンコードが失敗しました")
+
+        logger.info(f"UPLOAD 完了 media_id={media_id}")
+        return media_id
+
+    async def _append_chunk_async(
+        self,
+        session: aiohttp.ClientSession,
+        semaphore: asyncio.Semaphore,
+        media_id: str,
+        seg_index: int,
+        chunk: bytes,
+    ) -> None:
+        """読み込み済みのセグメントを APPEND し、完了後にセマフォを解放する"""
+        try:
+            form = aiohttp.FormData()
+            form.add_field("command", "APPEND")
+            form.add_field("media_id", str(media_id))
+            form.add_field("segment_index", str(seg_index))
+            form.add_field("media", chunk, content_type="application/octet-stream")
+
+            # multipart の本文は署名対象外なので URL のみで署名する
+            signed = self._sign("POST", BASE_UPLOAD_URL)
+            headers = {"Authorization": signed.headers["Authorization"]}
+            async with session.post(signed.url, data=form, headers=headers) as resp:
+                resp.raise_for_status()
+        finally:
+            semaphore.release()
+
+        logger.debug(f"APPEND {seg_index}: {len(chunk)} bytes OK")
+
+    async def _wait_processing_async(
+        self,
+        session: aiohttp.ClientSession,
+        media_id: str,
+        processing_info: Dict[str, Any],
+    ) -> bool:
+        """_wait_processing の非同期版"""
+        start = time.time()
+
+        state = processing_info.get("state")
+        if state == "succeeded":
+            return True
+        elif state == "failed":
+            logger.error(f"動画処理失敗: {processing_info}")
+            return False
+
+        delay = max(
+            PROCESSING_MIN_POLL_SECS,
+            processing_info.get("check_after_secs", PROCESSING_MIN_POLL_SECS),
+        )
+        await asyncio.sleep(_with_jitter(delay))
+
+        while state in ("pending", "in_progress"):
+            if time.time() - start > PROCESSING_TIMEOUT:
+                logger.error("動画処理タイムアウト")
+                return False
+
+            signed = self._sign(
+                "GET",
+                BASE_UPLOAD_URL,
+                params={"command": "STATUS", "media_id": media_id},
+            )
+            headers = {"Authorization": signed.headers["Authorization"]}
+            async with session.get(signed.url, headers=headers) as resp:
+                resp.raise_for_status()
+                status_json = await resp.json()
+            processing_info = status_json.get("data", {}).get("processing_info", {})
+            state = processing_info.get("state")
+
+            logger.debug(f"STATUS {media_id}: {state}")
+
+            if state == "succeeded":
+                return True
+            elif state == "failed":
+                logger.error(f"動画処理失敗: {processing_info}")
+                return False
+
+            delay = _next_poll_delay(delay, processing_info)
+            await asyncio.sleep(_with_jitter(delay))
 
         return state == "succeeded"
 
     def _get_username(self) -> str:
         """自アカウントの @username をキャッシュ取得"""
-        if not hasattr(self, "_cached_username"):
+        if not self._cached_username:
             me = self.client.get_me(user_fields=["username"])
             self._cached_username = me.data.username
         return self._cached_username
@@ -4,12 +4,21 @@
 """
 
 import os
+import re
 import logging
 import json
 import time
+import random
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from datetime import date, timedelta
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 
+import httplib2
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 from googleapiclient.http import MediaFileUpload
@@ -27,6 +36,63 @@ SCOPES = [
     "https://www.googleapis.com/auth/youtube.readonly",
 ]
 
+# アップロードのチャンクサイズ（これ以下のファイルは1リクエストで送信）
+UPLOAD_CHUNK_SIZE = 16 * 1024 * 1024
+SINGLE_SHOT_MAX_BYTES = 100 * 1024 * 1024
+
+# これより大きいサムネイルはチャンク分割で送信
+THUMBNAIL_RESUMABLE_MIN_BYTES = 1024 * 1024
+THUMBNAIL_CHUNK_SIZE = 256 * 1024
+
+# videos.list で1回に指定できる動画IDの上限
+VIDEOS_LIST_MAX_IDS = 50
+
+# 複数動画を並行処理する際のスレッド数
+BULK_WORKERS = 8
+
+# ISO 8601形式の動画長（例: PT1H2M30S, PT45.5S）
+_ISO_DUR = re.compile(r"^PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+(?:\.\d+)?)S)?$")
+
+@functools.lru_cache(maxsize=1)
+def _load_credentials(token_path: str, mtime: float) -> Credentials:
+    """
+    トークンファイルから認証情報を読み込む（ファイルの更新時刻が変わった時のみ再パース）
+    
+    Args:
+        token_path: 認証トークンのパス
+        mtime: トークンファイルの更新時刻（キャッシュキー）
+        
+    Returns:
+        認証情報
+    """
+    return Credentials.from_authorized_user_file(token_path, SCOPES)
+
+
+def _thumbnail_media(thumbnail_path: str) -> MediaFileUpload:
+    """
+    サムネイル用のMediaFileUploadを作成（MIMEタイプを明示し、大きいファイルは分割送信）
+    
+    Args:
+        thumbnail_path: サムネイル画像パス
+        
+    Returns:
+        MediaFileUpload
+    """
+    if thumbnail_path.lower().endswith(".png"):
+        mimetype = "image/png"
+    else:
+        mimetype = "image/jpeg"
+    
+    if os.path.getsize(thumbnail_path) > THUMBNAIL_RESUMABLE_MIN_BYTES:
+        return MediaFileUpload(
+            thumbnail_path,
+            mimetype=mimetype,
+            resumable=True,
+            chunksize=THUMBNAIL_CHUNK_SIZE
+        )
+    return MediaFileUpload(thumbnail_path, mimetype=mimetype, resumable=False)
+
+
 class YouTubePoster:
     """YouTubeに動画を投稿するクラス"""
     
@@ -63,8 +129,16 @@ class YouTubePoster:
         if self.token_path:
             self.token_path.parent.mkdir(parents=True, exist_ok=True)
         
-        # YouTube APIサービス
+        # YouTube APIサービスと認証情報
         self.service = None
+        self._creds: Optional[Credentials] = None
+        self._analytics_service = None
+        
+        # スレッドごとのHTTP接続（httplib2.Http はスレッドセーフでないため）
+        self._thread_local = threading.local()
+        
+        # 動画IDごとのショート動画判定結果
+        self._short_cache: Dict[str, bool] = {}
         
         logger.info("YouTube投稿モジュール初期化完了")
     
@@ -75,16 +149,20 @@ class YouTubePoster:
         Returns:
             認証済みのYouTube APIサービス
         """
+        # メモリ上の認証情報が有効ならディスクを読まずに再利用
+        if self.service and self._creds and self._creds.valid:
+            return self.service
+        
         if not self.client_secrets_path or not os.path.exists(self.client_secrets_path):
             logger.error(f"クライアントシークレットファイルが見つかりません: {self.client_secrets_path}")
             return None
         
-        creds = None
+        creds = self._creds
         
-        # トークンファイルがある場合は読み込み
-        if self.token_path and os.path.exists(self.token_path):
+        # メモリ上にない場合はトークンファイルから読み込み
+        if not creds and self.token_path and os.path.exists(self.token_path):
             try:
-                creds = Credentials.from_authorized_user_file(str(self.token_path), SCOPES)
+                creds = _load_credentials(str(self.token_path), os.path.getmtime(self.token_path))
             except Exception as e:
                 logger.error(f"トークンファイル読み込みエラー: {str(e)}")
                 # トークンファイルが壊れている場合は再認証
@@ -93,11 +171,13 @@ class YouTubePoster:
         # アクセストークンが無効な場合、リフレッシュトークンがあればリフレッシュ
         if creds and creds.expired and creds.refresh_token:
             try:
+                old_expiry = creds.expiry
                 creds.refresh(Request())
-                # 更新したトークンを保存
-                with open(str(self.token_path), 'w') as token_file:
-                    token_file.write(creds.to_json())
-                logger.info("認証トークンを更新しました")
+                # 有効期限が変わった場合のみ更新したトークンを保存
+                if self.token_path and creds.expiry != old_expiry:
+                    with open(str(self.token_path), 'w') as token_file:
+                        token_file.write(creds.to_json())
+                    logger.info("認証トークンを更新しました")
             except Exception as e:
                 logger.error(f"トークン更新エラー: {str(e)}")
                 # リフレッシュに失敗した場合は再認証
@@ -118,15 +198,35 @@ class YouTubePoster:
                 logger.error(f"認証フローエラー: {str(e)}")
                 return None
         
+        # 同じ認証情報を更新しただけなら既存のサービスを再利用
+        if self.service and creds is self._creds:
+            return self.service
+        
         # 認証済みサービスの構築
         try:
-            service = build('youtube', 'v3', credentials=creds)
+            service = build('youtube', 'v3', credentials=creds, static_discovery=True)
+            self._creds = creds
+            # 認証情報が変わったのでアナリティクス用サービスも作り直す
+            self._analytics_service = None
             logger.info("YouTube API認証成功")
             return service
         except Exception as e:
             logger.error(f"YouTube APIサービス構築エラー: {str(e)}")
             return None
     
+    def _thread_http(self) -> AuthorizedHttp:
+        """
+        現在のスレッド専用の認証済みHTTPを取得
+        
+        Returns:
+            認証済みHTTP
+        """
+        http = getattr(self._thread_local, "http", None)
+        if http is None or http.credentials is not self._creds:
+            http = AuthorizedHttp(self._creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+    
     def post_video(
         self,
         video_path: str,
@@ -196,11 +296,16 @@ class YouTubePoster:
                 body["snippet"]["channelId"] = self.target_channel_id
             
             # メディアファイルの準備
+            # 小さいファイルは一括送信、大きいファイルは16MB単位で往復回数を減らす
+            if os.path.getsize(video_path) <= SINGLE_SHOT_MAX_BYTES:
+                chunksize = -1
+            else:
+                chunksize = UPLOAD_CHUNK_SIZE
             media = MediaFileUpload(
                 video_path,
                 mimetype="video/mp4",
                 resumable=True,
-                chunksize=1024*1024  # 1MB単位でアップロード
+                chunksize=chunksize
             )
             
             # 動画アップロードリクエスト
@@ -216,7 +321,7 @@ class YouTubePoster:
             response = None
             retries = 0
             max_retries = 10
-            retry_interval = 5  # 再試行間隔（秒）
+            max_retry_interval = 60  # 再試行間隔の上限（秒）
             
             while response is None:
                 try:
@@ -226,10 +331,18 @@ class YouTubePoster:
                         logger.info(f"アップロード進捗: {progress}%")
                 except HttpError as e:
                     # 一時的なエラーの場合は再試行
-                    if e.resp.status in [500, 502, 503, 504] and retries < max_retries:
+                    if e.resp.status in [429, 500, 502, 503, 504] and retries < max_retries:
                         retries += 1
                         logger.warning(f"一時的なエラー発生、再試行 ({retries}/{max_retries}): {str(e)}")
-                        time.sleep(retry_interval * retries)  # 徐々に間隔を長くする
+                        # 指数バックオフ + ジッター（Retry-After があればそれ以上待つ）
+                        sleep_secs = min(max_retry_interval, 2 ** retries) + random.uniform(0, 1)
+                        retry_after = e.resp.get("retry-after")
+                        if retry_after:
+                            try:
+                                sleep_secs = max(sleep_secs, float(retry_after))
+                            except ValueError:
+                                pass
+                        time.sleep(sleep_secs)
                     else:
                         logger.error(f"YouTube APIエラー: {str(e)}")
                         return {
@@ -252,7 +365,7 @@ class YouTubePoster:
                     logger.info(f"サムネイル設定開始: {thumbnail_path}")
                     self.service.thumbnails().set(
                         videoId=video_id,
-                        media_body=MediaFileUpload(thumbnail_path, mimetype="image/jpeg")
+                        media_body=_thumbnail_media(thumbnail_path)
                     ).execute()
                     logger.info("サムネイル設定完了")
                 except Exception as e:
@@ -276,6 +389,40 @@ class YouTubePoster:
                 "error": str(e)
             }
     
+    async def post_video_async(
+        self,
+        video_path: str,
+        title: str,
+        description: str = "",
+        tags: Optional[List[str]] = None,
+        category_id: str = "22",
+        privacy_status: str = "public",
+        made_for_kids: bool = False,
+        thumbnail_path: Optional[str] = None,
+        notify_subscribers: bool = True
+    ) -> Dict[str, Any]:
+        """
+        post_video の非同期版（Google APIクライアントは同期のためスレッドで実行）
+        
+        Args:
+            post_video と同じ
+            
+        Returns:
+            投稿結果
+        """
+        return await asyncio.to_thread(
+            self.post_video,
+            video_path=video_path,
+            title=title,
+            description=description,
+            tags=tags,
+            category_id=category_id,
+            privacy_status=privacy_status,
+            made_for_kids=made_for_kids,
+            thumbnail_path=thumbnail_path,
+            notify_subscribers=notify_subscribers
+        )
+    
     def get_video_info(self, video_id: str) -> Dict[str, Any]:
         """
         動画情報を取得
@@ -286,6 +433,22 @@ class YouTubePoster:
         Returns:
             動画情報
         """
+        info = self.get_video_infos([video_id]).get(video_id, {})
+        if not info:
+            logger.error(f"動画が見つかりません: {video_id}")
+        return info
+    
+    def get_video_infos(self, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
+        """
+        複数動画の情報をまとめて取得（videos.list は1回で最大50件）
+        
+        Args:
+            video_ids: 動画IDのリスト
+            
+        Returns:
+            動画IDをキーとした動画情報
+        """
+        results = {}
         try:
             # APIサービスの取得
             if not self.service:
@@ -295,37 +458,86 @@ class YouTubePoster:
                 logger.error("YouTube API認証に失敗しました")
                 return {}
             
-            # 動画情報を取得
-            response = self.service.videos().list(
-                part="snippet,statistics,status",
-                id=video_id
-            ).execute()
-            
-            if not response.get("items"):
-                logger.error(f"動画が見つかりません: {video_id}")
-                return {}
-            
-            video = response["items"][0]
-            
-            # 必要な情報を抽出
-            result = {
-                "id": video["id"],
-                "title": video["snippet"]["title"],
-                "description": video["snippet"]["description"],
-                "published_at": video["snippet"]["publishedAt"],
-                "thumbnail_url": video["snippet"]["thumbnails"]["high"]["url"],
-                "view_count": int(video["statistics"].get("viewCount", 0)),
-                "like_count": int(video["statistics"].get("likeCount", 0)),
-                "comment_count": int(video["statistics"].get("commentCount", 0)),
-                "privacy_status": video["status"]["privacyStatus"],
-                "embedable": video["status"].get("embeddable", False)
-            }
+            groups = [
+                video_ids[i:i + VIDEOS_LIST_MAX_IDS]
+                for i in range(0, len(video_ids), VIDEOS_LIST_MAX_IDS)
+            ]
+            
+            if len(groups) <= 1:
+                # 1回で済む場合はスレッドを立てず、サービスのHTTP接続をそのまま使う
+                batches = [self._list_videos(group) for group in groups]
+            else:
+                # 50件を超える場合はグループごとのリクエストを並行実行（HTTPはスレッドごとに用意）
+                with ThreadPoolExecutor(max_workers=min(BULK_WORKERS, len(groups))) as executor:
+                    batches = list(executor.map(
+                        lambda group: self._list_videos(group, http=self._thread_http()),
+                        groups
+                    ))
+            
+            for videos in batches:
+                # 必要な情報を抽出
+                for video in videos:
+                    results[video["id"]] = {
+                        "id": video["id"],
+                        "title": video["snippet"]["title"],
+                        "description": video["snippet"]["description"],
+                        "published_at": video["snippet"]["publishedAt"],
+                        "thumbnail_url": video["snippet"]["thumbnails"]["high"]["url"],
+                        "view_count": int(video["statistics"].get("viewCount", 0)),
+                        "like_count": int(video["statistics"].get("likeCount", 0)),
+                        "comment_count": int(video["statistics"].get("commentCount", 0)),
+                        "privacy_status": video["status"]["privacyStatus"],
+                        "embedable": video["status"].get("embeddable", False)
+                    }
             
-            return result
+            return results
             
         except Exception as e:
             logger.error(f"動画情報取得エラー: {str(e)}")
-            return {}
+            return results
+    
+    def _list_videos(
+        self,
+        video_ids: List[str],
+        http: Optional[AuthorizedHttp] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        videos.list を1回実行
+        
+        Args:
+            video_ids: 動画IDのリスト（最大50件）
+            http: 使用するHTTP（ワーカースレッドから呼ぶ場合に指定、省略時はサービスのHTTP）
+            
+        Returns:
+            動画リソースのリスト
+        """
+        # id 指定時は maxResults を併用できない
+        response = self.service.videos().list(
+            part="snippet,statistics,status",
+            id=",".join(video_ids)
+        ).execute(http=http)
+        return response.get("items", [])
+    
+    def delete_videos(self, video_ids: List[str]) -> Dict[str, bool]:
+        """
+        複数の動画を並行して削除
+        
+        Args:
+            video_ids: 動画IDのリスト
+            
+        Returns:
+            動画IDをキーとした削除成功かどうか
+        """
+        # 認証はワーカーを起動する前に1回だけ行う
+        if not self.service:
+            self.service = self._get_authenticated_service()
+        
+        if not self.service:
+            logger.error("YouTube API認証に失敗しました")
+            return {video_id: False for video_id in video_ids}
+        
+        with ThreadPoolExecutor(max_workers=BULK_WORKERS) as executor:
+            return dict(zip(video_ids, executor.map(self.delete_video, video_ids)))
     
     def delete_video(self, video_id: str) -> bool:
         """
@@ -347,7 +559,7 @@ class YouTubePoster:
                 return False
             
             # 動画を削除
-            self.service.videos().delete(id=video_id).execute()
+            self.service.videos().delete(id=video_id).execute(http=self._thread_http())
             logger.info(f"YouTube動画削除成功: {video_id}")
             return True
             
@@ -394,68 +606,108 @@ class YouTubePoster:
                     "error": "API認証失敗"
                 }
             
-            # 現在の動画情報を取得
-            response = self.service.videos().list(
-                part="snippet,status",
-                id=video_id
-            ).execute()
-            
-            if not response.get("items"):
-                logger.error(f"動画が見つかりません: {video_id}")
-                return {
-                    "success": False,
-                    "error": "動画が見つかりません"
-                }
-            
-            video = response["items"][0]
-            snippet = video["snippet"]
-            status = video["status"]
-            
-            # 更新リクエストの準備
-            update_parts = []
-            
-            # スニペット更新の準備
-            if any([x is not None for x in [title, description, tags, category_id]]):
-                update_parts.append("snippet")
-                
-                if title is not None:
-                    snippet["title"] = title
-                
-                if description is not None:
-                    snippet["description"] = description
-                
-                if tags is not None:
-                    snippet["tags"] = tags
+            # 更新対象パートの判定
+            update_snippet = (
+                title is not None or description is not None
+                or tags is not None or category_id is not None
+            )
+            update_status = privacy_status is not None or made_for_kids is not None
+            
+            if update_status and not update_snippet:
+                # ステータスのみの更新はスニペットを取得・再送信しない
+                # （status パートは丸ごと置き換わるため、現在のステータスを取得してから変更分をマージする）
+                # ショート判定用の長さも同時に取得
+                response = self.service.videos().list(
+                    part="status,contentDetails",
+                    id=video_id
+                ).execute()
                 
-                if category_id is not None:
-                    snippet["categoryId"] = category_id
-            
-            # ステータス更新の準備
-            if any([x is not None for x in [privacy_status, made_for_kids]]):
-                update_parts.append("status")
+                if not response.get("items"):
+                    logger.error(f"動画が見つかりません: {video_id}")
+                    return {
+                        "success": False,
+                        "error": "動画が見つかりません"
+                    }
                 
+                video = response["items"][0]
+                status = video["status"]
+                duration = video.get("contentDetails", {}).get("duration")
                 if privacy_status is not None:
                     status["privacyStatus"] = privacy_status
                 
                 if made_for_kids is not None:
                     status["selfDeclaredMadeForKids"] = made_for_kids
-            
-            # 更新すべき項目がなければ成功扱い
-            if not update_parts:
-                return {
-                    "success": True,
-                    "message": "更新する項目はありません"
-                }
-            
-            # 更新リクエスト実行
-            update_response = self.service.videos().update(
-                part=",".join(update_parts),
-                body={
-                    "id": video_id,
-                    "snippet": snippet,
-                    "status": status
-                }
-            ).execute()
+                
+                self.service.videos().update(
+                    part="status",
+                    body={
+                        "id": video_id,
+                        "status": status
+                    }
+                ).execute()
+            else:
+                # 現在の動画情報を取得（ショート判定用の長さも同時に取得）
+                response = self.service.videos().list(
+                    part="snippet,status,contentDetails",
+                    id=video_id
+                ).execute()
+                
+                if not response.get("items"):
+                    logger.error(f"動画が見つかりません: {video_id}")
+                    return {
+                        "success": False,
+                        "error": "動画が見つかりません"
+                    }
+                
+                video = response["items"][0]
+                snippet = video["snippet"]
+                status = video["status"]
+                duration = video.get("contentDetails", {}).get("duration")
+                
+                # スニペット更新の準備
+                if update_snippet:
+                    if title is not None:
+                        snippet["title"] = title
+                    
+                    if description is not None:
+                        snippet["description"] = description
+                    
+                    if tags is not None:
+                        snippet["tags"] = tags
+                    
+                    if category_id is not None:
+                        snippet["categoryId"] = category_id
+                
+                # ステータス更新の準備
+                if update_status:
+                    if privacy_status is not None:
+                        status["privacyStatus"] = privacy_status
+                    
+                    if made_for_kids is not None:
+                        status["selfDeclaredMadeForKids"] = made_for_kids
+                
+                # 更新リクエストの準備
+                update_parts = [
+                    part for part, needed in (("snippet", update_snippet), ("status", update_status))
+                    if needed
+                ]
+                
+                # 更新すべき項目がなければ成功扱い
+                if not update_parts:
+                    return {
+                        "success": True,
+                        "message": "更新する項目はありません"
+                    }
+                
+                # 更新リクエスト実行
+                self.service.videos().update(
+                    part=",".join(update_parts),
+                    body={
+                        "id": video_id,
+                        "snippet": snippet,
+                        "status": status
+                    }
+                ).execute()
             
             # サムネイルの更新（指定がある場合）
             if thumbnail_path and os.path.exists(thumbnail_path):
@@ -463,7 +715,7 @@ class YouTubePoster:
                     logger.info(f"サムネイル更新開始: {thumbnail_path}")
                     self.service.thumbnails().set(
                         videoId=video_id,
-                        media_body=MediaFileUpload(thumbnail_path)
+                        media_body=_thumbnail_media(thumbnail_path)
                     ).execute()
                     logger.info("サムネイル更新完了")
                 except Exception as e:
@@ -474,7 +726,7 @@ class YouTubePoster:
             return {
                 "success": True,
                 "video_id": video_id,
-                "url": f"https://youtube.com/shorts/{video_id}" if self._is_short_video(video_id) else f"https://youtube.com/watch?v={video_id}"
+                "url": f"https://youtube.com/shorts/{video_id}" if self._is_short_video(video_id, duration) else f"https://youtube.com/watch?v={video_id}"
             }
             
         except Exception as e:
@@ -504,11 +756,20 @@ class YouTubePoster:
                 return {}
             
             # YouTube Analytics APIの準備（権限が必要）
-            analytics = build('youtubeAnalytics', 'v2', credentials=self.service._credentials)
+            if self._analytics_service is None:
+                self._analytics_service = build(
+                    'youtubeAnalytics',
+                    'v2',
+                    credentials=self.service._credentials,
+                    cache_discovery=False,
+                    static_discovery=True
+                )
+            analytics = self._analytics_service
             
             # アナリティクスデータの取得（過去28日間）
-            now = time.strftime('%Y-%m-%d')
-            start_date = (datetime.strptime(now, '%Y-%m-%d') - timedelta(days=28)).strftime('%Y-%m-%d')
+            today = date.today()
+            now = today.isoformat()
+            start_date = (today - timedelta(days=28)).isoformat()
             
             # メトリクスリクエスト
             analytics_response = analytics.reports().query(
@@ -522,44 +783,42 @@ class YouTubePoster:
             
             # レスポンスの処理
             results = {}
-            if analytics_response.get("rows"):
-                # 時系列データの処理
+            rows = analytics_response.get("rows")
+            if rows:
+                # 時系列データと累計を1回の走査で集計
                 time_series = []
-                for row in analytics_response["rows"]:
-                    date = row[0]  # 日付
-                    metrics = {
-                        "views": row[1],
-                        "likes": row[2],
-                        "dislikes": row[3],
-                        "comments": row[4],
-                        "shares": row[5],
-                        "avg_view_duration": row[6],
-                        "avg_view_percentage": row[7]
-                    }
-                    time_series.append({"date": date, "metrics": metrics})
-                
-                # 累計データの集計
-                total_views = sum(row[1] for row in analytics_response["rows"])
-                total_likes = sum(row[2] for row in analytics_response["rows"])
-                total_comments = sum(row[4] for row in analytics_response["rows"])
-                total_shares = sum(row[5] for row in analytics_response["rows"])
+                total_views = total_likes = total_comments = total_shares = 0
+                sum_view_duration = sum_view_percentage = 0
+                for row in rows:
+                    day, views, likes, dislikes, comments, shares, avg_duration, avg_percentage = row[:8]
+                    time_series.append({
+                        "date": day,
+                        "metrics": {
+                            "views": views,
+                            "likes": likes,
+                            "dislikes": dislikes,
+                            "comments": comments,
+                            "shares": shares,
+                            "avg_view_duration": avg_duration,
+                            "avg_view_percentage": avg_percentage
+                        }
+                    })
+                    total_views += views
+                    total_likes += likes
+                    total_comments += comments
+                    total_shares += shares
+                    sum_view_duration += avg_duration
+                    sum_view_percentage += avg_percentage
                 
                 # 平均値の計算
-                if analytics_response["rows"]:
-                    avg_view_duration = sum(row[6] for row in analytics_response["rows"]) / len(analytics_response["rows"])
-                    avg_view_percentage = sum(row[7] for row in analytics_response["rows"]) / len(analytics_response["rows"])
-                else:
-                    avg_view_duration = 0
-                    avg_view_percentage = 0
-                
                 results = {
                     "total": {
                         "views": total_views,
                         "likes": total_likes,
                         "comments": total_comments,
                         "shares": total_shares,
-                        "avg_view_duration": avg_view_duration,
-                        "avg_view_percentage": avg_view_percentage
+                        "avg_view_duration": sum_view_duration / len(rows),
+                        "avg_view_percentage": sum_view_percentage / len(rows)
                     },
                     "time_series": time_series
                 }
@@ -570,58 +829,55 @@ class YouTubePoster:
             logger.error(f"YouTube分析データ取得エラー: {str(e)}")
             return {}
     
-    def _is_short_video(self, video_id: str) -> bool:
+    def _is_short_video(self, video_id: str, duration: Optional[str] = None) -> bool:
         """
         動画がショート動画かどうかを判定
         
         Args:
             video_id: 動画ID
+            duration: ISO 8601形式の動画長（取得済みならAPI呼び出しを省略）
             
         Returns:
             ショート動画かどうか
         """
+        if video_id in self._short_cache:
+            return self._short_cache[video_id]
+        
         try:
-            # APIサービスの取得
-            if not self.service:
-                self.service = self._get_authenticated_service()
-            
-            if not self.service:
-                logger.error("YouTube API認証に失敗しました")
-                return False
-            
-            # 動画情報を取得
-            response = self.service.videos().list(
-                part="contentDetails",
-                id=video_id
-            ).execute()
-            
-            if not response.get("items"):
-                return False
-            
-            # 動画の長さを確認
-            duration = response["items"][0]["contentDetails"]["duration"]
+            if duration is None:
+                # APIサービスの取得
+                if not self.service:
+                    self.service = self._get_authenticated_service()
+                
+                if not self.service:
+                    logger.error("YouTube API認証に失敗しました")
+                    return False
+                
+                # 動画情報を取得
+                response = self.service.videos().list(
+                    part="contentDetails",
+                    id=video_id
+                ).execute()
+                
+                if not response.get("items"):
+                    return False
+                
+                # 動画の長さを確認
+                duration = response["items"][0]["contentDetails"]["duration"]
             
             # ISO 8601形式の時間をパース
-            # PT1M30S形式（1分30秒）
-            minutes = 0
-            seconds = 0
-            
-            if "M" in duration:
-                minutes_part = duration.split("M")[0].split("PT")[1]
-                minutes = int(minutes_part)
-            
-            if "S" in duration:
-                if "M" in duration:
-                    seconds_part = duration.split("M")[1].split("S")[0]
-                else:
-                    seconds_part = duration.split("PT")[1].split("S")[0]
-                seconds = int(seconds_part)
-            
-            total_seconds = minutes * 60 + seconds
+            # PT1H2M30S形式（1時間2分30秒）
+            match = _ISO_DUR.match(duration)
+            if not match:
+                return False
+            hours, minutes, seconds = match.groups()
+            total_seconds = int(hours or 0) * 3600 + int(minutes or 0) * 60 + int(float(seconds or 0))
             
             # 60秒以内ならショート動画
-            return total_seconds <= 60
+            is_short = total_seconds <= 60
+            self._short_cache[video_id] = is_short
+            return is_short
             
         except Exception as e:
             logger.error(f"ショート動画判定エラー: {str(e)}")
-            return False
\ No newline at end of file
+            return False
@@ -4,15 +4,85 @@
 """
 
 import os
+import mmap
 import logging
-from typing import Optional, Dict, Any, Tuple
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Optional, Dict, Any, List, Tuple
 from datetime import datetime
 from google.cloud import storage
 from google.cloud.exceptions import NotFound
+from google.cloud.storage import transfer_manager
+from google.cloud.storage.retry import DEFAULT_RETRY
+from requests.adapters import HTTPAdapter
 
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+# これより大きいファイルは分割して並列アップロード
+PARALLEL_UPLOAD_THRESHOLD = 150 * 1024 * 1024
+PARALLEL_UPLOAD_CHUNK_SIZE = 32 * 1024 * 1024
+PARALLEL_UPLOAD_MAX_WORKERS = 8
+# マルチパートアップロードのパート数上限
+PARALLEL_UPLOAD_MAX_PARTS = 10000
+# 複数ファイルを一括アップロードするときの同時実行数
+BATCH_UPLOAD_MAX_WORKERS = 8
+# これより大きいファイルはmmap経由で読み込む
+MMAP_UPLOAD_THRESHOLD = 64 * 1024 * 1024
+# 通常アップロードのチャンクサイズ（256KiBの倍数）とタイムアウト（接続, 読み取り）
+UPLOAD_CHUNK_SIZE = 8 * 1024 * 1024
+UPLOAD_TIMEOUT = (10, 300)
+# 一時的なエラー（5xx / 429 / 接続断）を指数バックオフで再試行する
+UPLOAD_RETRY = DEFAULT_RETRY.with_deadline(600).with_delay(
+    initial=1.0, maximum=30.0, multiplier=2.0
+)
+# メタデータに記録する動画の種別
+VIDEO_CONTENT_LABEL = "cosme_shorts_video"
+CHINESE_VIDEO_CONTENT_LABEL = "cosme_shorts_video_chinese"
+# 拡張子ごとのコンテンツタイプ
+_CONTENT_TYPES = {
+    ".mp4": "video/mp4",
+    ".jpg": "image/jpeg",
+    ".jpeg": "image/jpeg",
+    ".png": "image/png",
+}
+# 共有クライアントのHTTP接続プール
+# 接続先ホストは storage / oauth2 程度なのでホスト別プールは少数、1ホストあたりの接続は多めに保持
+HTTP_POOL_HOSTS = 4
+HTTP_POOL_SIZE = 32
+
+# プロセス内で共有するクライアントとバケット（(project_id, bucket_name) をキーとする）
+_CLIENT_CACHE: Dict[Optional[str], storage.Client] = {}
+_BUCKET_CACHE: Dict[Tuple[Optional[str], str], storage.Bucket] = {}
+_CACHE_LOCK = threading.Lock()
+
+
+def _get_client(project_id: Optional[str]) -> storage.Client:
+    """
+    共有ストレージクライアントを取得（ロック取得済みで呼ぶこと）
+    
+    Args:
+        project_id: GCPプロジェクトID
+        
+    Returns:
+        storage.Client
+    """
+    client = _CLIENT_CACHE.get(project_id)
+    if client is None:
+        client = storage.Client(project=project_id)
+        # 並行アップロードで接続プールが詰まらないよう上限を広げ、keep-alive 接続を使い回す
+        # （再試行は UPLOAD_RETRY で行うためアダプタ側では行わない）
+        client._http.mount(
+            "https://",
+            HTTPAdapter(
+                pool_connections=HTTP_POOL_HOSTS,
+                pool_maxsize=HTTP_POOL_SIZE,
+                max_retries=0
+            )
+        )
+        _CLIENT_CACHE[project_id] = client
+    return client
+
 class GCSUploader:
     """Google Cloud Storageにファイルをアップロードするクラス"""
     
@@ -39,16 +109,21 @@ class GCSUploader:
         self.project_id = project_id or os.environ.get("GCP_PROJECT_ID")
         
         try:
-            # ストレージクライアント初期化
-            self.client = storage.Client(project=self.project_id)
-            
-            # バケット存在確認
-            try:
-                self.bucket = self.client.get_bucket(bucket_name)
-                logger.info(f"GCSバケット接続成功: {bucket_name}")
-            except NotFound:
-                logger.error(f"GCSバケットが見つかりません: {bucket_name}")
-                raise
+            with _CACHE_LOCK:
+                # ストレージクライアント初期化（プロセス内で共有）
+                self.client = _get_client(self.project_id)
+                
+                # バケット存在確認（確認済みのバケットは再利用）
+                cache_key = (self.project_id, bucket_name)
+                self.bucket = _BUCKET_CACHE.get(cache_key)
+                if self.bucket is None:
+                    try:
+                        self.bucket = self.client.get_bucket(bucket_name)
+                        _BUCKET_CACHE[cache_key] = self.bucket
+                        logger.info(f"GCSバケット接続成功: {bucket_name}")
+                    except NotFound:
+                        logger.error(f"GCSバケットが見つかりません: {bucket_name}")
+                        raise
                 
         except Exception as e:
             logger.error(f"GCS初期化エラー: {str(e)}")
@@ -84,18 +159,37 @@ class GCSUploader:
             if metadata:
                 blob.metadata = metadata
             
-            # コンテンツタイプの設定
-            if content_type:
-                blob.content_type = content_type
-            elif gcs_path.endswith('.mp4'):
-                blob.content_type = 'video/mp4'
-            elif gcs_path.endswith('.jpg') or gcs_path.endswith('.jpeg'):
-                blob.content_type = 'image/jpeg'
-            elif gcs_path.endswith('.png'):
-                blob.content_type = 'image/png'
+            # コンテンツタイプの設定（未指定なら拡張子から判定）
+            ext = os.path.splitext(gcs_path)[1].lower()
+            blob.content_type = content_type or _CONTENT_TYPES.get(ext)
             
-            # アップロード
-            blob.upload_from_filename(local_path)
+            # アップロード（大きいファイルはパートに分けて並列送信し、サーバー側で結合）
+            file_size = os.path.getsize(local_path)
+            if file_size > PARALLEL_UPLOAD_THRESHOLD:
+                chunk_size = max(
+                    PARALLEL_UPLOAD_CHUNK_SIZE,
+                    -(-file_size // PARALLEL_UPLOAD_MAX_PARTS)
+                )
+                transfer_manager.upload_chunks_concurrently(
+                    local_path,
+                    blob,
+                    chunk_size=chunk_size,
+                    # 既定のプロセスワーカーはプロセスごとにクライアントを作り直すため、
+                    # スレッドで送信して共有クライアントの接続を使い回す
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=PARALLEL_UPLOAD_MAX_WORKERS,
+                    deadline=None
+                )
+            elif file_size > MMAP_UPLOAD_THRESHOLD:
+                # ページキャッシュを直接読み出し、ユーザー空間でのコピーを減らす
+                with open(local_path, "rb") as f, \
+                        mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                    if hasattr(mmap, "MADV_SEQUENTIAL"):
+                        mm.madvise(mmap.MADV_SEQUENTIAL)
+                    self._upload_from_stream(blob, mm, file_size)
+            else:
+                with open(local_path, "rb", buffering=0) as f:
+                    self._upload_from_stream(blob, f, file_size)
             
             # 公開URLの取得
             gcs_uri = f"gs://{self.bucket_name}/{gcs_path}"
@@ -108,6 +202,150 @@ class GCSUploader:
             logger.error(f"アップロードエラー: {str(e)}")
             raise
     
+    def upload_many(
+        self,
+        pairs: List[Tuple[str, str]],
+        max_workers: int = BATCH_UPLOAD_MAX_WORKERS,
+        metadata: Optional[Dict[str, str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        複数の小さいファイルを並列にアップロード
+        
+        Args:
+            pairs: (ローカルファイルパス, GCS上のパス) のリスト
+            max_workers: 同時にアップロードするファイル数
+            metadata: 全ファイルに設定するメタデータ
+            
+        Returns:
+            Dict[str, Dict[str, Any]]: ローカルパスごとの結果
+                成功時は {"success": True, "uri": GCS URI}、
+                失敗時は {"success": False, "error": エラーメッセージ}
+        """
+        results: Dict[str, Dict[str, Any]] = {}
+        if not pairs:
+            return results
+        
+        # 共有クライアントの接続プールを使い回すためスレッドワーカーで実行
+        file_blob_pairs = []
+        for local_path, gcs_path in pairs:
+            blob = self.bucket.blob(gcs_path)
+            if metadata:
+                blob.metadata = metadata
+            ext = os.path.splitext(gcs_path)[1].lower()
+            blob.content_type = _CONTENT_TYPES.get(ext)
+            file_blob_pairs.append((local_path, blob))
+        
+        outcomes = transfer_manager.upload_many(
+            file_blob_pairs,
+            upload_kwargs={"timeout": UPLOAD_TIMEOUT, "retry": UPLOAD_RETRY},
+            raise_exception=False,
+            worker_type=transfer_manager.THREAD,
+            max_workers=max_workers
+        )
+        
+        for (local_path, gcs_path), outcome in zip(pairs, outcomes):
+            if isinstance(outcome, Exception):
+                logger.error(f"アップロードエラー: {local_path}: {str(outcome)}")
+                results[local_path] = {"success": False, "error": str(outcome)}
+            else:
+                results[local_path] = {
+                    "success": True,
+                    "uri": f"gs://{self.bucket_name}/{gcs_path}"
+                }
+        
+        succeeded = sum(1 for r in results.values() if r["success"])
+        logger.info(f"一括アップロード完了: {succeeded}/{len(pairs)} 件成功")
+        
+        return results
+    
+    @staticmethod
+    def _upload_from_stream(blob: storage.Blob, stream: Any, size: int) -> None:
+        """
+        ファイルライクオブジェクトからBLOBへアップロード
+        
+        Args:
+            blob: アップロード先のBLOB
+            stream: 読み込み元（ファイルまたはmmap）
+            size: バイト数
+        """
+        blob.chunk_size = UPLOAD_CHUNK_SIZE
+        blob.upload_from_file(
+            stream,
+            size=size,
+            content_type=blob.content_type,
+            timeout=UPLOAD_TIMEOUT,
+            retry=UPLOAD_RETRY
+        )
+    
+    @staticmethod
+    def _build_metadata(
+        title: str,
+        genre: str,
+        channel: str,
+        content_label: str
+    ) -> Tuple[str, Dict[str, str]]:
+        """
+        アップロード用のタイムスタンプとメタデータを生成
+        
+        Args:
+            title: 動画タイトル
+            genre: ジャンル
+            channel: チャンネル
+            content_label: 動画の種別（日本語版 / 中国語版）
+            
+        Returns:
+            Tuple[str, Dict[str, str]]: ファイル名用タイムスタンプとメタデータ
+        """
+        now = datetime.now()
+        timestamp = now.strftime('%Y%m%d_%H%M%S')
+        metadata = {
+            "title": title,
+            "genre": genre,
+            "channel": channel,
+            "created_at": now.isoformat(),
+            "content_type": content_label,
+            "timestamp": timestamp
+        }
+        return timestamp, metadata
+    
+    def _upload_video_and_thumbnail_concurrently(
+        self,
+        video_path: str,
+        video_gcs_path: str,
+        thumbnail_path: str,
+        thumbnail_gcs_path: str,
+        metadata: Dict[str, str]
+    ) -> Tuple[str, str]:
+        """
+        動画とサムネイルを並行してアップロード
+        
+        Args:
+            video_path: 動画のローカルパス
+            video_gcs_path: 動画のGCS上のパス
+            thumbnail_path: サムネイルのローカルパス
+            thumbnail_gcs_path: サムネイルのGCS上のパス
+            metadata: メタデータ
+            
+        Returns:
+            Tuple[str, str]: アップロードされた動画とサムネイルのGCS URI
+        """
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            video_future = executor.submit(
+                self.upload_file,
+                local_path=video_path,
+                gcs_path=video_gcs_path,
+                content_type="video/mp4",
+                metadata=metadata
+            )
+            thumbnail_future = executor.submit(
+                self.upload_file,
+                local_path=thumbnail_path,
+                gcs_path=thumbnail_gcs_path,
+                content_type="image/png",
+                metadata=metadata
+            )
+            return video_future.result(), thumbnail_future.result()
+    
     def upload_video_and_thumbnail(
         self,
         video_path: str,
@@ -129,42 +367,23 @@ class GCSUploader:
         Returns:
             Tuple[str, str]: アップロードされた動画とサムネイルのGCS URI
         """
-        # タイムスタンプを生成（両方のファイルで共通して使用）
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # タイムスタンプとメタデータを生成（両方のファイルで共通して使用）
+        timestamp, metadata = self._build_metadata(title, genre, channel, VIDEO_CONTENT_LABEL)
         
         # ファイル名の生成
         video_filename = f"video_{timestamp}.mp4"
         thumbnail_filename = f"thumbnail_{timestamp}.png"
         
-        # メタデータの設定
-        metadata = {
-            "title": title,
-            "genre": genre,
-            "channel": channel,
-            "created_at": datetime.now().isoformat(),
-            "content_type": "cosme_shorts_video",
-            "timestamp": timestamp
-        }
-        
-        # 動画アップロード
+        # 動画とサムネイルを並行してアップロード
         video_gcs_path = f"videos/{video_filename}"
-        video_uri = self.upload_file(
-            local_path=video_path,
-            gcs_path=video_gcs_path,
-            content_type="video/mp4",
-            metadata=metadata
-        )
-        
-        # サムネイルアップロード
         thumbnail_gcs_path = f"thumbnails/{thumbnail_filename}"
-        thumbnail_uri = self.upload_file(
-            local_path=thumbnail_path,
-            gcs_path=thumbnail_gcs_path,
-            content_type="image/png",
+        return self._upload_video_and_thumbnail_concurrently(
+            video_path=video_path,
+            video_gcs_path=video_gcs_path,
+            thumbnail_path=thumbnail_path,
+            thumbnail_gcs_path=thumbnail_gcs_path,
             metadata=metadata
         )
-        
-        return video_uri, thumbnail_uri
     
     def upload_video(
         self,
@@ -199,19 +418,9 @@ class GCSUploader:
             return video_uri
         
         # サムネイルが指定されていない場合（従来の動作）
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp, metadata = self._build_metadata(title, genre, channel, VIDEO_CONTENT_LABEL)
         video_filename = f"video_{timestamp}.mp4"
         
-        # メタデータの設定
-        metadata = {
-            "title": title,
-            "genre": genre,
-            "channel": channel,
-            "created_at": datetime.now().isoformat(),
-            "content_type": "cosme_shorts_video",
-            "timestamp": timestamp
-        }
-        
         # 動画アップロード
         video_gcs_path = f"videos/{video_filename}"
         return self.upload_file(
@@ -242,42 +451,23 @@ class GCSUploader:
         Returns:
             Tuple[str, str]: アップロードされた動画とサムネイルのGCS URI
         """
-        # タイムスタンプを生成（両方のファイルで共通して使用）
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        # タイムスタンプとメタデータを生成（両方のファイルで共通して使用）
+        timestamp, metadata = self._build_metadata(title, genre, channel, CHINESE_VIDEO_CONTENT_LABEL)
         
         # ファイル名の生成
         video_filename = f"video_chinese_{timestamp}.mp4"
         thumbnail_filename = f"thumbnail_{timestamp}.png"
         
-        # メタデータの設定
-        metadata = {
-            "title": title,
-            "genre": genre,
-            "channel": channel,
-            "created_at": datetime.now().isoformat(),
-            "content_type": "cosme_shorts_video_chinese",  # 中国語版であることを明示
-            "timestamp": timestamp
-        }
-        
-        # 動画アップロード - 中国語版専用のフォルダを使用
+        # 動画は中国語版専用のフォルダ、サムネイルは通常のフォルダに並行してアップロード
         video_gcs_path = f"videos_chinese/{video_filename}"
-        video_uri = self.upload_file(
-            local_path=video_path,
-            gcs_path=video_gcs_path,
-            content_type="video/mp4",
-            metadata=metadata
-        )
-        
-        # サムネイルアップロード - 通常のサムネイルフォルダを使用
         thumbnail_gcs_path = f"thumbnails/{thumbnail_filename}"
-        thumbnail_uri = self.upload_file(
-            local_path=thumbnail_path,
-            gcs_path=thumbnail_gcs_path,
-            content_type="image/png",
+        return self._upload_video_and_thumbnail_concurrently(
+            video_path=video_path,
+            video_gcs_path=video_gcs_path,
+            thumbnail_path=thumbnail_path,
+            thumbnail_gcs_path=thumbnail_gcs_path,
             metadata=metadata
         )
-        
-        return video_uri, thumbnail_uri
 
     def upload_video_chinese(
         self,
@@ -312,19 +502,9 @@ class GCSUploader:
             return video_uri
         
         # サムネイルが指定されていない場合
-        timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+        timestamp, metadata = self._build_metadata(title, genre, channel, CHINESE_VIDEO_CONTENT_LABEL)
         video_filename = f"video_chinese_{timestamp}.mp4"
         
-        # メタデータの設定
-        metadata = {
-            "title": title,
-            "genre": genre,
-            "channel": channel,
-            "created_at": datetime.now().isoformat(),
-            "content_type": "cosme_shorts_video_chinese",  # 中国語版を明示
-            "timestamp": timestamp
-        }
-        
         # 中国語動画アップロード - 専用フォルダを使用
         video_gcs_path = f"videos_chinese/{video_filename}"
         return self.upload_file(
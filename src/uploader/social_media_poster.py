@@ -4,17 +4,25 @@
 """
 from __future__ import annotations
 
+import io
 import os
 import json
+import asyncio
+import hashlib
 import logging
 import time
+import random
 import http.client
+import threading
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Any, Dict, Optional, List, Set
 
+import httplib2
+import orjson
+from google_auth_httplib2 import AuthorizedHttp
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
-from googleapiclient.http import MediaFileUpload
+from googleapiclient.http import MediaFileUpload, MediaIoBaseUpload
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
 from google.oauth2.credentials import Credentials
@@ -27,6 +35,42 @@ SCOPES: List[str] = [
     "https://www.googleapis.com/auth/youtube.readonly",
 ]
 
+# Files up to one chunk go in a single request; larger ones are sent in
+# 50 MiB resumable chunks to keep the number of round trips low.
+UPLOAD_CHUNK_SIZE = 50 * 1024 * 1024
+MAX_UPLOAD_RETRIES = 10
+RETRIABLE_STATUS_CODES = {500, 502, 503, 504}
+RETRIABLE_EXCEPTIONS = (http.client.IncompleteRead, ConnectionError, TimeoutError)
+
+def _credentials_json(creds: Credentials) -> bytes:
+    """Serialize ``creds`` in the authorized-user format read by ``from_authorized_user_file``."""
+    data = {
+        "token": creds.token,
+        "refresh_token": creds.refresh_token,
+        "token_uri": creds.token_uri,
+        "client_id": creds.client_id,
+        "client_secret": creds.client_secret,
+        "scopes": creds.scopes,
+        "expiry": creds.expiry.isoformat() + "Z" if creds.expiry else None,
+    }
+    return orjson.dumps({k: v for k, v in data.items() if v is not None})
+
+
+# directories already created by this process; skips repeated mkdir syscalls
+_ENSURED_DIRS: Set[Path] = set()
+_ENSURED_DIRS_LOCK = threading.Lock()
+
+
+def _ensure_dir(path: Path) -> None:
+    """Create ``path`` (and parents) once per process."""
+    if path in _ENSURED_DIRS:
+        return
+    with _ENSURED_DIRS_LOCK:
+        if path not in _ENSURED_DIRS:
+            path.mkdir(parents=True, exist_ok=True)
+            _ENSURED_DIRS.add(path)
+
+
 class SocialMediaPoster:
     """Upload a short‑form video to YouTube (and optionally TikTok / Instagram)."""
 
@@ -54,8 +98,18 @@ class SocialMediaPoster:
         self.target_channel_id = target_channel_id or os.environ.get("TARGET_CHANNEL_ID", "")
 
         # ensure paths exist
-        self.youtube_client_secrets.parent.mkdir(parents=True, exist_ok=True)
-        self.youtube_token_path.parent.mkdir(parents=True, exist_ok=True)
+        _ensure_dir(self.youtube_client_secrets.parent)
+        _ensure_dir(self.youtube_token_path.parent)
+
+        # authenticated YouTube client, reused across uploads
+        self._yt_service = None
+        self._yt_creds: Optional[Credentials] = None
+        self._yt_service_lock = threading.Lock()
+        # token file state at our last read/write, to skip needless disk I/O
+        self._token_mtime: Optional[float] = None
+        self._token_digest: Optional[str] = None
+        # httplib2 is not thread-safe, so concurrent uploads each get their own
+        self._thread_local = threading.local()
 
     def post_video(
         self,
@@ -84,7 +138,7 @@ class SocialMediaPoster:
         # ---- YouTube ----
         if self.enable_youtube:
             results["youtube"] = self._post_to_youtube(
-                video_path, title, description, thumbnail_path, tags or ["Shorts"]
+                video_path, title, description, thumbnail_path, tags or ["Shorts"],
             )
         else:
             results["youtube"] = {"success": False, "error": "disabled"}
@@ -103,6 +157,48 @@ class SocialMediaPoster:
 
         return results
 
+    async def post_video_async(
+        self,
+        *,
+        video_path: str,
+        title: str,
+        description: str,
+        thumbnail_path: Optional[str] = None,
+        tags: Optional[List[str]] = None,
+    ) -> Dict[str, Dict[str, str]]:
+        """Async variant of :meth:`post_video`; the blocking upload runs in a worker thread.
+
+        :meth:`post_video` itself never touches the event loop, so it is also
+        safe to call from code that already runs inside one.
+        """
+        return await asyncio.to_thread(
+            self.post_video,
+            video_path=video_path,
+            title=title,
+            description=description,
+            thumbnail_path=thumbnail_path,
+            tags=tags,
+        )
+
+    async def post_videos(
+        self,
+        items: List[Dict[str, Any]],
+        concurrency: int = 4,
+    ) -> List[Any]:
+        """Post several videos concurrently.
+
+        Each item holds the keyword arguments of :meth:`post_video`. At most
+        ``concurrency`` uploads run at once. The result list follows ``items``
+        order; a failed item yields its exception instead of a result mapping.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def _post(item: Dict[str, Any]) -> Dict[str, Dict[str, str]]:
+            async with semaphore:
+                return await self.post_video_async(**item)
+
+        return await asyncio.gather(*(_post(item) for item in items), return_exceptions=True)
+
     def _post_to_youtube(
         self,
         video_path: str,
@@ -130,12 +226,24 @@ class SocialMediaPoster:
                 },
             }
 
-            media = MediaFileUpload(video_path, mimetype="video/mp4", resumable=True)
-            req = service.videos().insert(part=",".join(body.keys()), body=body, media_body=media)
-
-            response = None
-            while response is None:
-                _, response = req.next_chunk()
+            # stat up front so a missing file fails before any API call
+            size = os.path.getsize(video_path)
+            resumable = size > UPLOAD_CHUNK_SIZE
+            # one persistent handle for every chunk instead of a reopen per next_chunk
+            stream = io.FileIO(video_path, "rb")
+            try:
+                media = MediaIoBaseUpload(
+                    stream,
+                    mimetype="video/mp4",
+                    resumable=resumable,
+                    chunksize=max(256 * 1024, min(size, UPLOAD_CHUNK_SIZE)),
+                )
+                req = service.videos().insert(
+                    part=",".join(body.keys()), body=body, media_body=media
+                )
+                response = self._execute_upload(req, resumable, self._thread_http())
+            finally:
+                stream.close()
 
             video_id = response["id"]
             logger.info("YouTube upload complete: %s", video_id)
@@ -143,8 +251,15 @@ class SocialMediaPoster:
             # thumbnail optional
             if thumbnail_path and Path(thumbnail_path).is_file():
                 service.thumbnails().set(
-                    videoId=video_id, media_body=MediaFileUpload(thumbnail_path)
-                ).execute()
+                    videoId=video_id,
+                    # small PNG: send it whole in one multipart request
+                    media_body=MediaFileUpload(
+                        thumbnail_path,
+                        mimetype="image/png",
+                        resumable=False,
+                        chunksize=-1,
+                    ),
+                ).execute(http=self._thread_http())
 
             return {
                 "success": True,
@@ -158,23 +273,91 @@ class SocialMediaPoster:
             logger.exception("YouTube upload failed")
             return {"success": False, "error": str(e)}
 
+    def _thread_http(self) -> AuthorizedHttp:
+        """Return an authorized HTTP transport owned by the calling thread."""
+        http = getattr(self._thread_local, "http", None)
+        if http is None or http.credentials is not self._yt_creds:
+            http = AuthorizedHttp(self._yt_creds, http=httplib2.Http())
+            self._thread_local.http = http
+        return http
+
+    @staticmethod
+    def _execute_upload(req, resumable: bool, http: AuthorizedHttp):
+        """Run an upload request, retrying transient failures with exponential backoff."""
+        response = None
+        retries = 0
+        while response is None:
+            error: Exception | None = None
+            try:
+                if resumable:
+                    _, response = req.next_chunk(http=http)
+                else:
+                    response = req.execute(http=http)
+            except HttpError as e:
+                if e.resp.status not in RETRIABLE_STATUS_CODES:
+                    raise
+                error = e
+            except RETRIABLE_EXCEPTIONS as e:
+                error = e
+
+            if error is not None:
+                retries += 1
+                if retries > MAX_UPLOAD_RETRIES:
+                    raise error
+                sleep_secs = min(60, 2 ** retries) + random.random()
+                logger.warning(
+                    "Retriable upload error (%d/%d), sleeping %.1fs: %s",
+                    retries, MAX_UPLOAD_RETRIES, sleep_secs, error,
+                )
+                time.sleep(sleep_secs)
+        return response
+
     def _get_authenticated_youtube_service(self):
-        creds: Optional[Credentials] = None
-        if self.youtube_token_path.exists():
-            creds = Credentials.from_authorized_user_file(str(self.youtube_token_path), SCOPES)
-            if creds and creds.expired and creds.refresh_token:
-                creds.refresh(Request())
-
-        if creds is None or not creds.valid:
-            if not self.youtube_client_secrets.exists():
-                logger.error("Missing client secret file at %s", self.youtube_client_secrets)
-                return None
-
-            flow = InstalledAppFlow.from_client_secrets_file(str(self.youtube_client_secrets), SCOPES)
-            creds = flow.run_local_server(port=0)
-            self.youtube_token_path.write_text(creds.to_json(), encoding="utf‑8")
-
-        return build("youtube", "v3", credentials=creds)
+        with self._yt_service_lock:
+            token_mtime = (
+                self.youtube_token_path.stat().st_mtime
+                if self.youtube_token_path.exists()
+                else None
+            )
+
+            # token file untouched since we last read/wrote it: keep the in-memory creds
+            if self._yt_creds is not None and token_mtime == self._token_mtime:
+                if self._yt_creds.expired and self._yt_creds.refresh_token:
+                    self._yt_creds.refresh(Request())
+                    self._save_token(self._yt_creds)
+                if self._yt_creds.valid and self._yt_service is not None:
+                    return self._yt_service
+
+            creds: Optional[Credentials] = None
+            if token_mtime is not None:
+                creds = Credentials.from_authorized_user_file(str(self.youtube_token_path), SCOPES)
+                self._token_mtime = token_mtime
+                if creds and creds.expired and creds.refresh_token:
+                    creds.refresh(Request())
+                    self._save_token(creds)
+
+            if creds is None or not creds.valid:
+                if not self.youtube_client_secrets.exists():
+                    logger.error("Missing client secret file at %s", self.youtube_client_secrets)
+                    return None
+
+                flow = InstalledAppFlow.from_client_secrets_file(str(self.youtube_client_secrets), SCOPES)
+                creds = flow.run_local_server(port=0)
+                self._save_token(creds)
+
+            self._yt_creds = creds
+            self._yt_service = build("youtube", "v3", credentials=creds, static_discovery=True)
+            return self._yt_service
+
+    def _save_token(self, creds: Credentials) -> None:
+        """Write ``creds`` to the token file unless its contents are unchanged."""
+        data = _credentials_json(creds)
+        digest = hashlib.sha256(data).hexdigest()
+        if digest == self._token_digest:
+            return
+        self.youtube_token_path.write_bytes(data)
+        self._token_digest = digest
+        self._token_mtime = self.youtube_token_path.stat().st_mtime
 
     def _post_to_tiktok(self):  # pragma: no cover – stub
         logger.info("TikTok uploading is not implemented yet.")
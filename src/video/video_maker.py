@@ -9,21 +9,276 @@ import random
 import tempfile
 import subprocess
 import json
+import hashlib
+import bisect
 from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
-from PIL import Image, ImageDraw, ImageFont
+from PIL import Image, ImageChops, ImageDraw, ImageFilter, ImageFont, ImageOps
 from io import BytesIO
 import shutil
 import re
 import sys
+import platform
+import queue
+import threading
 import unicodedata
+import requests
+from functools import lru_cache
+from itertools import accumulate
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import contextmanager
+from multiprocessing import resource_tracker, shared_memory, util as mp_util
 
 # 音声関連のユーティリティをインポート
-from video.voice_utils import generate_narration, get_audio_duration, create_silent_audio, merge_audio_files
+from video.voice_utils import generate_narration, get_audio_duration, merge_audio_files
 
 # ロガー設定
 logger = logging.getLogger(__name__)
 
+# 最終動画のフレームレートと音声サンプリングレート
+OUTPUT_FPS = 30
+AUDIO_SAMPLE_RATE = 44100
+# BGMの音量
+BGM_VOLUME = 0.25
+# FFmpegに渡すスライド・フレーム画像の拡張子
+# PNGのzlib圧縮を避け、書き込みもFFmpeg側のデコードも軽い非圧縮BMPを使う
+FRAME_EXT = ".bmp"
+# 商品名の整形用（呼び出しごとのパターン解決を避けるため事前にコンパイル）
+_BRACKETED_RE = re.compile(r"[（(＜<].*?[）)>＞>]")
+_WHITESPACE_RE = re.compile(r"\s+")
+# 読み上げ用に半角・全角スペースを取り除く変換テーブル
+_STRIP_SPACES_TABLE = str.maketrans("", "", " 　")
+# 描画済みテキスト（エフェクト込み）を保持する数
+TEXT_SPRITE_CACHE_SIZE = 64
+# テキスト幅の計測結果を保持する数
+TEXT_WIDTH_CACHE_SIZE = 8192
+# イントロスライドのキャッシュ形式のバージョン（描画内容を変えたら上げる）
+SLIDE_CACHE_VERSION = 1
+# 静止画主体の映像向けエンコード設定
+# フレーム間の差分がほぼないため最速プリセットでも画質・サイズはほとんど変わらない
+X264_STILL_ARGS = [
+    "-c:v", "libx264",
+    "-preset", "ultrafast",
+    "-tune", "stillimage",
+    "-crf", "23",
+    "-g", str(OUTPUT_FPS * 2),
+]
+# ハードウェアエンコーダ（優先順）とそれぞれの画質設定
+HW_ENCODER_ARGS = {
+    "h264_nvenc": ["-preset", "p1", "-rc", "vbr", "-cq", "23"],
+    "h264_videotoolbox": ["-q:v", "60"],
+    "h264_qsv": ["-preset", "veryfast", "-global_quality", "23"],
+}
+
+
+@lru_cache(maxsize=1)
+def _detect_hwenc() -> str:
+    """
+    利用可能なH.264ハードウェアエンコーダを検出（プロセス内で1回だけ実行）
+
+    Returns:
+        str: エンコーダ名（見つからなければ libx264）
+    """
+    try:
+        result = subprocess.run(
+            ["ffmpeg", "-hide_banner", "-encoders"],
+            stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, check=True
+        )
+    except Exception as e:
+        logger.warning(f"FFmpegエンコーダ一覧の取得に失敗: {e}")
+        return "libx264"
+
+    for encoder in HW_ENCODER_ARGS:
+        if encoder not in result.stdout:
+            continue
+        # ビルドに含まれていてもデバイスがなければ使えないため、短い試験エンコードで確認
+        probe_cmd = [
+            "ffmpeg", "-hide_banner", "-y",
+            "-f", "lavfi", "-i", "color=size=256x256:duration=0.1",
+            "-c:v", encoder,
+            "-f", "null", "-"
+        ]
+        if subprocess.run(probe_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE).returncode == 0:
+            logger.info(f"ハードウェアエンコーダを使用します: {encoder}")
+            return encoder
+
+    return "libx264"
+
+# 合成済みの共通背景（(画像パス, 更新時刻, 幅, 高さ) をキーとしてプロセス内で共有）
+_BACKGROUND_CACHE: Dict[Tuple[str, Optional[float], int, int], Image.Image] = {}
+
+# スライド描画ワーカープロセスで使い回すVideoMaker
+_worker_maker: Optional["VideoMaker"] = None
+# ワーカープロセスが参照している共通背景の共有メモリ（背景画像が参照している間は保持する）
+_worker_background_shm: Optional[shared_memory.SharedMemory] = None
+# 共有メモリを参照している背景画像のキャッシュキー
+_worker_background_key: Optional[Tuple[str, Optional[float], int, int]] = None
+
+
+def _attach_shared_memory(name: str) -> shared_memory.SharedMemory:
+    """
+    親プロセスが作成した共有メモリに resource_tracker へ登録せずに接続する
+    （登録・解放は作成した親プロセスだけが行う）
+
+    Python 3.12 以前は接続しただけで resource_tracker に登録され、track=False も
+    指定できない。ワーカー側で unregister すると親と共有している登録まで消えるため、
+    接続中だけ登録処理を無効にする
+
+    Args:
+        name: 共有メモリ名
+
+    Returns:
+        shared_memory.SharedMemory: 接続した共有メモリ
+    """
+    if sys.version_info >= (3, 13):
+        return shared_memory.SharedMemory(name=name, track=False)
+    register = resource_tracker.register
+    resource_tracker.register = lambda name, rtype: None
+    try:
+        return shared_memory.SharedMemory(name=name)
+    finally:
+        resource_tracker.register = register
+
+
+def _release_worker_background() -> None:
+    """
+    ワーカー終了時に共有メモリ上の背景画像を解放してから共有メモリを閉じる
+    （画像がバッファを参照したままだと close() が BufferError になる）
+    """
+    global _worker_background_shm
+    if _worker_background_shm is None:
+        return
+    background = _BACKGROUND_CACHE.pop(_worker_background_key, None)
+    if background is not None:
+        background.close()
+    try:
+        _worker_background_shm.close()
+    except BufferError as e:
+        logger.debug(f"背景用の共有メモリを閉じられません: {e}")
+    _worker_background_shm = None
+
+
+def _init_render_worker(
+    init_kwargs: Dict[str, Any],
+    shared_background: Optional[Tuple[str, Tuple[str, Optional[float], int, int]]] = None,
+    product_images: Optional[Dict[str, Image.Image]] = None
+) -> None:
+    """
+    スライド描画ワーカーの初期化（プロセスごとに1回）
+
+    Args:
+        init_kwargs: VideoMaker の初期化引数（検出済みのエンコーダを含む）
+        shared_background: 共通背景を置いた共有メモリ名と背景キャッシュのキー
+        product_images: 親プロセスで読み込み・リサイズ済みの商品画像
+    """
+    global _worker_maker, _worker_background_shm, _worker_background_key
+    if shared_background:
+        name, key = shared_background
+        try:
+            # 背景画像を読み込み直さず、共有メモリをコピーせずにそのまま参照する
+            _worker_background_shm = _attach_shared_memory(name)
+            _worker_background_key = key
+            _BACKGROUND_CACHE[key] = Image.frombuffer(
+                "RGBA", key[2:], _worker_background_shm.buf, "raw", "RGBA", 0, 1
+            )
+            # fork したワーカーは atexit を実行せずに終了するため、multiprocessing の終了処理に登録する
+            mp_util.Finalize(None, _release_worker_background, exitpriority=0)
+        except Exception as e:
+            logger.warning(f"共有メモリの背景を利用できません: {e}")
+    _worker_maker = VideoMaker(**init_kwargs)
+    if product_images:
+        _worker_maker._product_images.update(product_images)
+
+
+def _render_slide(method: str, args: tuple, kwargs: Dict[str, Any], output_path: str) -> str:
+    """
+    ワーカープロセスでスライドを描画して保存
+
+    Args:
+        method: VideoMaker のスライド作成メソッド名
+        args: メソッドの位置引数
+        kwargs: メソッドのキーワード引数
+        output_path: 保存先のパス
+
+    Returns:
+        str: 保存したスライドのパス
+    """
+    # 書きかけのファイルがキャッシュとして使われないよう、一時ファイル経由で置き換える
+    root, ext = os.path.splitext(output_path)
+    tmp_path = f"{root}.{os.getpid()}.tmp{ext}"
+    getattr(_worker_maker, method)(*args, **kwargs).save(tmp_path)
+    os.replace(tmp_path, output_path)
+    return output_path
+
+
+def _render_product_animation(args: tuple, kwargs: Dict[str, Any]) -> bool:
+    """ワーカープロセスで商品アニメーション動画を作成"""
+    return _worker_maker._create_product_animation(*args, **kwargs)
+
+
+def _render_comment_slides(
+    base_args: tuple,
+    base_kwargs: Dict[str, Any],
+    base_slide_path: str,
+    rank: int,
+    reviews: List[str],
+    output_dir: str
+) -> List[Optional[str]]:
+    """
+    ワーカープロセスでコメント付きスライドを描画して保存
+    ベーススライドがキャッシュになければ先に描画して保存する
+
+    Returns:
+        List[Optional[str]]: コメントごとのスライドのパス（空のコメントはNone）
+    """
+    if not os.path.exists(base_slide_path):
+        _render_slide("_create_product_slide", base_args, base_kwargs, base_slide_path)
+    return _worker_maker._create_comment_slides(base_slide_path, rank, reviews, output_dir)
+
+
+def _dilate_mask(mask: Image.Image, radius: int) -> Image.Image:
+    """
+    マスクを正方形 (2*radius+1) の範囲で膨張させる（MaxFilter と同じ結果）
+    横方向と縦方向に分けてずらした画像の最大値を取るので、計算量は半径に比例する
+
+    Args:
+        mask: Lモードのマスク
+        radius: 膨張させる半径（ピクセル）
+
+    Returns:
+        Image.Image: 膨張後のマスク
+    """
+    for horizontal in (True, False):
+        source = mask
+        for step in range(1, radius + 1):
+            for shift in (step, -step):
+                # 画像端で折り返さないよう、黒地に貼り付けてずらす
+                shifted = Image.new("L", source.size, 0)
+                shifted.paste(source, (shift, 0) if horizontal else (0, shift))
+                mask = ImageChops.lighter(mask, shifted)
+    return mask
+
+
+# 幅計測用のフォント（lru_cache のキーにはハッシュ可能な (パス, サイズ) を使い、実体はここから引く）
+_MEASURE_FONTS: Dict[Tuple[str, int], ImageFont.FreeTypeFont] = {}
+
+
+@lru_cache(maxsize=TEXT_WIDTH_CACHE_SIZE)
+def _measure_text_width(font_key: Tuple[str, int], text: str) -> int:
+    """
+    テキスト幅を計測（同じフォント・文字列の結果は使い回す）
+
+    Args:
+        font_key: _MEASURE_FONTS に登録したフォントのキー
+        text: テキスト
+
+    Returns:
+        int: テキストの幅（ピクセル）
+    """
+    return int(_MEASURE_FONTS[font_key].getlength(text))
+
+
 class VideoMaker:
     """FFmpegを使用して縦型商品紹介動画を作成するクラス"""
     
@@ -52,6 +307,12 @@ class VideoMaker:
 
     YASASHISA_GOTHIC = "data/assets/やさしさゴシック.ttf"
 
+    # イントロスライドの装飾画像と配置
+    INTRO_DECORATION_IMAGES = [
+        ("data/assets/atsugesyou.png", "left"),   # 左下
+        ("data/assets/building_medical_pharmacy.png", "right"),  # 右下
+    ]
+
     COMMENT_COLORS = [
         (0xFF, 0x4E, 0x45),   # 赤  (#ff4e45)
         (0x45, 0xFF, 0x86),   # 緑  (#45ff86)
@@ -69,7 +330,8 @@ class VideoMaker:
         output_dir: str = 'data/output',
         temp_dir: str = 'data/temp',
         font_path: Optional[str] = None,
-        bgm_dir: str = 'data/bgm'
+        bgm_dir: str = 'data/bgm',
+        vcodec: Optional[str] = None
     ):
         """
         初期化
@@ -79,11 +341,19 @@ class VideoMaker:
             temp_dir: 一時ファイルディレクトリ
             font_path: フォントファイルのパス
             bgm_dir: BGM用音声ファイルディレクトリ
+            vcodec: 映像エンコーダ（省略時は利用可能なものを検出）
         """
         self.output_dir = output_dir
         self.temp_dir = temp_dir
         self.font_path = font_path
         self.bgm_dir = bgm_dir
+        # スライド描画ワーカーで同じ設定のインスタンスを作るための引数
+        self._init_kwargs = {
+            "output_dir": output_dir,
+            "temp_dir": temp_dir,
+            "font_path": font_path,
+            "bgm_dir": bgm_dir,
+        }
         
         # ディレクトリ作成
         os.makedirs(output_dir, exist_ok=True)
@@ -92,7 +362,6 @@ class VideoMaker:
         # フォントファイルが指定されていない場合は、デフォルトを使用
         if not self.font_path:
             # デフォルトフォントの設定（OSによって異なる）
-            import platform
             system = platform.system()
 
             if system == 'Darwin':  # macOS
@@ -109,6 +378,34 @@ class VideoMaker:
             logger.warning(f"指定したフォント({self.font_path})が見つかりません。代替フォントを使用します。")
             self.font_path = None
 
+        # Noto Sans JP Bold の有無は起動時に1回だけ確認
+        self._has_noto_sans_jp_bold = os.path.exists(getattr(self, 'noto_sans_jp_bold_path', '') or '')
+
+        # 読み込み・リサイズ済みの商品画像（商品IDをキーとする）
+        self._product_images: Dict[str, Image.Image] = {}
+
+        # 描画済みテキストの切り抜き画像と貼り付け位置（LRU）
+        self._text_sprite_cache: OrderedDict = OrderedDict()
+
+        # 読み込み済みフォント（(フォントパス, サイズ) をキーとする）
+        self._font_cache: Dict[Tuple[Optional[str], int], ImageFont.FreeTypeFont] = {}
+
+        # 映像エンコーダ（ハードウェアエンコーダがあれば優先）
+        self.vcodec = vcodec or _detect_hwenc()
+        # spawn で起動したワーカーでも試験エンコードをやり直さないよう、検出結果を引き継ぐ
+        self._init_kwargs["vcodec"] = self.vcodec
+
+    def _video_codec_args(self) -> List[str]:
+        """
+        映像エンコード用のFFmpeg引数を取得
+
+        Returns:
+            List[str]: -c:v と画質・GOP設定
+        """
+        if self.vcodec in HW_ENCODER_ARGS:
+            return ["-c:v", self.vcodec, *HW_ENCODER_ARGS[self.vcodec], "-g", str(OUTPUT_FPS * 2)]
+        return X264_STILL_ARGS
+
     def _draw_text_italic(
         self,
         base: Image.Image,
@@ -118,32 +415,59 @@ class VideoMaker:
         **kw,
     ) -> None:
         """ draw_text_effect → X 方向シアーで疑似イタリック """
+        self._draw_text_italic_lines(base, [(text, y, font)], **kw)
 
-        xmin, ymin, xmax, ymax = font.getbbox(text)
-        w = xmax - xmin
-        h = ymax - ymin
-        shear = 0.15                 # 傾き tanθ
-        # 変形後の幅
-        w_after = w + shear * h
-        # 変形後の左端を画面中央に合わせたい
-        left_after = (self.VIDEO_WIDTH - w_after) // 2
-        # 変形で x′ = x + shear·Y になるので、描画時に −shear·y を先に引く
-        x = int(left_after - shear * y) + 300
+    def _draw_text_italic_lines(
+        self,
+        base: Image.Image,
+        lines: list[tuple[str, int, ImageFont.FreeTypeFont]],
+        **kw,
+    ) -> None:
+        """
+        同じ効果の疑似イタリック行を1枚のレイヤーにまとめて描画し、
+        シアー変形と合成をまとめて1回で行う
 
+        Args:
+            base: 描画先の画像
+            lines: (テキスト, 文字の上端のY座標, フォント) のリスト
+            **kw: draw_text_effect に渡す効果の指定
+        """
+        shear = 0.15                 # 傾き tanθ
         tmp = Image.new("RGBA", (self.VIDEO_WIDTH+70, base.height), (0, 0, 0, 0))
-        self.draw_text_effect(tmp, text, (x, y), font, **kw)
 
-        # 4) X 方向にシアー
-        tmp = tmp.transform(
-            tmp.size,
+        for text, y, font in lines:
+            xmin, ymin, xmax, ymax = font.getbbox(text)
+            w = xmax - xmin
+            h = ymax - ymin
+            # 変形後の幅
+            w_after = w + shear * h
+            # 変形後の左端を画面中央に合わせたい
+            left_after = (self.VIDEO_WIDTH - w_after) // 2
+            # 変形で x′ = x + shear·Y になるので、描画時に −shear·y を先に引く
+            x = int(left_after - shear * y) + 300
+
+            self.draw_text_effect(tmp, text, (x, y), font, **kw)
+
+        # 描画された範囲だけを切り出して変形する（全画面のリサンプルを避ける）
+        bbox = tmp.getbbox()
+        if not bbox:
+            return
+        left, top, right, bottom = bbox
+        # 変形後の範囲：行ごとに x が −shear·y ずれる
+        out_left = max(0, int(left - shear * bottom))
+        out_right = int(right - shear * top) + 1
+
+        # 4) X 方向にシアー（切り出した範囲の座標系に合わせて平行移動分を加える）
+        sheared = tmp.crop(bbox).transform(
+            (out_right - out_left, bottom - top),
             Image.AFFINE,
-            (1, shear, 0,   0, 1, 0),          # [[1, shear, 0], [0, 1, 0]]
+            (1, shear, out_left + shear * top - left,   0, 1, 0),
             resample=Image.BICUBIC,
             fillcolor=(0, 0, 0, 0),
         )
 
         # 5) 合成
-        base.alpha_composite(tmp)
+        base.alpha_composite(sheared, dest=(out_left, top))
 
     def draw_text_effect(
         self,
@@ -168,22 +492,119 @@ class VideoMaker:
         - グラデはマスク描画
         - グローは blur
         - ベベルは上下 1px シフト描画
+        同じ文字列・位置・フォント・効果の組み合わせは描画結果を使い回す
+        """
+        cache_key = (
+            text, tuple(xy), base.size,
+            getattr(font, "path", None), getattr(font, "size", None), getattr(font, "index", 0),
+            fill, stroke_width, stroke_fill, inner_stroke_width, inner_stroke_fill,
+            tuple(gradient) if gradient else None, glow_radius, glow_opacity, bevel
+        )
+        cached = self._text_sprite_cache.get(cache_key)
+        if cached is None:
+            # 全画面ではなく、文字の範囲（ストローク・グロー分の余白込み）だけの透明レイヤーに描画する
+            region = self._text_effect_region(
+                base.size, text, xy, font,
+                stroke_width + (inner_stroke_width or 0) + glow_radius * 3 + 2
+            )
+            left, top, right, bottom = region
+            if right <= left or bottom <= top:
+                cached = (None, None)
+            else:
+                layer = Image.new("RGBA", (right - left, bottom - top), (0, 0, 0, 0))
+                self._render_text_effect(
+                    layer, text, (xy[0] - left, xy[1] - top), font,
+                    fill=fill,
+                    stroke_width=stroke_width, stroke_fill=stroke_fill,
+                    inner_stroke_width=inner_stroke_width, inner_stroke_fill=inner_stroke_fill,
+                    gradient=gradient,
+                    glow_radius=glow_radius, glow_opacity=glow_opacity,
+                    bevel=bevel,
+                    gradient_span=(top, base.height)
+                )
+                # 描画範囲だけを切り出して保持
+                bbox = layer.getbbox()
+                cached = (layer.crop(bbox), (left + bbox[0], top + bbox[1])) if bbox else (None, None)
+            self._text_sprite_cache[cache_key] = cached
+            if len(self._text_sprite_cache) > TEXT_SPRITE_CACHE_SIZE:
+                self._text_sprite_cache.popitem(last=False)
+        else:
+            self._text_sprite_cache.move_to_end(cache_key)
+
+        sprite, offset = cached
+        if sprite is not None:
+            if base.mode == "RGB":
+                # 不透明な背景へはアルファをマスクにした貼り付けで合成と同じ結果になる
+                base.paste(sprite, offset, sprite)
+            else:
+                base.alpha_composite(sprite, dest=offset)
+
+    @staticmethod
+    def _text_effect_region(
+        size: Tuple[int, int],
+        text: str,
+        xy: tuple[int, int],
+        font: ImageFont.FreeTypeFont,
+        margin: int
+    ) -> Tuple[int, int, int, int]:
+        """
+        テキスト効果の描画に必要な範囲（画面内に収めた left, top, right, bottom）を求める
+
+        Args:
+            size: 描画先の画像サイズ
+            text: テキスト
+            xy: 描画位置
+            font: フォント
+            margin: ストロークやグローのために文字の外側へ広げる幅
+
+        Returns:
+            Tuple[int, int, int, int]: 描画範囲
+        """
+        # 文字の外形が取れない場合（複数行や古いフォント）は画面全体
+        if "\n" in text or not hasattr(font, "getbbox"):
+            return (0, 0, size[0], size[1])
+        left, top, right, bottom = font.getbbox(text)
+        return (
+            max(0, xy[0] + left - margin),
+            max(0, xy[1] + top - margin),
+            min(size[0], xy[0] + right + margin),
+            min(size[1], xy[1] + bottom + margin),
+        )
+
+    def _render_text_effect(
+        self,
+        base: Image.Image,
+        text: str,
+        xy: tuple[int, int],
+        font: ImageFont.FreeTypeFont,
+        *,
+        fill: tuple[int, int, int] = (255, 255, 255),
+        stroke_width: int = 0,
+        stroke_fill: tuple[int, int, int] | None = None,
+        inner_stroke_width: int | None = None,
+        inner_stroke_fill: tuple[int, int, int] | None = None,
+        gradient: list[tuple[int, int, int]] | None = None,
+        glow_radius: int = 0,
+        glow_opacity: float = 0.3,
+        bevel: bool = False,
+        gradient_span: Optional[Tuple[int, int]] = None
+    ) -> None:
+        """
+        draw_text_effect の実際の描画処理（キャッシュなし）
+        gradient_span は (このレイヤーの上端のY座標, 画面全体の高さ) で、
+        画面の一部だけを描画する場合もグラデーションを画面全体の位置に合わせる
         """
         # if gradient:
         #     logger.info(f"Applying gradient with colors: {gradient}")
         # else:
         #     logger.info(f"Using solid fill: {fill}")
-        from PIL import ImageFilter, ImageChops
-
         txt_layer = Image.new("RGBA", base.size, (0, 0, 0, 0))
         d = ImageDraw.Draw(txt_layer)
 
-        # 外側ストローク
+        # 外側ストローク（FreeTypeのストローク描画で1回にまとめる）
         if stroke_width and stroke_fill:
-            for dx in range(-stroke_width, stroke_width + 1):
-                for dy in range(-stroke_width, stroke_width + 1):
-                    if dx*dx + dy*dy <= stroke_width*stroke_width:
-                        d.text((xy[0] + dx, xy[1] + dy), text, font=font, fill=stroke_fill)
+            d.text(xy, text, font=font, fill=stroke_fill,
+                   stroke_width=stroke_width, stroke_fill=stroke_fill)
 
         # 内側ストローク（Photoshop の「線‑内側」っぽく見せるため、少し縮小したマスクを使う）
         if inner_stroke_width and inner_stroke_fill:
@@ -191,7 +612,7 @@ class VideoMaker:
             mdraw = ImageDraw.Draw(mask)
             mdraw.text(xy, text, font=font, fill=255)
             # マスクを縮小して内側分を確保
-            mask = mask.filter(ImageFilter.MaxFilter(inner_stroke_width*2+1))
+            mask = _dilate_mask(mask, inner_stroke_width)
             ishape = Image.new("RGBA", base.size, (*inner_stroke_fill, 255))
             txt_layer = Image.composite(ishape, txt_layer, mask)
 
@@ -202,36 +623,26 @@ class VideoMaker:
             mdraw = ImageDraw.Draw(mask)
             mdraw.text(xy, text, font=font, fill=255)
             
-            # グラデーションのための修正：RGBモードの画像を準備
-            top, *mid, bottom = gradient
-            grad = Image.new("RGB", (base.width, base.height), color=0)
-            
-            # 垂直グラデーションを描画
-            for y in range(grad.height):
-                ratio = y / (grad.height - 1) if grad.height > 1 else 0
-                c1, c2 = top, bottom
-                color = tuple(int(c1[i] + (c2[i]-c1[i])*ratio) for i in range(3))
-                ImageDraw.Draw(grad).line((0, y, grad.width, y), fill=color)
-            
-            # グラデーションをRGBAに変換
-            grad_rgba = grad.convert("RGBA")
-            
-            # マスクを使用してグラデーションテキストを作成 - 修正ポイント
-            gradient_text = Image.new("RGBA", base.size, (0, 0, 0, 0))
-            
-            # 修正：ImageChops.multiplyを使用して、マスクとグラデーションを正しく組み合わせる
-            mask_rgba = Image.new("RGBA", base.size, (0, 0, 0, 0))
-            mask_rgba.putalpha(mask)
-            
-            # グラデーションをマスクに適用（新しいアプローチ）
-            for y in range(base.size[1]):
-                for x in range(base.size[0]):
-                    if mask.getpixel((x, y)) > 0:  # マスクが非ゼロの場合
-                        r, g, b, _ = grad_rgba.getpixel((x, y))
-                        gradient_text.putpixel((x, y), (r, g, b, mask.getpixel((x, y))))
-            
-            # 修正：グラデーションテキストをtxt_layerに合成
-            txt_layer = Image.alpha_composite(txt_layer, gradient_text)
+            # グラデーションは文字のある範囲だけに作る
+            bbox = mask.getbbox()
+            if bbox:
+                left, top_y, right, bottom_y = bbox
+                # 垂直グラデーション：1px幅の列を作って横に引き伸ばす（各行の色はどの列も同じ）
+                top, *mid, bottom = gradient
+                offset_y, full_height = gradient_span or (0, base.height)
+                column = bytearray()
+                for y in range(offset_y + top_y, offset_y + bottom_y):
+                    ratio = y / (full_height - 1) if full_height > 1 else 0
+                    column.extend(int(top[i] + (bottom[i] - top[i]) * ratio) for i in range(3))
+                grad = Image.frombytes("RGB", (1, bottom_y - top_y), bytes(column))
+                grad = grad.resize((right - left, bottom_y - top_y), Image.NEAREST)
+
+                # テキストマスクをそのままアルファにしてグラデーションテキストを作成
+                gradient_text = grad.convert("RGBA")
+                gradient_text.putalpha(mask.crop(bbox))
+
+                # グラデーションテキストをtxt_layerの該当範囲に合成
+                txt_layer.alpha_composite(gradient_text, dest=(left, top_y))
             # logging.info("gradientを適応しました")
         else:
             d.text(xy, text, font=font, fill=fill)
@@ -249,11 +660,19 @@ class VideoMaker:
 
         # 外側グロー
         if glow_radius:
-            glow = txt_layer.split()[-1].filter(ImageFilter.GaussianBlur(glow_radius))
-            glow = ImageChops.multiply(glow, Image.new("L", glow.size, int(255*glow_opacity)))
-            glow_layer = Image.new("RGBA", base.size, (0, 0, 0, 0))
-            glow_layer.putalpha(glow)
-            base.alpha_composite(glow_layer)
+            # ぼかしは文字の範囲（ぼかしの広がり分を含む）だけに行う
+            bbox = txt_layer.getbbox()
+            if bbox:
+                pad = glow_radius * 3
+                bbox = (
+                    max(0, bbox[0] - pad), max(0, bbox[1] - pad),
+                    min(base.width, bbox[2] + pad), min(base.height, bbox[3] + pad)
+                )
+                glow = txt_layer.crop(bbox).getchannel("A").filter(ImageFilter.GaussianBlur(glow_radius))
+                # 黒を不透明度 glow_opacity でぼかしたアルファの形に塗る
+                glow_layer = Image.new("RGBA", glow.size, (0, 0, 0, 0))
+                glow_layer.paste((0, 0, 0, int(255*glow_opacity)), (0, 0, *glow.size), glow)
+                base.alpha_composite(glow_layer, dest=bbox[:2])
 
         base.alpha_composite(txt_layer)
 
@@ -270,10 +689,10 @@ class VideoMaker:
             return ["No Name"]
 
         # ① ()<> を削除（全角・半角両対応）
-        raw = re.sub(r"[（(＜<].*?[）)>＞>]", "", raw)
+        raw = _BRACKETED_RE.sub("", raw)
 
         # ② スペース正規化
-        raw = re.sub(r"\s+", " ", raw.replace("　", " ")).strip()
+        raw = _WHITESPACE_RE.sub(" ", raw.replace("　", " ")).strip()
         if not raw:
             return ["No Name"]
         
@@ -295,7 +714,7 @@ class VideoMaker:
             raw = raw.replace(brand_name, "")
             
         # 最終的な正規化（二重スペースなどの修正）
-        raw = re.sub(r"\s+", " ", raw).strip()
+        raw = _WHITESPACE_RE.sub(" ", raw).strip()
         if not raw:
             return ["No Name"]
 
@@ -367,6 +786,24 @@ class VideoMaker:
         """
         適切なフォントを取得
         
+        Args:
+            size: フォントサイズ
+            font_path: フォントパス
+            
+        Returns:
+            ImageFont.FreeTypeFont: フォントオブジェクト
+        """
+        key = (font_path, int(size))
+        font = self._font_cache.get(key)
+        if font is None:
+            font = self._load_font(int(size), font_path)
+            self._font_cache[key] = font
+        return font
+
+    def _load_font(self, size: int, font_path: str = None) -> ImageFont.FreeTypeFont:
+        """
+        フォントファイルを読み込む（get_font のキャッシュミス時に呼ばれる）
+        
         Args:
             size: フォントサイズ
             font_path: フォントパス
@@ -382,7 +819,7 @@ class VideoMaker:
                 logger.warning(f"指定されたフォントを読み込めませんでした: {font_path} - {e}")
         
         # Noto Sans JP Bold を試行
-        if hasattr(self, 'noto_sans_jp_bold_path') and os.path.exists(self.noto_sans_jp_bold_path):
+        if self._has_noto_sans_jp_bold:
             try:
                 font = ImageFont.truetype(self.noto_sans_jp_bold_path, size)
                 return font
@@ -424,25 +861,117 @@ class VideoMaker:
         共通背景を取得して返す。
         ・読み込み失敗時は単色 (BG_COLOR) で代替
         毎回ディスク I/O しないように 1 度だけ読み込んでキャッシュする
+        （プロセス内の全インスタンスで共有し、合成済みの背景は一時ディレクトリにも保存する）
         """
         if not hasattr(self, "_cached_bg"):
-            try:
-                if os.path.exists(self.BACKGROUND_IMAGE_PATH):
-                    bg = Image.open(self.BACKGROUND_IMAGE_PATH).convert("RGBA")
-                    bg = self.resize_image_to_fill(bg, self.VIDEO_WIDTH, self.VIDEO_HEIGHT)
-                else:
-                    raise FileNotFoundError("背景画像が見つかりません")
-            except Exception as e:
-                logger.warning(f"背景画像の読み込みに失敗: {e}")
-                bg = Image.new("RGBA", (self.VIDEO_WIDTH, self.VIDEO_HEIGHT),
-                            (*self.BG_COLOR, 255))
-            # 読みやすさ確保のために暗色オーバーレイを被せる
-            overlay = Image.new("RGBA", bg.size, (15, 15, 35, 180))
-            bg.alpha_composite(overlay)
+            key = self._background_key()
+            bg = _BACKGROUND_CACHE.get(key)
+            if bg is None:
+                bg = self._load_common_background(key[1])
+                _BACKGROUND_CACHE[key] = bg
             self._cached_bg = bg
         # 呼び出し側で書き換えないようコピーを返す
         return self._cached_bg.copy()
-    
+
+    def _get_common_background_rgb(self) -> Image.Image:
+        """
+        共通背景をRGBで取得して返す（アルファを使わないスライド用）
+        RGBへの変換は1度だけ行い、以降はコピーを返す
+        """
+        if not hasattr(self, "_cached_bg_rgb"):
+            self._get_common_background()
+            self._cached_bg_rgb = self._cached_bg.convert("RGB")
+        # 呼び出し側で書き換えないようコピーを返す
+        return self._cached_bg_rgb.copy()
+
+    def _background_key(self) -> Tuple[str, Optional[float], int, int]:
+        """
+        共通背景のキャッシュキー（画像パス, 更新時刻, 幅, 高さ）を取得
+
+        Returns:
+            Tuple[str, Optional[float], int, int]: キャッシュキー
+        """
+        try:
+            mtime = os.path.getmtime(self.BACKGROUND_IMAGE_PATH)
+        except OSError:
+            mtime = None
+        return (self.BACKGROUND_IMAGE_PATH, mtime, self.VIDEO_WIDTH, self.VIDEO_HEIGHT)
+
+    @contextmanager
+    def _shared_common_background(self):
+        """
+        合成済みの共通背景を共有メモリに置き、スライド描画ワーカーが
+        背景画像のデコードやオーバーレイ合成をやり直さずに使えるようにする
+        （with を抜けると共有メモリを解放する）
+
+        Yields:
+            (共有メモリ名, 背景キャッシュのキー)、共有できなかった場合はNone
+        """
+        self._get_common_background()
+        key = self._background_key()
+        data = self._cached_bg.tobytes()
+        try:
+            shm = shared_memory.SharedMemory(create=True, size=len(data))
+        except Exception as e:
+            logger.warning(f"背景用の共有メモリを作成できません: {e}")
+            yield None
+            return
+        try:
+            shm.buf[:len(data)] = data
+            yield (shm.name, key)
+        finally:
+            shm.close()
+            shm.unlink()
+
+    def _load_common_background(self, mtime: Optional[float]) -> Image.Image:
+        """
+        背景画像を読み込み、リサイズと暗色オーバーレイの合成を行う
+
+        Args:
+            mtime: 背景画像の更新時刻（存在しない場合はNone）
+
+        Returns:
+            Image.Image: 合成済みの背景（RGBA）
+        """
+        overlay_color = (15, 15, 35, 180)
+        if mtime is None:
+            logger.warning("背景画像の読み込みに失敗: 背景画像が見つかりません")
+            # 単色背景にオーバーレイを重ねた結果も単色なので、合成せずに色を直接計算
+            alpha = overlay_color[3] / 255
+            color = tuple(
+                round(overlay_color[i] * alpha + self.BG_COLOR[i] * (1 - alpha))
+                for i in range(3)
+            )
+            return Image.new("RGBA", (self.VIDEO_WIDTH, self.VIDEO_HEIGHT), (*color, 255))
+
+        # 合成済みの背景があれば再利用（ワーカープロセスや再実行時のデコード・リサイズを省く）
+        cache_path = os.path.join(
+            self.temp_dir, f"_background_{int(mtime)}_{self.VIDEO_WIDTH}x{self.VIDEO_HEIGHT}.png"
+        )
+        if os.path.exists(cache_path):
+            try:
+                return Image.open(cache_path).convert("RGBA")
+            except Exception as e:
+                logger.warning(f"合成済み背景の読み込みに失敗: {cache_path} - {e}")
+
+        try:
+            bg = Image.open(self.BACKGROUND_IMAGE_PATH).convert("RGBA")
+            bg = self.resize_image_to_fill(bg, self.VIDEO_WIDTH, self.VIDEO_HEIGHT)
+        except Exception as e:
+            logger.warning(f"背景画像の読み込みに失敗: {e}")
+            bg = Image.new("RGBA", (self.VIDEO_WIDTH, self.VIDEO_HEIGHT),
+                        (*self.BG_COLOR, 255))
+        # 読みやすさ確保のために暗色オーバーレイを被せる
+        overlay = Image.new("RGBA", bg.size, overlay_color)
+        bg.alpha_composite(overlay)
+
+        try:
+            # 読み込み速度を優先して圧縮は最小限に
+            bg.save(cache_path, compress_level=1)
+        except Exception as e:
+            logger.warning(f"合成済み背景の保存に失敗: {cache_path} - {e}")
+        return bg
+
     def apply_text_outline(
         self, 
         draw: ImageDraw.Draw, 
@@ -467,16 +996,29 @@ class VideoMaker:
             outline_color: 縁取り色 (R, G, B)
             outline_width: 縁取り幅
         """
-        if outline_color is None:
+        # 縁取りなし（色の指定がない、または幅が0以下）なら本体だけ描く
+        if outline_color is None or outline_width <= 0:
             draw.text((x, y), text, font=font, fill=text_color)
             return
 
-        step_size = max(1, outline_width // 10)
-        
-        for offset_x in range(-outline_width, outline_width + 1, step_size):
-            for offset_y in range(-outline_width, outline_width + 1, step_size):
-                if abs(offset_x) + abs(offset_y) <= outline_width * 1.5:  # 縁取りの形状を調整
-                    draw.text((x + offset_x, y + offset_y), text, font=font, fill=outline_color)
+        # FreeTypeのストローク描画で縁取りと本体を1回で描く
+        try:
+            draw.text(
+                (x, y), text, font=font, fill=text_color,
+                stroke_width=outline_width, stroke_fill=outline_color
+            )
+            return
+        except TypeError:
+            # stroke_width 非対応の古いPILバージョン用
+            pass
+
+        # 古いPILでも文字の描画は1回だけにし、縁取りはマスクの膨張で作る
+        # （ずらしながら何度も描画するPythonループを避ける）
+        text_w, text_h = font.getsize(text)
+        glyph_mask = Image.new("L", (text_w + outline_width * 2, text_h + outline_width * 2), 0)
+        ImageDraw.Draw(glyph_mask).text((outline_width, outline_width), text, font=font, fill=255)
+        outline_mask = _dilate_mask(glyph_mask, outline_width)
+        draw.bitmap((x - outline_width, y - outline_width), outline_mask, fill=outline_color)
         
         # メインテキストを描画
         draw.text((x, y), text, font=font, fill=text_color)
@@ -502,7 +1044,7 @@ class VideoMaker:
         self, 
         text: str, 
         font: ImageFont.FreeTypeFont, 
-        draw: ImageDraw.Draw
+        draw: Optional[ImageDraw.Draw] = None
     ) -> int:
         """
         テキストの幅を計算
@@ -510,29 +1052,32 @@ class VideoMaker:
         Args:
             text: テキスト
             font: フォント
-            draw: ImageDrawオブジェクト
+            draw: ImageDrawオブジェクト（古いPILでのみ使用、省略可）
             
         Returns:
             int: テキストの幅（ピクセル）
         """
-        try:
-            width = draw.textlength(text, font=font)
-            return width
-        except AttributeError:
-            # 古いPILバージョン用
-            try:
-                width = font.getlength(text)
-                return width
-            except AttributeError:
-                # さらに古いバージョン用
-                width, _ = draw.textsize(text, font=font)
-                return width
+        # ImageDraw を経由せずフォントから直接幅を取得する
+        if hasattr(font, 'getlength'):
+            font_path = getattr(font, 'path', None)
+            if not font_path:
+                return int(font.getlength(text))
+            # 同じフォント・文字列の幅は動画をまたいで使い回す（件数上限つき）
+            font_key = (font_path, font.size)
+            _MEASURE_FONTS.setdefault(font_key, font)
+            return _measure_text_width(font_key, text)
+
+        # 古いPILバージョン用
+        if draw is None:
+            draw = ImageDraw.Draw(Image.new("L", (1, 1)))
+        return draw.textsize(text, font=font)[0]
     
     def resize_image_to_fill(
         self, 
         img: Image.Image, 
         width: int, 
-        height: int
+        height: int,
+        resample: int = Image.BILINEAR
     ) -> Image.Image:
         """
         画像をリサイズして指定サイズを満たすようにする
@@ -541,6 +1086,7 @@ class VideoMaker:
             img: 元の画像
             width: 目標幅
             height: 目標高さ
+            resample: リサンプリングフィルタ（背景はオーバーレイで暗くするため既定は BILINEAR）
             
         Returns:
             Image.Image: リサイズされた画像
@@ -553,45 +1099,26 @@ class VideoMaker:
             # 画面の70%の幅に拡大
             target_width = int(self.VIDEO_WIDTH * 0.7)
             target_height = int(target_width * img_height / img_width)
-            return img.resize((target_width, target_height), Image.LANCZOS)
+            return img.resize((target_width, target_height), resample)
         
         # 通常の画像処理
-        img_aspect = img_width / img_height
-        frame_aspect = width / height
-        
-        if img_aspect > frame_aspect:
-            # 画像が横長の場合、中央から切り抜く
-            new_width = int(img_height * frame_aspect)
-            left = (img_width - new_width) // 2
-            img = img.crop((left, 0, left + new_width, img_height))
-        elif img_aspect < frame_aspect:
-            # 画像が縦長の場合、上部から切り抜く
-            new_height = int(img_width / frame_aspect)
-            top = 0  # 上詰め
-            img = img.crop((0, top, img_width, top + new_height))
-        
-        # 目標サイズにリサイズ
-        return img.resize((width, height), Image.LANCZOS)
+        # 横長なら左右中央、縦長なら上詰めで切り抜き、切り抜きとリサイズを1回の処理で行う
+        return ImageOps.fit(img, (width, height), resample, centering=(0.5, 0.0))
     
-    def _create_product_slide(
-        self,
-        product: Dict[str, Any],
-        rank: int,
-        brand_name: str,
-        show_name: bool = True,
-    ) -> Image.Image:
+    def _load_product_image(self, product: Dict[str, Any]) -> Optional[Image.Image]:
         """
-        製品スライドの作成（画像と商品名のみ表示）
+        商品画像を読み込み、スライド用のサイズにリサイズして返す
+        同じ商品の画像は1回だけデコード・リサイズし、以降はメモリ上の結果を使い回す
         
         Args:
             product: 製品情報
-            rank: 順位
-        
+            
         Returns:
-            Image.Image: 製品スライド画像
+            Optional[Image.Image]: リサイズ済みの商品画像（取得できなければNone）
         """
-        img  = self._get_common_background() 
-        draw = ImageDraw.Draw(img)
+        cache_key = product.get('product_id') or product.get('local_image_path')
+        if cache_key and cache_key in self._product_images:
+            return self._product_images[cache_key]
         
         # 画像読み込みの準備
         img_loaded = False
@@ -628,14 +1155,12 @@ class VideoMaker:
                 img_path = os.path.join(self.temp_dir, f"{product['product_id']}.jpg")
                 os.makedirs(os.path.dirname(img_path), exist_ok=True)
                 
-                # リクエスト送信（シンプルな実装）
-                import requests
-                response = requests.get(image_url, timeout=30)
-                response.raise_for_status()
-                
-                # 画像を保存
-                with open(img_path, 'wb') as f:
-                    f.write(response.content)
+                # レスポンス全体をメモリに載せず、1MBずつファイルに書き出す
+                with requests.get(image_url, timeout=30, stream=True) as response:
+                    response.raise_for_status()
+                    response.raw.decode_content = True
+                    with open(img_path, 'wb') as f:
+                        shutil.copyfileobj(response.raw, f, length=1024 * 1024)
                     
                 # 保存した画像を読み込み
                 product_img = Image.open(img_path)
@@ -643,11 +1168,90 @@ class VideoMaker:
                 logger.info(f"画像を直接ダウンロードして保存: {img_path}")
             except Exception as e:
                 logger.error(f"画像ダウンロードエラー: {str(e)}")
-                img_loaded = False  
+                img_loaded = False
+        
+        if not img_loaded:
+            return None
+        
+        # JPEGは縮小後のサイズに近いスケールでデコードさせる（IDCTを縮小率に合わせて省略）
+        # （draft は JPEG 以外では効果がないため、JPEG のときだけ呼ぶ）
+        target_width = int(self.VIDEO_WIDTH * 0.7)
+        if product_img.format == "JPEG" and product_img.width > 0:
+            product_img.draft("RGB", (target_width, int(target_width * product_img.height / product_img.width)))
+        
+        product_img = self._resize_product_image(product, product_img)
+        if cache_key:
+            self._product_images[cache_key] = product_img
+        return product_img
     
+    def _resize_product_image(
+        self,
+        product: Dict[str, Any],
+        product_img: Image.Image
+    ) -> Image.Image:
+        """
+        商品画像を画面幅の70%に合わせてリサイズ
+        結果は一時ディレクトリに (商品ID, 幅, 高さ) 単位で保存し、再実行時はリサイズを省略する
+        
+        Args:
+            product: 製品情報
+            product_img: 元の商品画像
+            
+        Returns:
+            Image.Image: リサイズされた商品画像（RGB）
+        """
+        img_width, img_height = product_img.size
+        logger.info(f"元の画像サイズ: {img_width}x{img_height}")
+        aspect_ratio = img_width / img_height if img_height > 0 else 1
+        
+        new_width = int(self.VIDEO_WIDTH * 0.7)
+        new_height = int(new_width / aspect_ratio)
+        logger.info(f"リサイズ後の画像サイズ: {new_width}x{new_height}")
+        
+        cache_path = None
+        if product.get('product_id'):
+            cache_path = os.path.join(self.temp_dir, f"{product['product_id']}_{new_width}x{new_height}.jpg")
+            if os.path.exists(cache_path):
+                try:
+                    return Image.open(cache_path).convert("RGB")
+                except Exception as e:
+                    logger.warning(f"リサイズ済み画像の読み込みに失敗: {cache_path} - {e}")
+        
+        # 最終的に画面の一部に収まる縮小なので BILINEAR で十分
+        resized = product_img.resize((new_width, new_height), Image.BILINEAR).convert("RGB")
+        if cache_path:
+            try:
+                resized.save(cache_path, quality=95)
+            except Exception as e:
+                logger.warning(f"リサイズ済み画像の保存に失敗: {cache_path} - {e}")
+        return resized
+    
+    def _create_product_slide(
+        self,
+        product: Dict[str, Any],
+        rank: int,
+        brand_name: str,
+        show_name: bool = True,
+    ) -> Image.Image:
+        """
+        製品スライドの作成（画像と商品名のみ表示）
+        
+        Args:
+            product: 製品情報
+            rank: 順位
+        
+        Returns:
+            Image.Image: 製品スライド画像
+        """
+        img  = self._get_common_background_rgb() 
+        draw = ImageDraw.Draw(img)
+        
+        # 商品画像（読み込み・リサイズ済み）
+        product_img = self._load_product_image(product)
+
         # ランク
-        rank_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY,
-                                    int(self.TITLE_FONT_SIZE * 2.0))   # 少し大きめ
+        rank_font = self.get_font(int(self.TITLE_FONT_SIZE * 2.0),
+                                  self.SOURCE_HAN_SERIF_HEAVY)   # 少し大きめ
         rank_text = f"第{rank}位"
 
         w = self.calculate_text_width(rank_text, rank_font, draw)
@@ -671,7 +1275,7 @@ class VideoMaker:
         brand_font_size = self._brand_font_size(brand_text_len)  # サイズを動的に設定
         brand_space = 20
         # ブランド名のフォント
-        brand_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, brand_font_size)
+        brand_font = self.get_font(brand_font_size, self.SOURCE_HAN_SERIF_HEAVY)
         # ブランド名を表示
         if show_name and brand_name:
             w_brand = self.calculate_text_width(brand_name, brand_font, draw)
@@ -700,7 +1304,7 @@ class VideoMaker:
             for line in name_lines:
                 text_len  = len(line.replace(" ", ""))
                 font_size = self._name_font_size(text_len)
-                name_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, font_size)
+                name_font = self.get_font(font_size, self.SOURCE_HAN_SERIF_HEAVY)
 
                 w = self.calculate_text_width(line, name_font, draw)
                 x = (self.VIDEO_WIDTH - w) // 2
@@ -724,23 +1328,8 @@ class VideoMaker:
         
         # 画像を中央下部に配置
         try:
-            # 画像サイズチェック
-            img_width, img_height = product_img.size
-            logger.info(f"元の画像サイズ: {img_width}x{img_height}")
-            
-            # 縦横比の計算
-            aspect_ratio = img_width / img_height if img_height > 0 else 1
-            
-            # 幅を画面の80%に設定（常に）
-            new_width = int(self.VIDEO_WIDTH * 0.7)
-            new_height = int(new_width / aspect_ratio)
-            
-            # ログ出力
-            logger.info(f"リサイズ後の画像サイズ: {new_width}x{new_height}")
-            
-            # リサイズ
-            product_img = product_img.resize((new_width, new_height), Image.LANCZOS)
-            
+            new_width = product_img.width
+
             # 画像をブランド名と商品名の下に配置
             img_x = (self.VIDEO_WIDTH - new_width) // 2
             img_y = name_block_bottom + 100
@@ -750,7 +1339,7 @@ class VideoMaker:
         except Exception as e:
             logger.error(f"画像処理エラー: {str(e)}")
         
-        return img.convert("RGB")
+        return img
     
     def _create_main_intro_slide(self, channel: str, genre: str) -> Image.Image:
         bg = self._get_common_background()
@@ -760,17 +1349,17 @@ class VideoMaker:
         channel_name = f"{channel}で" if channel else "お店で"
 
         # 共通フォント
-        heavy220  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 220)
-        heavy180  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 180)
-        heavy150  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 150)
-        heavy130  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 130)
-        heavy110  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 110)
-        heavy100   = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 100)
-        heavy90  = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 90)
-        heavy80   = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 80)
+        heavy220  = self.get_font(220, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy180  = self.get_font(180, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy150  = self.get_font(150, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy130  = self.get_font(130, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy110  = self.get_font(110, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy100   = self.get_font(100, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy90  = self.get_font(90, self.SOURCE_HAN_SERIF_HEAVY)
+        heavy80   = self.get_font(80, self.SOURCE_HAN_SERIF_HEAVY)
 
         # ① 一度は
-        w = self.calculate_text_width("一度は", heavy130, ImageDraw.Draw(bg))
+        w = self.calculate_text_width("一度は", heavy130)
         self.draw_text_effect(
             bg, "一度は", ((self.VIDEO_WIDTH-w)//2, y),
             heavy130,
@@ -781,7 +1370,7 @@ class VideoMaker:
         y += 100
 
         # ② マジで使ってみて欲しい
-        w = self.calculate_text_width("マジで", heavy220, ImageDraw.Draw(bg))
+        w = self.calculate_text_width("マジで", heavy220)
         self.draw_text_effect(
             bg, "マジで", ((self.VIDEO_WIDTH-w)//2, y),
             heavy220,
@@ -793,7 +1382,7 @@ class VideoMaker:
         y += 230
 
         for line in ["使ってみて", "欲しい"]:
-            w = self.calculate_text_width(line, heavy150, ImageDraw.Draw(bg))
+            w = self.calculate_text_width(line, heavy150)
             self.draw_text_effect(
                 bg, line, ((self.VIDEO_WIDTH-w)//2, y),
                 heavy150,
@@ -816,15 +1405,8 @@ class VideoMaker:
             heavy_font = heavy110
         else: 
             heavy_font = heavy130
-        w = self.calculate_text_width(text, heavy150, ImageDraw.Draw(bg))
-        self._draw_text_italic(
-            bg, text, y,
-            heavy_font,
-            gradient=[(255, 246, 194), (255, 216, 74), (199, 154, 5)],
-            stroke_width=8, stroke_fill=(0, 0, 0),
-            bevel=True,
-            glow_radius=12, glow_opacity=0.4
-        )
+        # イタリック行は④と同じ効果なので、まとめて描画する
+        italic_lines = [(text, y, heavy_font)]
         if text_len >= 10:
             y += 100
         elif text_len >= 8:
@@ -847,10 +1429,10 @@ class VideoMaker:
             heavy_font = heavy130
         else: 
             heavy_font = heavy180
-        w = self.calculate_text_width(text, heavy180, ImageDraw.Draw(bg))
-        self._draw_text_italic(
-            bg, text, y,
-            heavy_font,
+        italic_lines.append((text, y, heavy_font))
+        # ③④ をまとめて疑似イタリックで描画（レイヤー作成・シアー・合成を1回に）
+        self._draw_text_italic_lines(
+            bg, italic_lines,
             gradient=[(255, 246, 194), (255, 216, 74), (199, 154, 5)],
             stroke_width=8, stroke_fill=(0, 0, 0),
             bevel=True,
@@ -864,7 +1446,7 @@ class VideoMaker:
             y += 230
 
         # ⑤ 挙げてくw
-        w = self.calculate_text_width("挙げてくw", heavy80, ImageDraw.Draw(bg))
+        w = self.calculate_text_width("挙げてくw", heavy80)
         self.draw_text_effect(
             bg, "挙げてくw", ((self.VIDEO_WIDTH-w)//2, y),
             heavy80,
@@ -874,10 +1456,7 @@ class VideoMaker:
         )
         # y += 100
 
-        assets = [
-            ("data/assets/atsugesyou.png", "left"),   # 左下
-            ("data/assets/building_medical_pharmacy.png", "right"),  # 右下
-        ]
+        assets = self.INTRO_DECORATION_IMAGES
 
         pad_x = int(self.VIDEO_WIDTH * 0.1)   # 画面端から 2% だけ余白
         pad_y = int(self.VIDEO_HEIGHT * 0.1)
@@ -894,7 +1473,8 @@ class VideoMaker:
                 max_h = int(self.VIDEO_HEIGHT * 0.2)
                 dw, dh = deco.size
                 scale = min(max_w / dw, max_h / dh, 1.0)
-                deco = deco.resize((int(dw*scale), int(dh*scale)), Image.LANCZOS)
+                # 縮小のみなので BILINEAR で十分（LANCZOS より大幅に軽い）
+                deco = deco.resize((int(dw*scale), int(dh*scale)), Image.BILINEAR)
 
                 # 貼り付け位置
                 if side == "left":
@@ -916,7 +1496,7 @@ class VideoMaker:
         bg = self._create_main_intro_slide(channel, genre).convert("RGBA")
         draw = ImageDraw.Draw(bg)
         
-        heavy70 = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, 70)
+        heavy70 = self.get_font(70, self.SOURCE_HAN_SERIF_HEAVY)
         text = "※これはブックマーク必須やで"
         
         # 中央配置
@@ -962,51 +1542,9 @@ class VideoMaker:
             base_img = self._get_common_background()
             draw = ImageDraw.Draw(base_img)
             
-            # 画像読み込みの準備
-            img_loaded = False
-            product_img = None
-            
-            # 画像の読み込み処理（既存のコードと同様）
-            if 'local_image_path' in product and product['local_image_path']:
-                local_path = product['local_image_path']
-                if os.path.exists(local_path):
-                    try:
-                        product_img = Image.open(local_path)
-                        img_loaded = True
-                    except Exception as e:
-                        logger.error(f"ローカル画像読み込みエラー: {local_path} - {str(e)}")
-                        img_loaded = False
-            
-            if not img_loaded and 'product_id' in product:
-                img_path = os.path.join(self.temp_dir, f"{product['product_id']}.jpg")
-                if os.path.exists(img_path):
-                    try:
-                        product_img = Image.open(img_path)
-                        img_loaded = True
-                    except Exception as e:
-                        logger.error(f"一時ディレクトリの画像読み込みエラー: {img_path} - {str(e)}")
-                        img_loaded = False
-            
-            if not img_loaded and 'image_url' in product and product['image_url']:
-                image_url = product['image_url']
-                try:
-                    logger.info(f"画像をURLから直接ダウンロード中: {image_url}")
-                    img_path = os.path.join(self.temp_dir, f"{product['product_id']}.jpg")
-                    os.makedirs(os.path.dirname(img_path), exist_ok=True)
-                    
-                    import requests
-                    response = requests.get(image_url, timeout=30)
-                    response.raise_for_status()
-                    
-                    with open(img_path, 'wb') as f:
-                        f.write(response.content)
-                        
-                    product_img = Image.open(img_path)
-                    img_loaded = True
-                    logger.info(f"画像を直接ダウンロードして保存: {img_path}")
-                except Exception as e:
-                    logger.error(f"画像ダウンロードエラー: {str(e)}")
-                    img_loaded = False
+            # 商品画像（読み込み・リサイズ済み）
+            product_img = self._load_product_image(product)
+            img_loaded = product_img is not None
 
             # ブランド名の取得と準備
             brand_name = product.get("brand", "")
@@ -1021,49 +1559,59 @@ class VideoMaker:
             
             # 画像サイズ設定
             if img_loaded:
-                img_width, img_height = product_img.size
-                logger.info(f"元の画像サイズ: {img_width}x{img_height}")
-                aspect_ratio = img_width / img_height if img_height > 0 else 1
-                
-                new_width = int(self.VIDEO_WIDTH * 0.7)
-                new_height = int(new_width / aspect_ratio)
-                
-                logger.info(f"リサイズ後の画像サイズ: {new_width}x{new_height}")
-                
-                # リサイズ
-                product_img = product_img.resize((new_width, new_height), Image.LANCZOS)
-                
+                new_width = product_img.width
+
                 # 画像の最終位置（アニメーション後）
                 img_x = (self.VIDEO_WIDTH - new_width) // 2
                 img_y = name_block_bottom + 100
             else:
                 new_width = int(self.VIDEO_WIDTH * 0.7)
-                new_height = int(new_width)
                 img_x = (self.VIDEO_WIDTH - new_width) // 2
                 img_y = name_block_bottom + 100
 
             # ランク表示用のフォント
-            rank_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, int(self.TITLE_FONT_SIZE * 2.0))
+            rank_font = self.get_font(int(self.TITLE_FONT_SIZE * 2.0), self.SOURCE_HAN_SERIF_HEAVY)
             rank_text = f"第{rank}位"
             
             # ブランド名用のフォント
-            brand_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, brand_font_size)
+            brand_font = self.get_font(brand_font_size, self.SOURCE_HAN_SERIF_HEAVY)
             
-            # アニメーションの一時ディレクトリ
-            with tempfile.TemporaryDirectory() as animation_dir:
-                # フレーム数の設定
-                fps = 30
-                frame_count = max(int(fps * animation_duration), 2)  # 最低3フレーム
-                
-                # アニメーションフレームの生成
-                frame_paths = []
-                
+            # フレーム数の設定
+            fps = 30
+            frame_count = max(int(fps * animation_duration), 2)  # 最低3フレーム
+
+            # フレームを画像ファイルに書き出さず、RGBの生データをFFmpegの標準入力に流し込む
+            # 最終フレームは tpad で5秒間（後で音声に合わせて調整するための十分な長さ）延長し、
+            # アニメーション部分と静止部分を1回のエンコードで出力する
+            anim_cmd = [
+                "ffmpeg", "-y",
+                "-loglevel", "error",
+                "-f", "rawvideo",
+                "-pix_fmt", "rgb24",
+                "-s", f"{self.VIDEO_WIDTH}x{self.VIDEO_HEIGHT}",
+                "-framerate", str(fps),
+                "-i", "-",
+                "-vf", "tpad=stop_mode=clone:stop_duration=5",
+                "-r", str(OUTPUT_FPS),
+                *self._video_codec_args(),
+                "-pix_fmt", "yuv420p",
+                output_path
+            ]
+            process = subprocess.Popen(
+                anim_cmd,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.PIPE,
+                bufsize=1024 * 1024
+            )
+
+            try:
                 # アニメーションフレーム
                 for frame in range(frame_count + 1):  # +1で最終フレームを含める
                     progress = frame / frame_count  # 0.0 から 1.0 の進行度
                     
                     # 現在のフレームの画像を作成
-                    frame_img = self._get_common_background()
+                    frame_img = self._get_common_background_rgb()
                     draw = ImageDraw.Draw(frame_img)
                     
                     # ランクのアニメーション（上から下へ）
@@ -1107,7 +1655,7 @@ class VideoMaker:
                         for line in name_lines:
                             text_len = len(line.replace(" ", ""))
                             font_size = self._name_font_size(text_len)
-                            name_font = ImageFont.truetype(self.SOURCE_HAN_SERIF_HEAVY, font_size)
+                            name_font = self.get_font(font_size, self.SOURCE_HAN_SERIF_HEAVY)
                             
                             w = self.calculate_text_width(line, name_font, draw)
                             x = (self.VIDEO_WIDTH - w) // 2
@@ -1138,85 +1686,23 @@ class VideoMaker:
                         # 画像貼り付け
                         frame_img.paste(product_img, (img_x, current_img_y))
                     
-                    # フレームを保存
-                    frame_path = os.path.join(animation_dir, f"frame_{frame:03d}.png")
-                    frame_img = frame_img.convert("RGB")
-                    frame_img.save(frame_path)
-                    frame_paths.append(frame_path)
-                
-                # 最終フレーム（アニメーション後の静的な状態）
-                final_frame = frame_paths[-1]
-                static_frame_path = os.path.join(animation_dir, "static_frame.png")
-                shutil.copy(final_frame, static_frame_path)
-                
-                # フレームリストファイルの作成（アニメーションフレーム）
-                anim_frames_list_path = os.path.join(animation_dir, "anim_frames.txt")
-                with open(anim_frames_list_path, "w") as f:
-                    for i, frame_path in enumerate(frame_paths):
-                        f.write(f"file '{frame_path}'\n")
-                        # 最後のフレーム以外は1/fpsの持続時間
-                        if i < len(frame_paths) - 1:
-                            f.write(f"duration {1/fps}\n")
-                        else:
-                            # 最後のフレームには特別な持続時間を指定しない（最後のフレームはoutfileの生成に使われるため）
-                            f.write(f"duration {1/fps}\n")
-                
-                # 一時的なアニメーション部分のみの動画を作成
-                temp_anim_path = os.path.join(animation_dir, "temp_anim.mp4")
-                anim_cmd = [
-                    "ffmpeg", "-y",
-                    "-f", "concat",
-                    "-safe", "0",
-                    "-i", anim_frames_list_path,
-                    "-vsync", "vfr",
-                    "-pix_fmt", "yuv420p",
-                    temp_anim_path
-                ]
-                
+                    # フレームをFFmpegに送る
+                    process.stdin.write(frame_img.tobytes())
+            except BrokenPipeError:
+                # FFmpegが途中で終了した場合（エラー内容は下で出力する）
+                pass
+            finally:
                 try:
-                    subprocess.run(anim_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    logger.info(f"アニメーション部分の動画を作成しました: {temp_anim_path}")
-                    
-                    # 最終フレームを静止画として出力
-                    static_video_path = os.path.join(animation_dir, "static_frame.mp4")
-                    
-                    # 最終フレームを5秒間（後で音声に合わせて調整するための十分な長さ）の静止動画として作成
-                    static_cmd = [
-                        "ffmpeg", "-y",
-                        "-loop", "1",
-                        "-i", static_frame_path,
-                        "-c:v", "libx264",
-                        "-t", "5",  # 十分な長さ（音声に合わせて後でカットされる）
-                        "-pix_fmt", "yuv420p",
-                        static_video_path
-                    ]
-                    
-                    subprocess.run(static_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    logger.info(f"静止画部分の動画を作成しました: {static_video_path}")
-                    
-                    # 最後に両方を結合
-                    list_file_path = os.path.join(animation_dir, "final_list.txt")
-                    with open(list_file_path, "w") as f:
-                        f.write(f"file '{temp_anim_path}'\n")
-                        f.write(f"file '{static_video_path}'\n")
-                    
-                    final_cmd = [
-                        "ffmpeg", "-y",
-                        "-f", "concat",
-                        "-safe", "0",
-                        "-i", list_file_path,
-                        "-c", "copy",
-                        output_path
-                    ]
-                    
-                    subprocess.run(final_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    logger.info(f"アニメーション付き動画を作成しました: {output_path}")
-                    return True
-                    
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"FFmpeg実行エラー: {e}")
-                    return False
-                    
+                    process.stdin.close()
+                except BrokenPipeError:
+                    pass
+
+            stderr = process.stderr.read()
+            if process.wait() != 0:
+                logger.error(f"FFmpeg実行エラー: {stderr.decode('utf-8', errors='replace')}")
+                return False
+
+            logger.info(f"アニメーション付き動画を作成しました: {output_path}")
             return True
         except Exception as e:
             logger.error(f"アニメーション作成中にエラー: {e}")
@@ -1226,7 +1712,7 @@ class VideoMaker:
 
     def wrap_text(self, text, font, draw, max_width):
         """
-        テキストを適切な位置で折り返す（最大2行まで対応）
+        テキストを適切な位置で折り返す（基本は2行、半分にしても収まらない行はさらに折り返す）
         """
         # 短いテキストはそのまま1行で返す
         if len(text) <= 12:
@@ -1234,10 +1720,7 @@ class VideoMaker:
         
         # テキスト幅を計算
         def calculate_text_width(text_to_measure):
-            try:
-                return self.calculate_text_width(text_to_measure, font, draw)
-            except AttributeError:
-                return draw.textsize(text_to_measure, font=font)[0]
+            return self.calculate_text_width(text_to_measure, font, draw)
         
         # テキスト幅が最大幅を超えない場合は1行で返す
         if calculate_text_width(text) <= max_width:
@@ -1278,7 +1761,40 @@ class VideoMaker:
         first_line = text[:best_position]
         second_line = text[best_position:]
         
-        return [first_line, second_line]
+        lines = []
+        for line in (first_line, second_line):
+            if calculate_text_width(line) <= max_width:
+                lines.append(line)
+            else:
+                # 長いコメントは半分にしてもはみ出すので、幅に合わせて折り返す
+                lines.extend(self._wrap_by_width(line, font, max_width))
+        return lines
+
+    def _wrap_by_width(self, text: str, font: ImageFont.FreeTypeFont, max_width: int) -> List[str]:
+        """
+        文字幅の累積和を二分探索し、最大幅に収まる位置で折り返す
+        （各文字の幅は1回ずつしか測らず、行ごとの区切り位置は bisect で求める）
+        
+        Args:
+            text: 折り返すテキスト
+            font: フォント
+            max_width: 1行の最大幅（ピクセル）
+            
+        Returns:
+            List[str]: 折り返された行のリスト
+        """
+        prefix_widths = list(accumulate(self.calculate_text_width(ch, font) for ch in text))
+        lines = []
+        start = 0
+        offset = 0
+        while start < len(text):
+            end = bisect.bisect_right(prefix_widths, offset + max_width, lo=start)
+            # 1文字で最大幅を超える場合も必ず1文字は進める
+            end = max(end, start + 1)
+            lines.append(text[start:end])
+            offset = prefix_widths[end - 1]
+            start = end
+        return lines
 
     def _get_video_duration(self, video_path):
         """動画ファイルの長さを取得する"""
@@ -1306,7 +1822,7 @@ class VideoMaker:
             return product_name
                 
         # スペース正規化
-        product_name = re.sub(r"\s+", " ", product_name.replace("　", " ")).strip()
+        product_name = _WHITESPACE_RE.sub(" ", product_name.replace("　", " ")).strip()
         
         # ブランド名を削除（大文字小文字を区別しない）
         if f" {brand_name} " in product_name:
@@ -1319,15 +1835,301 @@ class VideoMaker:
             return "商品"
         product_name = product_name.replace(brand_name, "")
         
-        product_name = re.sub(r"\s+", " ", product_name).strip()
+        product_name = _WHITESPACE_RE.sub(" ", product_name).strip()
         if not product_name:
             return "商品"
         
         # 読み上げ用にスペースを削除 - この行を追加
-        product_name = product_name.replace(' ', '').replace('　', '')
-                
+        product_name = product_name.translate(_STRIP_SPACES_TABLE)
+
         return product_name
 
+    def _create_comment_slides(
+        self,
+        base_slide_path: str,
+        rank: int,
+        reviews: List[str],
+        output_dir: str
+    ) -> List[Optional[str]]:
+        """
+        ベーススライドにコメントを1件ずつ重ねたスライドを作成して保存
+        
+        Args:
+            base_slide_path: ベーススライドのパス
+            rank: 順位
+            reviews: コメントリスト（先頭3件を使用）
+            output_dir: スライドの保存先ディレクトリ
+            
+        Returns:
+            List[Optional[str]]: コメントごとのスライドのパス（空のコメントはNone）
+        """
+        base_slide = Image.open(base_slide_path).convert("RGB")
+
+        # 表示済みコメントを保持するスライド
+        accumulated_slide = base_slide.copy()
+        
+        # コメント位置を定義
+        positions = ["top", "middle", "bottom"]
+        
+        slide_paths: List[Optional[str]] = []
+        for i, review in enumerate(reviews[:3]):
+            if not review:
+                slide_paths.append(None)
+                continue
+            comment_text = str(review) 
+            # コメント位置
+            comment_position = positions[i % len(positions)]
+            
+            # コメントを累積スライドに追加
+            comment_font = self.get_font(
+                self.REVIEW_FONT_SIZE + 30,
+                font_path=self.YASASHISA_GOTHIC if os.path.exists(self.YASASHISA_GOTHIC) else self.noto_sans_jp_path
+            )
+            draw = ImageDraw.Draw(accumulated_slide)
+
+            # テキスト幅を調整して折り返し
+            max_text_width = int(self.VIDEO_WIDTH * 0.7)  # コメント内テキスト幅（ボックス幅の少し小さめ）
+            # テキストを折り返す
+            lines = self.wrap_text(comment_text, comment_font, draw, max_text_width)
+
+            # バルーンサイズ計算
+            line_h = int((self.REVIEW_FONT_SIZE + 15) * 1.4)
+            text_h = line_h * len(lines)
+            text_w = max(self.calculate_text_width(l, comment_font, draw) for l in lines)
+            pad_x, pad_y = 40, 30
+            
+            # ボックス幅を画面幅の90%に固定
+            box_w = int(self.VIDEO_WIDTH * 0.9)
+            box_h = text_h + pad_y * 2
+
+            # 位置決定
+            center_x = self.VIDEO_WIDTH // 2
+            if comment_position == "top":
+                box_y = int(self.VIDEO_HEIGHT * 0.25)
+            elif comment_position == "middle":
+                box_y = int(self.VIDEO_HEIGHT * 0.5) - box_h // 2
+            else:  # bottom
+                box_y = int(self.VIDEO_HEIGHT * 0.75) - box_h
+
+            box_x = center_x - box_w // 2
+
+            # バルーン（角丸長方形）を描画
+            border_col = self.COMMENT_COLORS[i % 3]
+            rect = [
+                (box_x, box_y),
+                (box_x + box_w, box_y + box_h)
+            ]
+            # Pillow ≥ 9.2 なら rounded_rectangle が使える
+            draw.rounded_rectangle(
+                rect,
+                radius=self.COMMENT_CORNER_RADIUS,
+                fill=(255, 255, 255),
+                outline=border_col,
+                width=self.COMMENT_BORDER_PX
+            )
+
+            # テキスト描画
+            for idx, line in enumerate(lines):
+                tx = center_x - self.calculate_text_width(line, comment_font, draw) // 2
+                ty = box_y + pad_y + idx * line_h
+                draw.text((tx, ty), line, font=comment_font, fill=(0, 0, 0))
+            
+            # 現在の累積スライドを保存（コメント追加後）
+            comment_slide_path = os.path.join(output_dir, f"product_{rank}_comment_{i+1}{FRAME_EXT}")
+            accumulated_slide.save(comment_slide_path)
+            slide_paths.append(comment_slide_path)
+
+        return slide_paths
+
+    def _slide_cache_path(
+        self,
+        method: str,
+        key_args: tuple,
+        extra_dependencies: Tuple[str, ...] = ()
+    ) -> str:
+        """
+        スライドのキャッシュファイルのパスを取得
+        描画に使う引数と、フォント・背景・装飾画像などの更新時刻のハッシュをファイル名にする
+
+        Args:
+            method: スライド作成メソッド名
+            key_args: スライドの内容を決める引数
+            extra_dependencies: 更新時刻をキーに含める追加のファイル（商品画像など）
+
+        Returns:
+            str: キャッシュファイルのパス
+        """
+        dependencies = [
+            self.SOURCE_HAN_SERIF_HEAVY,
+            self.BACKGROUND_IMAGE_PATH,
+            *(path for path, _ in self.INTRO_DECORATION_IMAGES),
+            *extra_dependencies,
+        ]
+        mtimes = [os.path.getmtime(p) if os.path.exists(p) else None for p in dependencies]
+        key = repr((SLIDE_CACHE_VERSION, method, key_args, self.VIDEO_WIDTH, self.VIDEO_HEIGHT, mtimes))
+        digest = hashlib.sha1(key.encode("utf-8")).hexdigest()
+        return os.path.join(self.temp_dir, "_slide_cache", f"{digest}{FRAME_EXT}")
+
+    def _submit_cached_slide(
+        self,
+        executor: ProcessPoolExecutor,
+        method: str,
+        args: tuple,
+        kwargs: Optional[Dict[str, Any]] = None,
+        key_args: Optional[tuple] = None,
+        extra_dependencies: Tuple[str, ...] = ()
+    ) -> Future:
+        """
+        スライドをキャッシュから取得、なければワーカーで描画してキャッシュに保存
+
+        Args:
+            executor: スライド描画用のプロセスプール
+            method: スライド作成メソッド名
+            args: メソッドの位置引数
+            kwargs: メソッドのキーワード引数
+            key_args: キャッシュキーに使う引数（省略時は args と kwargs）
+            extra_dependencies: 更新時刻をキーに含める追加のファイル
+
+        Returns:
+            Future: スライド画像のパスを返すFuture
+        """
+        kwargs = kwargs or {}
+        if key_args is None:
+            key_args = (args, sorted(kwargs.items())) if kwargs else args
+        cache_path = self._slide_cache_path(method, key_args, extra_dependencies)
+        if os.path.exists(cache_path):
+            logger.info(f"キャッシュ済みのスライドを使用します: {cache_path}")
+            future = Future()
+            future.set_result(cache_path)
+            return future
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        return executor.submit(_render_slide, method, args, kwargs, cache_path)
+
+    def _product_image_path(self, product: Dict[str, Any]) -> str:
+        """
+        商品画像の読み込み元のパスを取得（_load_product_image と同じ優先順位）
+
+        Args:
+            product: 製品情報
+
+        Returns:
+            str: 画像ファイルのパス
+        """
+        local_path = product.get('local_image_path')
+        if local_path and os.path.exists(local_path):
+            return local_path
+        return os.path.join(self.temp_dir, f"{product.get('product_id')}.jpg")
+
+    def _encode_segments(
+        self,
+        segments: List[Dict[str, Any]],
+        output_path: str,
+        bgm_path: Optional[str] = None
+    ) -> None:
+        """
+        全セグメントを1回のFFmpeg実行で連結・BGMミックス・エンコードする
+
+        Args:
+            segments: セグメントのリスト
+                {"video": 画像または動画のパス, "still": 静止画かどうか,
+                 "audio": 音声のパス（Noneなら無音）, "duration": 表示時間（秒）,
+                 "audio_offset": 音声の使用開始位置（秒、省略可）,
+                 "effect": (効果音のパス, 音量)（省略可）,
+                 "overlay": 映像全体に重ねる透過画像のパス（字幕など、省略可）}
+            output_path: 出力動画のパス
+            bgm_path: BGMファイルのパス（Noneの場合はBGMなし）
+
+        Raises:
+            subprocess.CalledProcessError: FFmpegの実行に失敗した場合
+        """
+        cmd = ["ffmpeg", "-y"]
+        filters = []
+        concat_labels = ""
+        total_duration = 0.0
+        input_index = 0
+
+        for i, segment in enumerate(segments):
+            duration = f"{segment['duration']:.3f}"
+            total_duration += segment["duration"]
+
+            # 映像入力
+            if segment["still"]:
+                cmd += ["-loop", "1", "-framerate", str(OUTPUT_FPS), "-t", duration]
+            cmd += ["-i", segment["video"]]
+            video_label = f"[{input_index}:v]"
+            input_index += 1
+
+            # 字幕などの透過画像を重ねる（1枚の画像は最後のフレームが保持される）
+            if segment.get("overlay"):
+                cmd += ["-i", segment["overlay"]]
+                filters.append(f"{video_label}[{input_index}:v]overlay=0:0[o{i}]")
+                video_label = f"[o{i}]"
+                input_index += 1
+
+            # 音声入力（一部だけ使う場合は入力側で切り出す）
+            if segment["audio"]:
+                if segment.get("audio_offset") is not None:
+                    cmd += ["-ss", f"{segment['audio_offset']:.3f}", "-t", duration]
+                cmd += ["-i", segment["audio"]]
+            else:
+                # 無音ファイルを作らず、FFmpeg内で無音を生成する
+                cmd += [
+                    "-f", "lavfi", "-t", duration,
+                    "-i", f"anullsrc=r={AUDIO_SAMPLE_RATE}:cl=stereo"
+                ]
+            audio_label = f"[{input_index}:a]"
+            input_index += 1
+
+            # 効果音をナレーションにミックス
+            if segment["audio"] and segment.get("effect"):
+                effect_path, effect_volume = segment["effect"]
+                cmd += ["-i", effect_path]
+                filters.append(
+                    f"[{input_index}:a]volume={effect_volume}[e{i}];"
+                    f"{audio_label}[e{i}]amix=inputs=2:duration=first[m{i}]"
+                )
+                audio_label = f"[m{i}]"
+                input_index += 1
+
+            # 映像は最終フレームを延長して表示時間ちょうどに揃える
+            filters.append(
+                f"{video_label}fps={OUTPUT_FPS},"
+                f"tpad=stop_mode=clone:stop_duration={duration},"
+                f"trim=duration={duration},setpts=PTS-STARTPTS,setsar=1,format=yuv420p[v{i}]"
+            )
+            # 音声はフォーマットを揃え、無音で延長してから表示時間で切る
+            filters.append(
+                f"{audio_label}aresample={AUDIO_SAMPLE_RATE},aformat=channel_layouts=stereo,"
+                f"apad,atrim=duration={duration},asetpts=PTS-STARTPTS[a{i}]"
+            )
+            concat_labels += f"[v{i}][a{i}]"
+
+        filters.append(f"{concat_labels}concat=n={len(segments)}:v=1:a=1[v][a]")
+
+        audio_label = "[a]"
+        if bgm_path:
+            # BGMをループ再生し、元の音声とミックス
+            cmd += ["-stream_loop", "-1", "-i", bgm_path]
+            filters.append(
+                f"[{input_index}:a]volume={BGM_VOLUME}[bgm];"
+                "[a][bgm]amix=inputs=2:duration=first[aout]"
+            )
+            audio_label = "[aout]"
+
+        cmd += [
+            "-filter_complex", ";".join(filters),
+            "-map", "[v]",
+            "-map", audio_label,
+            *self._video_codec_args(),
+            "-pix_fmt", "yuv420p",
+            "-c:a", "aac",
+            "-b:a", "192k",
+            "-t", f"{total_duration:.3f}",
+            output_path
+        ]
+
+        subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
+
     def create_video(
             self,
             products: List[Dict[str, Any]],
@@ -1351,543 +2153,353 @@ class VideoMaker:
         
         output_path = os.path.join(self.output_dir, output_filename)
         
+        try:
+            # 一時ディレクトリを作成
+            with tempfile.TemporaryDirectory() as temp_dir:
+                video_segments, bgm_path = self._prepare_segments(products, title, channel, temp_dir)
+                self._encode_video(video_segments, output_path, bgm_path)
+                return output_path
+                    
+        except Exception as e:
+            logger.error(f"動画作成エラー: {str(e)}")
+            import traceback
+            logger.error(traceback.format_exc())
+            raise
+
+    def create_videos(
+            self,
+            jobs: List[Dict[str, Any]]
+        ) -> List[Optional[str]]:
+        """
+        複数の動画をまとめて作成（スライド描画とエンコードをパイプライン化）
+        
+        描画はメインスレッドで1本ずつ行い、エンコードは1つのスレッドが順に処理する。
+        描画用のプロセスプールはメインスレッドからだけ作り、エンコード用のスレッドは
+        ffmpeg の終了を待つだけなので、次の動画の描画と前の動画のエンコードを重ねられる。
+        描画済みの動画は最大1本までキューで待たせ、一時ファイルが溜まりすぎないようにする。
+        
+        Args:
+            jobs: create_video の引数（products, title, channel, output_filename）の辞書リスト
+        
+        Returns:
+            List[Optional[str]]: 各ジョブの動画パス（失敗したジョブはNone）
+        """
+        results: List[Optional[str]] = [None] * len(jobs)
+        encode_queue = queue.Queue(maxsize=1)
+
+        def encode_worker():
+            while True:
+                item = encode_queue.get()
+                if item is None:
+                    break
+                index, temp_dir, video_segments, output_path, bgm_path = item
+                try:
+                    self._encode_video(video_segments, output_path, bgm_path)
+                    results[index] = output_path
+                except Exception as e:
+                    logger.error(f"動画エンコードエラー: {output_path}: {str(e)}")
+                finally:
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+
+        encoder = threading.Thread(target=encode_worker, daemon=True)
+        encoder.start()
+        try:
+            for index, job in enumerate(jobs):
+                logger.info(f"動画作成開始: {job['title']}")
+                temp_dir = tempfile.mkdtemp()
+                try:
+                    video_segments, bgm_path = self._prepare_segments(
+                        job['products'], job['title'], job['channel'], temp_dir
+                    )
+                except Exception as e:
+                    logger.error(f"動画作成エラー: {job['title']}: {str(e)}")
+                    shutil.rmtree(temp_dir, ignore_errors=True)
+                    continue
+                output_path = os.path.join(self.output_dir, job['output_filename'])
+                # 一時ディレクトリはエンコード完了後にエンコード用のスレッドで削除する
+                encode_queue.put((index, temp_dir, video_segments, output_path, bgm_path))
+        finally:
+            encode_queue.put(None)
+            encoder.join()
+
+        return results
+
+    def _prepare_segments(
+            self,
+            products: List[Dict[str, Any]],
+            title: str,
+            channel: str,
+            temp_dir: str
+        ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        スライド描画とナレーション生成を行い、エンコード用のセグメントを作成
+        
+        Args:
+            products: 製品情報リスト
+            title: 動画タイトル
+            channel: チャンネル名
+            temp_dir: スライド・音声の保存先ディレクトリ
+        
+        Returns:
+            Tuple[List[Dict[str, Any]], Optional[str]]: セグメントリストとBGMのパス
+        """
         # 製品リストをシャッフルして順位を割り当て
         total_products = len(products)
         for i, product in enumerate(products):
             product['new_rank'] = total_products - i 
         
-        try:
-            # 一時ディレクトリを作成
-            with tempfile.TemporaryDirectory() as temp_dir:
-                # 動画セグメントのパスリスト
-                video_segments = []
-                
-                # イントロスライド作成
-                intro_title = None
-                channel_intro = title.split('で買える')[0] if 'で買える' in title else ""
-                genre = title.split('で買える')[-1].replace('ランキング', '').strip() if 'で買える' in title else ""
-                for product in products:
-                    if 'channel' in product and 'genre' in product:
-                        intro_title = f"一度はマジで使ってみてほしい{channel_intro}で買える神{genre}挙げてく。これはブックマーク必須やで"
-                        break
-                
-                if not intro_title:
-                    # main.pyからタイトルを構築
-                    genre = title.split('で買える')[-1].replace('ランキング', '').strip() if 'で買える' in title else ""
+        # 商品画像は1回だけ読み込み・リサイズしておく
+        # （アニメーションとコメント用スライドの両方で使い、ワーカーには初期化引数で渡す。
+        #   fork ならそのまま引き継がれ、spawn でもワーカーごとに取得し直さない）
+        for product in products:
+            self._load_product_image(product)
+
+        # スライド描画はCPUバウンドで互いに独立しているため、別プロセスで並列に行う
+        render_workers = min(2 + 2 * total_products, os.cpu_count() or 1)
+        # 合成済みの背景は共有メモリ経由でワーカーに渡す
+        with self._shared_common_background() as shared_background, ProcessPoolExecutor(
+            max_workers=render_workers,
+            initializer=_init_render_worker,
+            initargs=(self._init_kwargs, shared_background, self._product_images)
+        ) as executor:
+            # 動画セグメントのリスト（最後に _encode_segments でまとめてエンコード）
+            video_segments = []
+            
+            # イントロスライド作成
+            intro_title = None
+            channel_intro = title.split('で買える')[0] if 'で買える' in title else ""
+            genre = title.split('で買える')[-1].replace('ランキング', '').strip() if 'で買える' in title else ""
+            for product in products:
+                if 'channel' in product and 'genre' in product:
                     intro_title = f"一度はマジで使ってみてほしい{channel_intro}で買える神{genre}挙げてく。これはブックマーク必須やで"
+                    break
+            
+            if not intro_title:
+                # main.pyからタイトルを構築
+                genre = title.split('で買える')[-1].replace('ランキング', '').strip() if 'で買える' in title else ""
+                intro_title = f"一度はマジで使ってみてほしい{channel_intro}で買える神{genre}挙げてく。これはブックマーク必須やで"
 
-                # イントロタイトルを前半と後半に分割（「これはブックマーク必須やで」の部分を分ける）
-                main_intro_text = f"一度はマジで使ってみてほしい{channel_intro}で買える神{genre}挙げてく。"
-                bookmark_text = "これはブックマーク必須やで"
-                
-                # メインイントロスライド作成（「これはブックマーク必須やで」を表示しない）
-                main_intro_img = self._create_main_intro_slide(channel, genre)
-                main_intro_slide_path = os.path.join(temp_dir, "main_intro_slide.png")
-                main_intro_img.save(main_intro_slide_path)
-                
-                # ブックマークスライド作成（ブックマーク部分だけを強調表示）
-                bookmark_intro_img = self._create_bookmark_intro_slide(channel, genre)
-                bookmark_intro_slide_path = os.path.join(temp_dir, "bookmark_intro_slide.png")
-                bookmark_intro_img.save(bookmark_intro_slide_path)
-                
-                # イントロ音声生成
-                intro_audio_path = os.path.join(temp_dir, "intro_audio.wav")
-                intro_success = generate_narration(intro_title, intro_audio_path, "random", self.SPEECH_SPEED)
-                
-                taiko_sound_path = "data/bgm/和太鼓でドドン.mp3"
-                syouhin_sound_path = "data/bgm/ニュッ3.mp3"
-                                
-                # 音声ファイルの分析と分割（ブックマーク部分のタイミングを特定）
-                if os.path.exists(intro_audio_path) and os.path.getsize(intro_audio_path) > 100:
-                    # 音声ファイルの長さを取得
-                    audio_duration = get_audio_duration(intro_audio_path)
-                    
-                    # 音声分析（簡易的な方法として、全体の長さから推定）
-                    main_part_duration = audio_duration * 0.7  # メインパートは全体の70%と推定
-                    bookmark_part_duration = audio_duration - main_part_duration  # 残りの30%をブックマークパート
-                    
-                    # 1. メインイントロ部分の動画作成
-                    main_intro_audio_path = os.path.join(temp_dir, "main_intro_audio.wav")
-                    extract_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", intro_audio_path,
-                        "-ss", "0",
-                        "-t", str(main_part_duration),
-                        "-c:a", "pcm_s16le",
-                        main_intro_audio_path
-                    ]
-                    
-                    try:
-                        subprocess.run(extract_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        logger.info(f"メインイントロ音声を切り出しました: {main_intro_audio_path}")
-                        
-                        # メインイントロに和太鼓効果音をミックス
-                        main_intro_with_effect_path = os.path.join(temp_dir, "main_intro_with_effect.wav")
-                        
-                        if os.path.exists(taiko_sound_path):
-                            # 効果音と音声をミックスするFFmpegコマンド
-                            mix_cmd = [
-                                "ffmpeg", "-y",
-                                "-i", main_intro_audio_path,  # メインナレーション
-                                "-i", taiko_sound_path,  # 和太鼓効果音
-                                "-filter_complex",
-                                "[1:a]adelay=0|0,volume=1.2[effect];[0:a][effect]amix=inputs=2:duration=first[aout]",
-                                "-map", "[aout]",
-                                "-c:a", "pcm_s16le",
-                                main_intro_with_effect_path
-                            ]
-                            
-                            try:
-                                subprocess.run(mix_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                                logger.info(f"メインイントロに和太鼓効果音を追加しました")
-                                main_intro_audio_path = main_intro_with_effect_path
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"和太鼓効果音の追加に失敗: {e.stderr}")
-                        
-                        # メインイントロ動画の作成
-                        main_intro_video_path = os.path.join(temp_dir, "main_intro_video.mp4")
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-loop", "1",
-                            "-i", main_intro_slide_path,
-                            "-i", main_intro_audio_path,
-                            "-c:v", "libx264",
-                            "-tune", "stillimage",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest"
-                        ]
-                        
-                        cmd.append(main_intro_video_path)
-                        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        video_segments.append(main_intro_video_path)
-                        
-                        # 2. ブックマーク部分の動画作成
-                        # ブックマーク用の音声を切り出し
-                        bookmark_audio_path = os.path.join(temp_dir, "bookmark_audio.wav")
-                        extract_cmd = [
-                            "ffmpeg", "-y",
-                            "-i", intro_audio_path,
-                            "-ss", str(main_part_duration),
-                            "-t", str(bookmark_part_duration),
-                            "-c:a", "pcm_s16le",
-                            bookmark_audio_path
-                        ]
-                        
-                        subprocess.run(extract_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        logger.info(f"ブックマーク音声を切り出しました: {bookmark_audio_path}")
-                        
-                        # ブックマーク動画の作成
-                        bookmark_video_path = os.path.join(temp_dir, "bookmark_video.mp4")
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-loop", "1",
-                            "-i", bookmark_intro_slide_path,
-                            "-i", bookmark_audio_path,
-                            "-c:v", "libx264",
-                            "-tune", "stillimage",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest"
-                        ]
-                        
-                        cmd.append(bookmark_video_path)
-                        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        video_segments.append(bookmark_video_path)
-                        
-                    except subprocess.CalledProcessError as e:
-                        logger.error(f"イントロ音声の分割・動画作成エラー: {e.stderr}")
-                        
-                        # エラーが発生した場合、通常の方法でイントロ動画を作成
-                        logger.warning("通常方法でイントロ動画を作成します")
-                        intro_img = self._create_improved_intro_slide(channel)
-                        intro_slide_path = os.path.join(temp_dir, "intro_slide.png")
-                        intro_img.save(intro_slide_path)
-                        
-                        intro_video_path = os.path.join(temp_dir, "intro_video.mp4")
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-loop", "1",
-                            "-i", intro_slide_path,
-                            "-i", intro_audio_path,
-                            "-c:v", "libx264",
-                            "-tune", "stillimage",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest"
-                        ]
-                        
-                        cmd.append(intro_video_path)
-                        subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        video_segments.append(intro_video_path)
-                else:
-                    # 音声生成に失敗した場合、通常の方法でイントロ動画を作成
-                    logger.warning(f"イントロの音声ファイルが存在しないか無効です。通常方法でイントロ動画を作成します。")
-                    display_duration = 3.0
-                    intro_audio_path = os.path.join(temp_dir, "silent_intro.wav")
-                    create_silent_audio(intro_audio_path, display_duration)
-                    
-                    intro_img = self._create_main_intro_slide(channel, genre)
-                    intro_slide_path = os.path.join(temp_dir, "intro_slide.png")
-                    intro_img.save(intro_slide_path)
-                    
-                    intro_video_path = os.path.join(temp_dir, "intro_video.mp4")
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-loop", "1",
-                        "-i", intro_slide_path,
-                        "-i", intro_audio_path,
-                        "-c:v", "libx264",
-                        "-tune", "stillimage",
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-pix_fmt", "yuv420p",
-                        "-shortest"
-                    ]
-                    
-                    cmd.append(intro_video_path)
-                    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    video_segments.append(intro_video_path)
-                    
-                # 各製品ごとに動画セグメントを作成
-                for product in products:
-                    rank = product['new_rank']
-                    product_name = product['name']
-                    brand_name = product['brand']
-                    reviews = product.get('reviews', [])
-                    
-                    # 製品名・ブランド名だけのナレーション用テキスト
-                    product_name_for_narration = self._prepare_product_name_for_narration(product.get('name'), brand_name)
-                    product_intro_text = f"{rank}位、{brand_name}の{product_name_for_narration}"
-                    # product_intro_text = f"{rank}位、{product_name_for_narration}"
-                    
-                    # 製品紹介ナレーション音声を生成
-                    product_audio_path = os.path.join(temp_dir, f"product_{rank}_audio.wav")
-                    success = generate_narration(product_intro_text, product_audio_path, "random", self.SPEECH_SPEED)
-                    
-                    # ナレーション音声があれば使用、なければ3秒間の無音
-                    if os.path.exists(product_audio_path) and os.path.getsize(product_audio_path) > 100:
-                        audio_duration = get_audio_duration(product_audio_path)
-                        display_duration = max(audio_duration + 0.2, 1.5)  # 少し余裕を持たせる
-                        
-                        # 各製品紹介に和太鼓効果音をミックス
-                        product_audio_with_effect_path = os.path.join(temp_dir, f"product_{rank}_audio_with_effect.wav")
-                        
-                        if os.path.exists(syouhin_sound_path):
-                            # 効果音と音声をミックスするFFmpegコマンド
-                            mix_cmd = [
-                                "ffmpeg", "-y",
-                                "-i", product_audio_path,  # ナレーション
-                                "-i", syouhin_sound_path,  # 和太鼓効果音
-                                "-filter_complex",
-                                "[1:a]adelay=0|0,volume=1.0[effect];[0:a][effect]amix=inputs=2:duration=first[aout]",
-                                "-map", "[aout]",
-                                "-c:a", "pcm_s16le",
-                                product_audio_with_effect_path
-                            ]
-                            
-                            try:
-                                subprocess.run(mix_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                                logger.info(f"製品{rank}の紹介に和太鼓効果音を追加しました")
-                                product_audio_path = product_audio_with_effect_path  # 効果音入りのパスに置き換え
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"製品{rank}の和太鼓効果音の追加に失敗: {e.stderr}")
-                        else:
-                            logger.warning(f"和太鼓効果音ファイルが見つかりません: {taiko_sound_path}")
-                    else:
-                        logger.warning(f"製品 {rank} の音声ファイルが存在しないか無効です。無音を使用します。")
-                        display_duration = 3.0
-                        product_audio_path = os.path.join(temp_dir, f"silent_{rank}.wav")
-                        create_silent_audio(product_audio_path, display_duration)
-                    
-                    # アニメーション付き商品紹介動画を作成
-                    product_video_path = os.path.join(temp_dir, f"product_{rank}_video.mp4")
-                    
-                    # アニメーション付き動画作成
-                    animation_success = self._create_product_animation(
-                        product, 
-                        rank, 
-                        os.path.join(temp_dir, f"product_{rank}_animation.mp4"), 
-                        show_name=True,
-                        animation_duration=0.05
-                    )
+            # イントロタイトルを前半と後半に分割（「これはブックマーク必須やで」の部分を分ける）
+            main_intro_text = f"一度はマジで使ってみてほしい{channel_intro}で買える神{genre}挙げてく。"
+            bookmark_text = "これはブックマーク必須やで"
+            
+            # メインイントロスライド作成（「これはブックマーク必須やで」を表示しない）
+            main_intro_future = self._submit_cached_slide(
+                executor, "_create_main_intro_slide", (channel, genre)
+            )
 
-                    if animation_success:
-                        # アニメーション動画と音声を結合
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-i", os.path.join(temp_dir, f"product_{rank}_animation.mp4"),
-                            "-i", product_audio_path,
-                            "-c:v", "libx264",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest",
-                            product_video_path
-                        ]
-                        
-                        try:
-                            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                            logger.info(f"製品 {rank} のアニメーション動画生成成功")
-                        except subprocess.CalledProcessError as e:
-                            logger.error(f"製品 {rank} のアニメーション動画生成エラー: {e.stderr}")
-                            
-                            # アニメーション失敗時のフォールバック: 通常の静止画動画を作成
-                            logger.warning(f"製品 {rank} の通常の静止画動画を作成します")
-                            
-                            # 1. 製品画像と商品名のみを表示したスライド生成
-                            product_slide = self._create_product_slide(product, rank, brand_name=product['brand'], show_name=True)
-                            product_slide_path = os.path.join(temp_dir, f"product_{rank}_slide.png")
-                            product_slide.save(product_slide_path)
-                            
-                            # 製品スライドを動画に変換
-                            cmd = [
-                                "ffmpeg", "-y",
-                                "-i", os.path.join(temp_dir, f"product_{rank}_animation.mp4"),
-                                "-i", product_audio_path,
-                                "-filter_complex",
-                                "[0:v]setpts=PTS-STARTPTS[v];[1:a]asetpts=PTS-STARTPTS[a]",
-                                "-map", "[v]",
-                                "-map", "[a]",
-                                "-c:v", "libx264",
-                                "-c:a", "aac",
-                                "-b:a", "192k",
-                                "-pix_fmt", "yuv420p",
-                                product_video_path
-                            ]
-                            
-                            try:
-                                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"製品 {rank} の動画生成エラー: {e.stderr}")
-                                raise
-                    else:
-                        # アニメーション作成失敗時は通常の静止画動画を作成
-                        logger.warning(f"製品 {rank} のアニメーション作成に失敗。通常の静止画動画を作成します")
-                        
-                        # 1. 製品画像と商品名のみを表示したスライド生成
-                        product_slide = self._create_product_slide(product, rank, brand_name=product['brand'], show_name=True)
-                        product_slide_path = os.path.join(temp_dir, f"product_{rank}_slide.png")
-                        product_slide.save(product_slide_path)
-                        
-                        # 製品スライドを動画に変換
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-loop", "1",
-                            "-i", product_slide_path,
-                            "-i", product_audio_path,
-                            "-c:v", "libx264",
-                            "-tune", "stillimage",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest",
-                            product_video_path
-                        ]
-                        
-                        try:
-                            result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                        except subprocess.CalledProcessError as e:
-                            logger.error(f"製品 {rank} の動画生成エラー: {e.stderr}")
-                            raise
-                    
-                    video_segments.append(product_video_path)
-                    
-                    # コメントを順番に追加していく
-                    if reviews:
-                        base_slide = self._create_product_slide(product, rank, brand_name=product['brand'], show_name=False)
-                        draw = ImageDraw.Draw(base_slide)
-                        
-                        # ベーススライドを保存
-                        base_slide_path = os.path.join(temp_dir, f"product_{rank}_base_slide.png")
-                        base_slide.save(base_slide_path)
-                        
-                        # 表示済みコメントを保持するスライド
-                        accumulated_slide = base_slide.copy()
-                        
-                        # コメント位置を定義
-                        positions = ["top", "middle", "bottom"]
-                        
-                        # コメントを順番に表示・読み上げる
-                        for i, review in enumerate(reviews[:3]):
-                            if not review:
-                                continue
-                            comment_text = str(review) 
-                            # コメント位置
-                            comment_position = positions[i % len(positions)]
-                            
-                            # コメントを累積スライドに追加
-                            comment_font = self.get_font(
-                                self.REVIEW_FONT_SIZE + 30,
-                                font_path=self.YASASHISA_GOTHIC if os.path.exists(self.YASASHISA_GOTHIC) else self.noto_sans_jp_path
-                            )
-                            draw = ImageDraw.Draw(accumulated_slide)
-
-                            # テキスト幅を調整して折り返し
-                            max_text_width = int(self.VIDEO_WIDTH * 0.7)  # コメント内テキスト幅（ボックス幅の少し小さめ）
-                            # テキストを折り返す
-                            lines = self.wrap_text(comment_text, comment_font, draw, max_text_width)
-
-                            # バルーンサイズ計算
-                            line_h = int((self.REVIEW_FONT_SIZE + 15) * 1.4)
-                            text_h = line_h * len(lines)
-                            text_w = max(self.calculate_text_width(l, comment_font, draw) for l in lines)
-                            pad_x, pad_y = 40, 30
-                            
-                            # ボックス幅を画面幅の90%に固定
-                            box_w = int(self.VIDEO_WIDTH * 0.9)
-                            box_h = text_h + pad_y * 2
-
-                            # 位置決定
-                            center_x = self.VIDEO_WIDTH // 2
-                            if comment_position == "top":
-                                box_y = int(self.VIDEO_HEIGHT * 0.25)
-                            elif comment_position == "middle":
-                                box_y = int(self.VIDEO_HEIGHT * 0.5) - box_h // 2
-                            else:  # bottom
-                                box_y = int(self.VIDEO_HEIGHT * 0.75) - box_h
-
-                            box_x = center_x - box_w // 2
-
-                            # バルーン（角丸長方形）を描画
-                            border_col = self.COMMENT_COLORS[i % 3]
-                            rect = [
-                                (box_x, box_y),
-                                (box_x + box_w, box_y + box_h)
-                            ]
-                            # Pillow ≥ 9.2 なら rounded_rectangle が使える
-                            draw.rounded_rectangle(
-                                rect,
-                                radius=self.COMMENT_CORNER_RADIUS,
-                                fill=(255, 255, 255),
-                                outline=border_col,
-                                width=self.COMMENT_BORDER_PX
-                            )
+            # ブックマークスライド作成（ブックマーク部分だけを強調表示）
+            bookmark_intro_future = self._submit_cached_slide(
+                executor, "_create_bookmark_intro_slide", (channel, genre)
+            )
 
-                            # テキスト描画
-                            for idx, line in enumerate(lines):
-                                tx = center_x - self.calculate_text_width(line, comment_font, draw) // 2
-                                ty = box_y + pad_y + idx * line_h
-                                draw.text((tx, ty), line, font=comment_font, fill=(0, 0, 0))
-                            
-                            # 現在の累積スライドを保存（コメント追加後）
-                            comment_slide_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}.png")
-                            accumulated_slide.save(comment_slide_path)
-                            
-                            # コメント用の音声を生成
-                            comment_audio_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}_audio.wav")
-                            comment_success = generate_narration(review, comment_audio_path, "random", self.SPEECH_SPEED)
-                            
-                            # コメントの音声が存在するか確認
-                            if not os.path.exists(comment_audio_path) or os.path.getsize(comment_audio_path) < 100:
-                                logger.warning(f"製品 {rank} のコメント {i+1} の音声ファイルが存在しないか無効です。無音を使用します。")
-                                comment_audio_path = os.path.join(temp_dir, f"silent_comment_{rank}_{i+1}.wav")
-                                create_silent_audio(comment_audio_path, 3.0)
-                            
-                            # 個別のコメントスライドを動画に変換
-                            comment_video_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}_video.mp4")
-                            
-                            cmd = [
-                                "ffmpeg", "-y",
-                                "-loop", "1",
-                                "-i", comment_slide_path,
-                                "-i", comment_audio_path,
-                                "-c:v", "libx264",
-                                "-tune", "stillimage",
-                                "-c:a", "aac",
-                                "-b:a", "192k",
-                                "-pix_fmt", "yuv420p",
-                                "-shortest"
-                            ]
-                            
-                            cmd.append(comment_video_path)
-                            
-                            try:
-                                result = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"製品 {rank} のコメント {i+1} の動画生成エラー: {e.stderr}")
-                                raise
+            # 商品ごとのアニメーション動画とコメント付きスライドも先に描画を開始
+            animation_futures = {}
+            comment_slide_futures = {}
+            for product in products:
+                rank = product['new_rank']
+                animation_futures[rank] = executor.submit(
+                    _render_product_animation,
+                    (product, rank, os.path.join(temp_dir, f"product_{rank}_animation.mp4")),
+                    {"show_name": True, "animation_duration": 0.05}
+                )
+                if product.get('reviews', []):
+                    # 順位・商品・商品画像が同じならベーススライドは前回の描画結果を使う
+                    base_slide_path = self._slide_cache_path(
+                        "_create_product_slide",
+                        (rank, product.get('product_id'), product.get('name'), product['brand'], False),
+                        (self._product_image_path(product),)
+                    )
+                    os.makedirs(os.path.dirname(base_slide_path), exist_ok=True)
+                    # ベーススライドにコメントを1件ずつ重ねたスライドを、商品ごとにワーカーで描画
+                    comment_slide_futures[rank] = executor.submit(
+                        _render_comment_slides,
+                        (product, rank), {"brand_name": product['brand'], "show_name": False},
+                        base_slide_path, rank, product['reviews'], temp_dir
+                    )
+
+            # ナレーション生成の間にワーカーで描画が進む
+            main_intro_slide_path = main_intro_future.result()
+            bookmark_intro_slide_path = bookmark_intro_future.result()
+            
+            # イントロ音声生成
+            intro_audio_path = os.path.join(temp_dir, "intro_audio.wav")
+            intro_success = generate_narration(intro_title, intro_audio_path, "random", self.SPEECH_SPEED)
+            
+            taiko_sound_path = "data/bgm/和太鼓でドドン.mp3"
+            syouhin_sound_path = "data/bgm/ニュッ3.mp3"
                             
-                            # 動画セグメントに追加
-                            video_segments.append(comment_video_path)
+            # 音声ファイルの分析と分割（ブックマーク部分のタイミングを特定）
+            if os.path.exists(intro_audio_path) and os.path.getsize(intro_audio_path) > 100:
+                # 音声ファイルの長さを取得
+                audio_duration = get_audio_duration(intro_audio_path)
                 
-                # すべての動画セグメントを連結するファイル作成
-                concat_file = os.path.join(temp_dir, "concat.txt")
-                with open(concat_file, "w") as f:
-                    for segment in video_segments:
-                        f.write(f"file '{segment}'\n")
+                # 音声分析（簡易的な方法として、全体の長さから推定）
+                main_part_duration = audio_duration * 0.7  # メインパートは全体の70%と推定
+                bookmark_part_duration = audio_duration - main_part_duration  # 残りの30%をブックマークパート
                 
-                # まずBGMなしで動画を連結
-                temp_video_path = os.path.join(temp_dir, "no_bgm_output.mp4")
-                concat_cmd = [
-                    "ffmpeg", "-y",
-                    "-f", "concat",
-                    "-safe", "0",
-                    "-i", concat_file,
-                    "-c", "copy",
-                    temp_video_path
-                ]
+                # 和太鼓効果音（ナレーション前半にミックス）
+                taiko_effect = (taiko_sound_path, 1.2) if os.path.exists(taiko_sound_path) else None
+
+                # 1. メインイントロ部分（ナレーション前半 + 和太鼓効果音）
+                # 切り出しとミックスは最終エンコードのフィルタ内で行う
+                video_segments.append({
+                    "video": main_intro_slide_path,
+                    "still": True,
+                    "audio": intro_audio_path,
+                    "audio_offset": 0.0,
+                    "effect": taiko_effect,
+                    "duration": main_part_duration
+                })
+
+                # 2. ブックマーク部分（ナレーション後半）
+                video_segments.append({
+                    "video": bookmark_intro_slide_path,
+                    "still": True,
+                    "audio": intro_audio_path,
+                    "audio_offset": main_part_duration,
+                    "duration": bookmark_part_duration
+                })
+            else:
+                # 音声生成に失敗した場合、通常の方法でイントロ動画を作成
+                logger.warning(f"イントロの音声ファイルが存在しないか無効です。通常方法でイントロ動画を作成します。")
+                display_duration = 3.0
+
+                video_segments.append({
+                    "video": main_intro_slide_path,
+                    "still": True,
+                    "audio": None,  # 無音はエンコード時に生成
+                    "duration": display_duration
+                })
+
+            # 各製品ごとに動画セグメントを作成
+            for product in products:
+                rank = product['new_rank']
+                product_name = product['name']
+                brand_name = product['brand']
+                reviews = product.get('reviews', [])
                 
-                try:
-                    result = subprocess.run(concat_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"最終動画の連結エラー: {e.stderr}")
-                    raise
+                # 製品名・ブランド名だけのナレーション用テキスト
+                product_name_for_narration = self._prepare_product_name_for_narration(product.get('name'), brand_name)
+                product_intro_text = f"{rank}位、{brand_name}の{product_name_for_narration}"
+                # product_intro_text = f"{rank}位、{product_name_for_narration}"
                 
-                # 動画の長さを取得
-                video_duration = self._get_video_duration(temp_video_path)
-                if video_duration <= 0:
-                    logger.warning("動画の長さが取得できませんでした。デフォルト値を使用します。")
-                    video_duration = 60.0
+                # 製品紹介ナレーション音声を生成
+                product_audio_path = os.path.join(temp_dir, f"product_{rank}_audio.wav")
+                success = generate_narration(product_intro_text, product_audio_path, "random", self.SPEECH_SPEED)
                 
-                # BGMを追加
-                bgm_path = os.path.join(self.bgm_dir, "しゅわしゅわハニーレモン.mp3")
-                if not os.path.exists(bgm_path):
-                    logger.warning(f"BGMファイルが見つかりません: {bgm_path}")
-                    logger.info("BGMなしで動画を出力します。")
-                    os.rename(temp_video_path, output_path)
-                else:
-                    # BGMを追加するコマンド
-                    bgm_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", temp_video_path,  # 元の動画
-                        "-stream_loop", "-1",   # BGMをループ再生
-                        "-i", bgm_path,         # BGMファイル
-                        "-filter_complex",
-                        # BGMの音量を0.25に調整し、無限ループ
-                        f"[1:a]volume=0.25,aloop=loop=-1:size=2e+09[bgm];"
-                        # 元の音声とBGMをミックス
-                        "[0:a][bgm]amix=inputs=2:duration=first[aout]",
-                        "-map", "0:v",          # 元の動画の映像
-                        "-map", "[aout]",       # ミックスした音声
-                        "-c:v", "copy",
-                        "-c:a", "aac",
-                        "-shortest",            # 最短の入力に合わせる
-                        "-t", str(video_duration),  # 元の動画の長さを維持
-                        output_path
-                    ]
+                # ナレーション音声があれば使用、なければ3秒間の無音
+                product_effect = None
+                if os.path.exists(product_audio_path) and os.path.getsize(product_audio_path) > 100:
+                    audio_duration = get_audio_duration(product_audio_path)
+                    display_duration = max(audio_duration + 0.2, 1.5)  # 少し余裕を持たせる
                     
-                    try:
-                        result = subprocess.run(bgm_cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True, text=True)
-                        logger.info(f"BGM付き動画を作成しました: {output_path}")
-                    except subprocess.CalledProcessError as e:
-                        logger.error(f"BGM追加中にエラー: {e.stderr}")
-                        # エラーが発生した場合は元の動画を使用
-                        os.rename(temp_video_path, output_path)
-                        logger.info(f"BGMなしで動画を出力しました: {output_path}")
-                
-                # 一時ファイルの削除
-                if os.path.exists(temp_video_path) and os.path.exists(output_path):
-                    os.remove(temp_video_path)
+                    # 各製品紹介に効果音をミックス（最終エンコードのフィルタ内で行う）
+                    if os.path.exists(syouhin_sound_path):
+                        product_effect = (syouhin_sound_path, 1.0)
+                    else:
+                        logger.warning(f"和太鼓効果音ファイルが見つかりません: {taiko_sound_path}")
+                else:
+                    logger.warning(f"製品 {rank} の音声ファイルが存在しないか無効です。無音を使用します。")
+                    display_duration = 3.0
+                    product_audio_path = None  # 無音はエンコード時に生成
                 
-                logger.info(f"動画作成完了: {output_path}")
-                return output_path
+                # アニメーション付き動画作成
+                product_animation_path = os.path.join(temp_dir, f"product_{rank}_animation.mp4")
+                animation_success = animation_futures[rank].result()
+
+                if animation_success:
+                    # アニメーション動画と音声を組み合わせたセグメント
+                    video_segments.append({
+                        "video": product_animation_path,
+                        "still": False,
+                        "audio": product_audio_path,
+                        "effect": product_effect,
+                        "duration": display_duration
+                    })
+                else:
+                    # アニメーション作成失敗時は通常の静止画セグメントを使用
+                    logger.warning(f"製品 {rank} のアニメーション作成に失敗。通常の静止画動画を作成します")
+
+                    # 製品画像と商品名のみを表示したスライド生成
+                    product_slide = self._create_product_slide(product, rank, brand_name=product['brand'], show_name=True)
+                    product_slide_path = os.path.join(temp_dir, f"product_{rank}_slide{FRAME_EXT}")
+                    product_slide.save(product_slide_path)
+
+                    video_segments.append({
+                        "video": product_slide_path,
+                        "still": True,
+                        "audio": product_audio_path,
+                        "effect": product_effect,
+                        "duration": display_duration
+                    })
+
+                # コメントを順番に追加していく
+                if reviews:
+                    # ワーカーで描画・保存済みのコメント付きスライド
+                    comment_slide_paths = comment_slide_futures[rank].result()
                     
-        except Exception as e:
-            logger.error(f"動画作成エラー: {str(e)}")
-            import traceback
-            logger.error(traceback.format_exc())
-            raise
\ No newline at end of file
+                    # コメントを順番に表示・読み上げる
+                    for i, review in enumerate(reviews[:3]):
+                        comment_slide_path = comment_slide_paths[i]
+                        if not comment_slide_path:
+                            continue
+                        
+                        # コメント用の音声を生成
+                        comment_audio_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}_audio.wav")
+                        comment_success = generate_narration(review, comment_audio_path, "random", self.SPEECH_SPEED)
+                        
+                        # コメントの音声が存在するか確認
+                        if not os.path.exists(comment_audio_path) or os.path.getsize(comment_audio_path) < 100:
+                            logger.warning(f"製品 {rank} のコメント {i+1} の音声ファイルが存在しないか無効です。無音を使用します。")
+                            comment_audio_path = None  # 無音はエンコード時に生成
+                            comment_duration = 3.0
+                        else:
+                            comment_duration = get_audio_duration(comment_audio_path)
+
+                        # 動画セグメントに追加
+                        video_segments.append({
+                            "video": comment_slide_path,
+                            "still": True,
+                            "audio": comment_audio_path,
+                            "duration": comment_duration
+                        })
+
+            # BGMを追加
+            bgm_path = os.path.join(self.bgm_dir, "しゅわしゅわハニーレモン.mp3")
+            if not os.path.exists(bgm_path):
+                logger.warning(f"BGMファイルが見つかりません: {bgm_path}")
+                logger.info("BGMなしで動画を出力します。")
+                bgm_path = None
+
+            return video_segments, bgm_path
+
+    def _encode_video(
+            self,
+            video_segments: List[Dict[str, Any]],
+            output_path: str,
+            bgm_path: Optional[str]
+        ) -> None:
+        """
+        セグメントを連結・BGMミックスして最終動画を出力（BGM付きで失敗した場合はBGMなしで作り直す）
+        
+        Args:
+            video_segments: セグメントリスト
+            output_path: 出力ファイルパス
+            bgm_path: BGMのパス（Noneの場合はBGMなし）
+        """
+        # 全セグメントの連結・BGMミックス・エンコードを1回で行う
+        try:
+            self._encode_segments(video_segments, output_path, bgm_path)
+            if bgm_path:
+                logger.info(f"BGM付き動画を作成しました: {output_path}")
+        except subprocess.CalledProcessError as e:
+            if not bgm_path:
+                logger.error(f"最終動画の連結エラー: {e.stderr}")
+                raise
+            logger.error(f"BGM追加中にエラー: {e.stderr}")
+            # エラーが発生した場合はBGMなしで作り直す
+            self._encode_segments(video_segments, output_path)
+            logger.info(f"BGMなしで動画を出力しました: {output_path}")
+
+        logger.info(f"動画作成完了: {output_path}")
\ No newline at end of file
@@ -18,11 +18,12 @@ import re
 import sys
 import unicodedata
 import time
+from concurrent.futures import ThreadPoolExecutor
 
 from openai import OpenAI
 
 # 音声関連のユーティリティをインポート
-from video.voice_utils import generate_narration, get_audio_duration, create_silent_audio
+from video.voice_utils import generate_narration, get_audio_duration
 from video.video_maker import VideoMaker
 
 # ロガー設定
@@ -717,6 +718,32 @@ class ChineseVideoMaker(VideoMaker):
             'product_intro': chinese_intro
         }
     
+    def _add_subtitle_overlays(
+        self,
+        segments: List[Dict[str, Any]],
+        chinese_texts: List[str],
+        temp_dir: str
+    ) -> List[Dict[str, Any]]:
+        """
+        日本語版のセグメントに中国語字幕画像を重ねたセグメントリストを作成
+        
+        Args:
+            segments: 日本語版のセグメントリスト
+            chinese_texts: 各セグメントの中国語字幕テキスト
+            temp_dir: 一時ディレクトリ
+            
+        Returns:
+            List[Dict[str, Any]]: 字幕画像を overlay に指定したセグメントリスト
+        """
+        cn_segments = []
+        for i, (segment, chinese_text) in enumerate(zip(segments, chinese_texts)):
+            # 字幕画像を生成 - 固定位置、縁取りのみ
+            subtitle_img = self.create_subtitle_image(chinese_text, self.VIDEO_WIDTH, self.VIDEO_HEIGHT)
+            subtitle_path = os.path.join(temp_dir, f"subtitle_{i}.png")
+            subtitle_img.save(subtitle_path)
+            cn_segments.append({**segment, "overlay": subtitle_path})
+        return cn_segments
+    
     def create_video_with_chinese(
             self,
             products: List[Dict[str, Any]],
@@ -761,9 +788,9 @@ class ChineseVideoMaker(VideoMaker):
         for i, product in enumerate(shuffled_products):
             product['new_rank'] = total_products - i 
         
-        # 動画セグメントのパスリスト（日本語・中国語）
-        jp_video_segments = []
-        cn_video_segments = []
+        # 動画セグメント（日本語版）と、それぞれに重ねる中国語字幕
+        video_segments = []
+        chinese_texts = []
         
         try:
             # 一時ディレクトリを作成
@@ -801,147 +828,43 @@ class ChineseVideoMaker(VideoMaker):
                 syouhin_sound_path = "data/bgm/ニュッ3.mp3"
                 
                 # 5. 音声処理とセグメント作成
+                # 音声の切り出し・効果音のミックスは最終エンコードのフィルタ内で行う
                 if os.path.exists(intro_audio_path) and os.path.getsize(intro_audio_path) > 100:
                     # 音声分析
                     audio_duration = get_audio_duration(intro_audio_path)
                     main_part_duration = audio_duration * 0.7  # メインパートは全体の70%と推定
                     bookmark_part_duration = audio_duration - main_part_duration  # 残りの30%をブックマークパート
                     
-                    # メインイントロ音声の切り出し
-                    main_intro_audio_path = os.path.join(temp_dir, "main_intro_audio.wav")
-                    extract_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", intro_audio_path,
-                        "-ss", "0",
-                        "-t", str(main_part_duration),
-                        "-c:a", "pcm_s16le",
-                        main_intro_audio_path
-                    ]
-                    
-                    subprocess.run(extract_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    
-                    # 和太鼓効果音を追加
-                    main_intro_with_effect_path = os.path.join(temp_dir, "main_intro_with_effect.wav")
-                    if os.path.exists(taiko_sound_path):
-                        mix_cmd = [
-                            "ffmpeg", "-y",
-                            "-i", main_intro_audio_path,
-                            "-i", taiko_sound_path,
-                            "-filter_complex",
-                            "[1:a]adelay=0|0,volume=1.2[effect];[0:a][effect]amix=inputs=2:duration=first[aout]",
-                            "-map", "[aout]",
-                            "-c:a", "pcm_s16le",
-                            main_intro_with_effect_path
-                        ]
-                        
-                        subprocess.run(mix_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        main_intro_audio_path = main_intro_with_effect_path
+                    # メインイントロ（ナレーション前半 + 和太鼓効果音）
+                    video_segments.append({
+                        "video": main_intro_slide_path,
+                        "still": True,
+                        "audio": intro_audio_path,
+                        "audio_offset": 0.0,
+                        "effect": (taiko_sound_path, 1.2) if os.path.exists(taiko_sound_path) else None,
+                        "duration": main_part_duration
+                    })
+                    chinese_texts.append(chinese_main_intro)
                     
-                    # メインイントロの日本語動画を作成（字幕なし）
-                    main_intro_jp_path = os.path.join(temp_dir, "main_intro_jp.mp4")
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-loop", "1",
-                        "-i", main_intro_slide_path,
-                        "-i", main_intro_audio_path,
-                        "-c:v", "libx264",
-                        "-tune", "stillimage",
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-pix_fmt", "yuv420p",
-                        "-shortest",
-                        main_intro_jp_path
-                    ]
-                    
-                    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    jp_video_segments.append(main_intro_jp_path)
-                    
-                    # メインイントロの中国語字幕付き動画を作成
-                    main_intro_cn_path = os.path.join(temp_dir, "main_intro_cn.mp4")
-                    self.create_video_segment_with_subtitle(
-                        image_path=main_intro_slide_path,
-                        audio_path=main_intro_audio_path,
-                        chinese_text=chinese_main_intro,
-                        output_path=main_intro_cn_path
-                    )
-                    cn_video_segments.append(main_intro_cn_path)
-                    
-                    # ブックマーク音声の切り出し
-                    bookmark_audio_path = os.path.join(temp_dir, "bookmark_audio.wav")
-                    extract_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", intro_audio_path,
-                        "-ss", str(main_part_duration),
-                        "-t", str(bookmark_part_duration),
-                        "-c:a", "pcm_s16le",
-                        bookmark_audio_path
-                    ]
-                    
-                    subprocess.run(extract_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    
-                    # ブックマークの日本語動画を作成（字幕なし）
-                    bookmark_jp_path = os.path.join(temp_dir, "bookmark_jp.mp4")
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-loop", "1",
-                        "-i", bookmark_intro_slide_path,
-                        "-i", bookmark_audio_path,
-                        "-c:v", "libx264",
-                        "-tune", "stillimage",
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-pix_fmt", "yuv420p",
-                        "-shortest",
-                        bookmark_jp_path
-                    ]
-                    
-                    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    jp_video_segments.append(bookmark_jp_path)
-                    
-                    # ブックマークの中国語字幕付き動画を作成
-                    bookmark_cn_path = os.path.join(temp_dir, "bookmark_cn.mp4")
-                    self.create_video_segment_with_subtitle(
-                        image_path=bookmark_intro_slide_path,
-                        audio_path=bookmark_audio_path,
-                        chinese_text=chinese_bookmark,
-                        output_path=bookmark_cn_path
-                    )
-                    cn_video_segments.append(bookmark_cn_path)
+                    # ブックマーク（ナレーション後半）
+                    video_segments.append({
+                        "video": bookmark_intro_slide_path,
+                        "still": True,
+                        "audio": intro_audio_path,
+                        "audio_offset": main_part_duration,
+                        "duration": bookmark_part_duration
+                    })
+                    chinese_texts.append(chinese_bookmark)
                 else:
                     # 音声生成に失敗した場合、デフォルトの無音動画を作成
                     logger.warning("イントロの音声ファイルが存在しないか無効です。デフォルト動画を作成します。")
-                    display_duration = 3.0
-                    intro_audio_path = os.path.join(temp_dir, "silent_intro.wav")
-                    create_silent_audio(intro_audio_path, display_duration)
-                    
-                    # 日本語イントロ動画（字幕なし）
-                    intro_jp_path = os.path.join(temp_dir, "intro_jp.mp4")
-                    cmd = [
-                        "ffmpeg", "-y",
-                        "-loop", "1",
-                        "-i", main_intro_slide_path,
-                        "-i", intro_audio_path,
-                        "-c:v", "libx264",
-                        "-tune", "stillimage",
-                        "-c:a", "aac",
-                        "-b:a", "192k",
-                        "-pix_fmt", "yuv420p",
-                        "-shortest",
-                        intro_jp_path
-                    ]
-                    
-                    subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    jp_video_segments.append(intro_jp_path)
-                    
-                    # 中国語イントロ動画（字幕付き）
-                    intro_cn_path = os.path.join(temp_dir, "intro_cn.mp4")
-                    self.create_video_segment_with_subtitle(
-                        image_path=main_intro_slide_path,
-                        audio_path=intro_audio_path,
-                        chinese_text=chinese_main_intro,
-                        output_path=intro_cn_path
-                    )
-                    cn_video_segments.append(intro_cn_path)
+                    video_segments.append({
+                        "video": main_intro_slide_path,
+                        "still": True,
+                        "audio": None,  # 無音はエンコード時に生成
+                        "duration": 3.0
+                    })
+                    chinese_texts.append(chinese_main_intro)
                 
                 # 6. 各製品のセグメントを作成
                 for product in shuffled_products:
@@ -963,34 +886,18 @@ class ChineseVideoMaker(VideoMaker):
                     success = generate_narration(product_intro_text, product_audio_path, "random", narration_speed)
                     
                     # 音声の存在チェック
+                    product_effect = None
                     if os.path.exists(product_audio_path) and os.path.getsize(product_audio_path) > 100:
                         audio_duration = get_audio_duration(product_audio_path)
                         display_duration = max(audio_duration + 0.2, 1.5)  # 余裕を持たせる
                         
                         # 効果音を追加
-                        product_audio_with_effect_path = os.path.join(temp_dir, f"product_{rank}_audio_with_effect.wav")
                         if os.path.exists(syouhin_sound_path):
-                            mix_cmd = [
-                                "ffmpeg", "-y",
-                                "-i", product_audio_path,
-                                "-i", syouhin_sound_path,
-                                "-filter_complex",
-                                "[1:a]adelay=0|0,volume=1.0[effect];[0:a][effect]amix=inputs=2:duration=first[aout]",
-                                "-map", "[aout]",
-                                "-c:a", "pcm_s16le",
-                                product_audio_with_effect_path
-                            ]
-                            
-                            try:
-                                subprocess.run(mix_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                                product_audio_path = product_audio_with_effect_path
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"製品{rank}の効果音追加に失敗: {e.stderr}")
+                            product_effect = (syouhin_sound_path, 1.0)
                     else:
                         logger.warning(f"製品 {rank} の音声ファイルが存在しないか無効です。無音を使用します。")
                         display_duration = 3.0
-                        product_audio_path = os.path.join(temp_dir, f"silent_{rank}.wav")
-                        create_silent_audio(product_audio_path, display_duration)
+                        product_audio_path = None  # 無音はエンコード時に生成
                     
                     # アニメーション付き製品紹介動画の作成試行
                     product_jp_animation_path = os.path.join(temp_dir, f"product_{rank}_jp_animation.mp4")
@@ -1003,75 +910,21 @@ class ChineseVideoMaker(VideoMaker):
                     )
                     
                     if animation_success:
-                        # アニメーション動画と音声を結合
-                        product_jp_path = os.path.join(temp_dir, f"product_{rank}_jp.mp4")
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-i", product_jp_animation_path,
-                            "-i", product_audio_path,
-                            "-c:v", "libx264",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest",
-                            product_jp_path
-                        ]
-                        
-                        try:
-                            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                            jp_video_segments.append(product_jp_path)
-                            
-                            # 中国語字幕付きアニメーション動画を作成
-                            product_cn_path = os.path.join(temp_dir, f"product_{rank}_cn.mp4")
-                            self.create_animation_video_segment_with_subtitle(
-                                animation_video_path=product_jp_path,
-                                chinese_text=chinese_product_intro,
-                                output_path=product_cn_path
-                            )
-                            cn_video_segments.append(product_cn_path)
-                        except subprocess.CalledProcessError as e:
-                            logger.error(f"製品 {rank} のアニメーション結合エラー: {e.stderr}")
-                            # 失敗時は静的画像版にフォールバック
-                            animation_success = False
-                    
-                    if not animation_success:
+                        product_video_path = product_jp_animation_path
+                    else:
                         # 静的な製品スライドの作成
                         product_slide = self._create_product_slide(product, rank, brand_name=brand_name, show_name=True)
-                        product_slide_path = os.path.join(temp_dir, f"product_{rank}_slide.png")
-                        product_slide.save(product_slide_path)
-                        
-                        # 日本語の静的製品紹介動画
-                        product_jp_path = os.path.join(temp_dir, f"product_{rank}_jp.mp4")
-                        cmd = [
-                            "ffmpeg", "-y",
-                            "-loop", "1",
-                            "-i", product_slide_path,
-                            "-i", product_audio_path,
-                            "-c:v", "libx264",
-                            "-tune", "stillimage",
-                            "-c:a", "aac",
-                            "-b:a", "192k",
-                            "-pix_fmt", "yuv420p",
-                            "-shortest",
-                            product_jp_path
-                        ]
-                        
-                        try:
-                            subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                            jp_video_segments.append(product_jp_path)
-                            
-                            # 中国語字幕付き静的製品紹介動画
-                            product_cn_path = os.path.join(temp_dir, f"product_{rank}_cn.mp4")
-                            self.create_video_segment_with_subtitle(
-                                image_path=product_slide_path,
-                                audio_path=product_audio_path,
-                                chinese_text=chinese_product_intro,
-                                output_path=product_cn_path
-                            )
-                            cn_video_segments.append(product_cn_path)
-                        except subprocess.CalledProcessError as e:
-                            logger.error(f"製品 {rank} の静的動画生成エラー: {e.stderr}")
-                            continue
+                        product_video_path = os.path.join(temp_dir, f"product_{rank}_slide.png")
+                        product_slide.save(product_video_path)
+                    
+                    video_segments.append({
+                        "video": product_video_path,
+                        "still": not animation_success,
+                        "audio": product_audio_path,
+                        "effect": product_effect,
+                        "duration": display_duration
+                    })
+                    chinese_texts.append(chinese_product_intro)
                     
                     # レビューコメントがある場合、それぞれのコメントを処理
                     if reviews:
@@ -1163,164 +1016,36 @@ class ChineseVideoMaker(VideoMaker):
                             # 音声ファイルのチェック
                             if not os.path.exists(comment_audio_path) or os.path.getsize(comment_audio_path) < 100:
                                 logger.warning(f"製品 {rank} のコメント {i+1} の音声ファイルが無効です。無音を使用します。")
-                                comment_audio_path = os.path.join(temp_dir, f"silent_comment_{rank}_{i+1}.wav")
-                                create_silent_audio(comment_audio_path, 3.0)
-                            
-                            # 日本語コメント動画の作成
-                            comment_jp_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}_jp.mp4")
-                            cmd = [
-                                "ffmpeg", "-y",
-                                "-loop", "1",
-                                "-i", comment_slide_path,
-                                "-i", comment_audio_path,
-                                "-c:v", "libx264",
-                                "-tune", "stillimage",
-                                "-c:a", "aac",
-                                "-b:a", "192k",
-                                "-pix_fmt", "yuv420p",
-                                "-shortest",
-                                comment_jp_path
-                            ]
+                                comment_audio_path = None  # 無音はエンコード時に生成
+                                comment_duration = 3.0
+                            else:
+                                comment_duration = get_audio_duration(comment_audio_path)
                             
-                            try:
-                                subprocess.run(cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                                jp_video_segments.append(comment_jp_path)
-                                
-                                # 中国語字幕付きコメント動画の作成
-                                comment_cn_path = os.path.join(temp_dir, f"product_{rank}_comment_{i+1}_cn.mp4")
-                                self.create_video_segment_with_subtitle(
-                                    image_path=comment_slide_path,
-                                    audio_path=comment_audio_path,
-                                    chinese_text=chinese_review,
-                                    output_path=comment_cn_path
-                                )
-                                cn_video_segments.append(comment_cn_path)
-                            except subprocess.CalledProcessError as e:
-                                logger.error(f"製品 {rank} のコメント {i+1} の動画生成エラー: {e.stderr}")
-                                continue
-                
-                # 7. 日本語動画の連結
-                jp_concat_file = os.path.join(temp_dir, "jp_concat.txt")
-                with open(jp_concat_file, "w") as f:
-                    for segment in jp_video_segments:
-                        f.write(f"file '{segment}'\n")
+                            video_segments.append({
+                                "video": comment_slide_path,
+                                "still": True,
+                                "audio": comment_audio_path,
+                                "duration": comment_duration
+                            })
+                            chinese_texts.append(chinese_review)
                 
-                jp_temp_video_path = os.path.join(temp_dir, "no_bgm_jp_output.mp4")
-                jp_concat_cmd = [
-                    "ffmpeg", "-y",
-                    "-f", "concat",
-                    "-safe", "0",
-                    "-i", jp_concat_file,
-                    "-c", "copy",
-                    jp_temp_video_path
-                ]
-                
-                try:
-                    subprocess.run(jp_concat_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    logger.info("日本語動画セグメントの連結が完了しました")
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"日本語動画の連結エラー: {e.stderr}")
-                    raise
-                
-                # 8. 中国語動画の連結
-                cn_concat_file = os.path.join(temp_dir, "cn_concat.txt")
-                with open(cn_concat_file, "w") as f:
-                    for segment in cn_video_segments:
-                        f.write(f"file '{segment}'\n")
-                
-                cn_temp_video_path = os.path.join(temp_dir, "no_bgm_cn_output.mp4")
-                cn_concat_cmd = [
-                    "ffmpeg", "-y",
-                    "-f", "concat",
-                    "-safe", "0",
-                    "-i", cn_concat_file,
-                    "-c", "copy",
-                    cn_temp_video_path
-                ]
-                
-                try:
-                    subprocess.run(cn_concat_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                    logger.info("中国語動画セグメントの連結が完了しました")
-                except subprocess.CalledProcessError as e:
-                    logger.error(f"中国語動画の連結エラー: {e.stderr}")
-                    raise
-                
-                # 9. 動画の長さを取得
-                jp_video_duration = self._get_video_duration(jp_temp_video_path)
-                cn_video_duration = self._get_video_duration(cn_temp_video_path)
-                
-                if jp_video_duration <= 0 or cn_video_duration <= 0:
-                    logger.warning("動画の長さが取得できませんでした。デフォルト値を使用します。")
-                    jp_video_duration = 60.0
-                    cn_video_duration = 60.0
-                
-                # 10. BGMを追加
+                # 7. BGMの確認
                 bgm_path = os.path.join(self.bgm_dir, "しゅわしゅわハニーレモン.mp3")
                 if not os.path.exists(bgm_path):
                     logger.warning(f"BGMファイルが見つかりません: {bgm_path}")
                     logger.info("BGMなしで動画を出力します。")
-                    os.rename(jp_temp_video_path, output_path)
-                    os.rename(cn_temp_video_path, chinese_output_path)
-                else:
-                    # 日本語動画にBGMを追加
-                    jp_bgm_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", jp_temp_video_path,
-                        "-stream_loop", "-1",
-                        "-i", bgm_path,
-                        "-filter_complex",
-                        f"[1:a]volume=0.25,aloop=loop=-1:size=2e+09[bgm];"
-                        "[0:a][bgm]amix=inputs=2:duration=first[aout]",
-                        "-map", "0:v",
-                        "-map", "[aout]",
-                        "-c:v", "copy",
-                        "-c:a", "aac",
-                        "-shortest",
-                        "-t", str(jp_video_duration),
-                        output_path
-                    ]
-                    
-                    try:
-                        subprocess.run(jp_bgm_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        logger.info(f"日本語動画にBGMを追加しました: {output_path}")
-                    except subprocess.CalledProcessError as e:
-                        logger.error(f"日本語動画へのBGM追加に失敗: {e.stderr}")
-                        # エラーが発生した場合は元の動画を使用
-                        os.rename(jp_temp_video_path, output_path)
-                        logger.info(f"BGMなしで日本語動画を出力しました: {output_path}")
-                    
-                    # 中国語動画にBGMを追加
-                    cn_bgm_cmd = [
-                        "ffmpeg", "-y",
-                        "-i", cn_temp_video_path,
-                        "-stream_loop", "-1",
-                        "-i", bgm_path,
-                        "-filter_complex",
-                        f"[1:a]volume=0.25,aloop=loop=-1:size=2e+09[bgm];"
-                        "[0:a][bgm]amix=inputs=2:duration=first[aout]",
-                        "-map", "0:v",
-                        "-map", "[aout]",
-                        "-c:v", "copy",
-                        "-c:a", "aac",
-                        "-shortest",
-                        "-t", str(cn_video_duration),
-                        chinese_output_path
-                    ]
-                    
-                    try:
-                        subprocess.run(cn_bgm_cmd, check=True, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
-                        logger.info(f"中国語動画にBGMを追加しました: {chinese_output_path}")
-                    except subprocess.CalledProcessError as e:
-                        logger.error(f"中国語動画へのBGM追加に失敗: {e.stderr}")
-                        # エラーが発生した場合は元の動画を使用
-                        os.rename(cn_temp_video_path, chinese_output_path)
-                        logger.info(f"BGMなしで中国語動画を出力しました: {chinese_output_path}")
+                    bgm_path = None
+                
+                # 8. 中国語版は同じセグメントに字幕画像を重ねるだけ
+                cn_video_segments = self._add_subtitle_overlays(video_segments, chinese_texts, temp_dir)
                 
-                # 一時ファイルの削除
-                if os.path.exists(jp_temp_video_path) and os.path.exists(output_path):
-                    os.remove(jp_temp_video_path)
-                if os.path.exists(cn_temp_video_path) and os.path.exists(chinese_output_path):
-                    os.remove(cn_temp_video_path)
+                # 9. 日本語・中国語動画をそれぞれ1回のFFmpeg実行で連結・BGMミックス・エンコード
+                # 2本は独立しているので並行して実行する
+                with ThreadPoolExecutor(max_workers=2) as encode_pool:
+                    jp_future = encode_pool.submit(self._encode_video, video_segments, output_path, bgm_path)
+                    cn_future = encode_pool.submit(self._encode_video, cn_video_segments, chinese_output_path, bgm_path)
+                    jp_future.result()
+                    cn_future.result()
                 
                 logger.info(f"日本語動画作成完了: {output_path}")
                 logger.info(f"中国語字幕付き動画作成完了: {chinese_output_path}")
@@ -11,6 +11,7 @@ import random
 import requests
 import wave
 import re
+from functools import lru_cache
 
 # ログ設定
 logger = logging.getLogger(__name__)
@@ -45,6 +46,7 @@ def check_voicevox_available():
 def get_audio_duration(audio_file_path: str) -> float:
     """
     オーディオファイルの再生時間（秒）を取得する
+    同じファイル（パスと更新時刻が同じ）の結果はキャッシュする
     
     Parameters:
     audio_file_path (str): オーディオファイルのパス
@@ -53,40 +55,58 @@ def get_audio_duration(audio_file_path: str) -> float:
     float: オーディオの長さ（秒）、エラー時は0.0
     """
     try:
-        # FFmpegを使用して長さを取得
-        cmd = [
-            "ffprobe", 
-            "-v", "error", 
-            "-show_entries", "format=duration", 
-            "-of", "default=noprint_wrappers=1:nokey=1", 
-            audio_file_path
-        ]
-        
-        result = subprocess.run(
-            cmd,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-            text=True
-        )
-        
-        if result.returncode == 0:
-            duration = float(result.stdout.strip())
-            return duration
-        
-        # FFmpegが失敗した場合、WAVファイルなら直接読み込む
-        if audio_file_path.lower().endswith('.wav'):
-            with wave.open(audio_file_path, 'rb') as wf:
-                # フレーム数/サンプルレートで秒数を計算
-                duration = wf.getnframes() / wf.getframerate()
-                return duration
-                
-        logger.warning(f"オーディオファイルの長さを取得できませんでした: {audio_file_path}")
-        return 0.0
-        
+        mtime = os.path.getmtime(audio_file_path)
+        return _probe_audio_duration(audio_file_path, mtime)
     except Exception as e:
+        # 失敗はキャッシュされないので、次回の呼び出しで改めて調べる
         logger.error(f"オーディオ長さ取得エラー: {e}")
         return 0.0
 
+@lru_cache(maxsize=256)
+def _probe_audio_duration(audio_file_path: str, mtime: float) -> float:
+    """
+    オーディオファイルの再生時間（秒）を実際に調べる
+    （失敗時は例外を送出し、成功した結果だけをキャッシュに残す）
+    
+    Parameters:
+    audio_file_path (str): オーディオファイルのパス
+    mtime (float): ファイルの更新時刻（キャッシュキー）
+    
+    Returns:
+    float: オーディオの長さ（秒）
+    
+    Raises:
+    RuntimeError: 長さを取得できなかった場合
+    """
+    # WAVファイルならヘッダーから直接計算（ffprobeのプロセス起動を省く）
+    if audio_file_path.lower().endswith('.wav'):
+        try:
+            with wave.open(audio_file_path, 'rb') as wf:
+                # フレーム数/サンプルレートで秒数を計算
+                return wf.getnframes() / wf.getframerate()
+        except (wave.Error, EOFError):
+            pass
+    
+    # FFmpegを使用して長さを取得
+    cmd = [
+        "ffprobe", 
+        "-v", "error", 
+        "-show_entries", "format=duration", 
+        "-of", "default=noprint_wrappers=1:nokey=1", 
+        audio_file_path
+    ]
+    
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True
+    )
+    
+    if result.returncode != 0:
+        raise RuntimeError(f"オーディオファイルの長さを取得できませんでした: {audio_file_path}")
+    return float(result.stdout.strip())
+
 def generate_narration(text: str, output_path: str, voice_type: str = "default", speed: float = None) -> bool:
     """
     テキストから音声ナレーションを生成する
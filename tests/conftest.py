@@ -0,0 +1,9 @@
+import os
+import sys
+
+# src 配下のモジュールをテストから import できるようにする
+# （social_posts 内のモジュールは同じディレクトリからの import を前提にしている）
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+for path in (os.path.join(ROOT, "src"), os.path.join(ROOT, "src", "social_posts")):
+    if path not in sys.path:
+        sys.path.insert(0, path)
@@ -0,0 +1,20 @@
+import asyncio
+
+from async_utils import run_sync
+
+
+async def _answer():
+    await asyncio.sleep(0)
+    return 42
+
+
+def test_run_sync_without_running_loop():
+    assert run_sync(_answer()) == 42
+
+
+def test_run_sync_inside_running_loop():
+    async def caller():
+        # 同期APIをイベントループ内から呼んでも RuntimeError にならない
+        return run_sync(_answer())
+
+    assert asyncio.run(caller()) == 42
@@ -0,0 +1,111 @@
+import json
+import threading
+import time
+
+from oauth_cache import OAuthTokenCache
+
+
+def _no_refresh(refresh_token):
+    return None
+
+
+def test_unknown_expiry_is_treated_as_valid():
+    cache = OAuthTokenCache(_no_refresh, access_token="token")
+    assert not cache.needs_refresh()
+
+
+def test_missing_token_needs_refresh():
+    cache = OAuthTokenCache(_no_refresh)
+    assert cache.needs_refresh()
+
+
+def test_remaining_time_is_not_recorded_as_lifetime():
+    cache = OAuthTokenCache(_no_refresh, access_token="token")
+    cache.set_expiry(2 * 60 * 60)
+    assert cache.lifetime is None
+    assert cache.expires_at > time.time()
+
+
+def test_needs_refresh_uses_lifetime_not_remaining_time():
+    # 寿命24時間のトークンを残り2時間の時点で初めて見た場合も、寿命の10%（2.4時間）を基準に更新する
+    cache = OAuthTokenCache(_no_refresh, access_token="token")
+    cache.set_expiry(2 * 60 * 60, lifetime=24 * 60 * 60)
+    assert cache.needs_refresh()
+
+    cache.set_expiry(20 * 60 * 60, lifetime=24 * 60 * 60)
+    assert not cache.needs_refresh()
+
+
+def test_needs_refresh_falls_back_to_min_buffer_without_lifetime():
+    cache = OAuthTokenCache(_no_refresh, access_token="token", min_buffer_secs=3 * 60 * 60)
+    cache.set_expiry(2 * 60 * 60)
+    assert cache.needs_refresh()
+
+    cache = OAuthTokenCache(_no_refresh, access_token="token", min_buffer_secs=60)
+    cache.set_expiry(2 * 60 * 60)
+    assert not cache.needs_refresh()
+
+
+def test_invalidate_forces_refresh():
+    cache = OAuthTokenCache(_no_refresh, access_token="token")
+    cache.set_expiry(24 * 60 * 60, lifetime=24 * 60 * 60)
+    cache.invalidate()
+    assert cache.needs_refresh()
+
+
+def test_refresh_records_lifetime_and_persists(tmp_path):
+    store_path = tmp_path / "tokens.json"
+
+    def refresh(refresh_token):
+        assert refresh_token == "refresh-1"
+        return {"access_token": "new", "refresh_token": "refresh-2", "expires_in": 86400}
+
+    cache = OAuthTokenCache(refresh, store_path=str(store_path), access_token="old", refresh_token="refresh-1")
+    assert cache.refresh()
+    assert cache.access_token == "new"
+    assert cache.refresh_token == "refresh-2"
+    assert cache.lifetime == 86400
+    assert not cache.needs_refresh()
+
+    stored = json.loads(store_path.read_text(encoding="utf-8"))
+    assert stored["access_token"] == "new"
+    assert stored["refresh_token"] == "refresh-2"
+
+    # 保存したトークンは次回の初期化で読み込まれる
+    reloaded = OAuthTokenCache(_no_refresh, store_path=str(store_path))
+    assert reloaded.access_token == "new"
+    assert reloaded.lifetime == 86400
+
+
+def test_failed_refresh_keeps_current_token():
+    cache = OAuthTokenCache(_no_refresh, access_token="old", refresh_token="refresh")
+    cache.invalidate()
+    assert cache.get_valid_token() == "old"
+
+
+def test_get_valid_token_refreshes_once_across_threads():
+    calls = []
+
+    def refresh(refresh_token):
+        calls.append(refresh_token)
+        time.sleep(0.05)
+        return {"access_token": "new", "expires_in": 86400}
+
+    cache = OAuthTokenCache(refresh, access_token="old", refresh_token="refresh")
+    cache.invalidate()
+
+    barrier = threading.Barrier(8)
+    tokens = []
+
+    def worker():
+        barrier.wait()
+        tokens.append(cache.get_valid_token())
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert tokens == ["new"] * 8
@@ -0,0 +1,18 @@
+import jwt
+import pytest
+
+tiktok_poster = pytest.importorskip("tiktok_poster")
+
+
+def test_jwt_expiry_returns_lifetime_from_iat():
+    token = jwt.encode({"iat": 1000, "exp": 1000 + 86400}, "test-secret-key-with-at-least-32-bytes", algorithm="HS256")
+    assert tiktok_poster._jwt_expiry(token) == (87400.0, 86400.0)
+
+
+def test_jwt_expiry_without_iat_has_unknown_lifetime():
+    token = jwt.encode({"exp": 87400}, "test-secret-key-with-at-least-32-bytes", algorithm="HS256")
+    assert tiktok_poster._jwt_expiry(token) == (87400.0, None)
+
+
+def test_jwt_expiry_ignores_opaque_tokens():
+    assert tiktok_poster._jwt_expiry("act.opaque-token") is None
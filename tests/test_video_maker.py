@@ -0,0 +1,98 @@
+import random
+from multiprocessing import shared_memory
+
+import pytest
+from PIL import Image, ImageFilter
+
+from video import video_maker
+from video.video_maker import VideoMaker, _dilate_mask
+
+
+def _char_width(text, font, draw=None):
+    # 全角文字は20px、それ以外は10pxとして測る
+    return sum(20 if ord(ch) > 0x7F else 10 for ch in text)
+
+
+@pytest.fixture
+def maker():
+    # __init__ は ffmpeg の検出などを行うため、折り返し処理だけを使うインスタンスを作る
+    instance = VideoMaker.__new__(VideoMaker)
+    instance.calculate_text_width = _char_width
+    return instance
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "abc",
+    "これは折り返しのテストです。mixed text と全角文字",
+    "あ" * 37,
+])
+@pytest.mark.parametrize("max_width", [20, 45, 100, 1000])
+def test_wrap_by_width_lines_fit_max_width(maker, text, max_width):
+    lines = maker._wrap_by_width(text, None, max_width)
+    assert "".join(lines) == text
+    for line in lines:
+        assert _char_width(line, None) <= max_width
+
+
+def test_wrap_by_width_advances_on_single_wide_char(maker):
+    # 1文字で最大幅を超える場合も1文字ずつ進めて無限ループしない
+    assert maker._wrap_by_width("あいう", None, 5) == ["あ", "い", "う"]
+
+
+def _random_mask(size, seed):
+    rng = random.Random(seed)
+    mask = Image.new("L", size, 0)
+    for _ in range(20):
+        mask.putpixel((rng.randrange(size[0]), rng.randrange(size[1])), rng.randrange(1, 256))
+    return mask
+
+
+@pytest.mark.parametrize("radius", [0, 1, 2, 5])
+def test_dilate_mask_matches_max_filter(radius):
+    mask = _random_mask((40, 30), seed=radius)
+    expected = mask.filter(ImageFilter.MaxFilter(2 * radius + 1)) if radius else mask
+    assert _dilate_mask(mask, radius).tobytes() == expected.tobytes()
+
+
+def test_worker_background_is_released_from_shared_memory(tmp_path, monkeypatch):
+    monkeypatch.setattr(video_maker, "_detect_hwenc", lambda: "libx264")
+    background = Image.new("RGBA", (4, 3), (1, 2, 3, 4))
+    data = background.tobytes()
+    key = ("background.png", None, 4, 3)
+    shm = shared_memory.SharedMemory(create=True, size=len(data))
+    try:
+        shm.buf[:len(data)] = data
+        init_kwargs = {"output_dir": str(tmp_path / "out"), "temp_dir": str(tmp_path / "tmp")}
+        video_maker._init_render_worker(init_kwargs, (shm.name, key))
+        attached = video_maker._worker_background_shm
+        assert video_maker._BACKGROUND_CACHE[key].tobytes() == data
+
+        # 背景画像がバッファを参照したままでも BufferError にならずに閉じられる
+        video_maker._release_worker_background()
+        assert attached.buf is None
+        assert key not in video_maker._BACKGROUND_CACHE
+        assert video_maker._worker_background_shm is None
+    finally:
+        video_maker._worker_maker = None
+        shm.close()
+        shm.unlink()
+
+
+def test_worker_reuses_detected_encoder_and_product_images(tmp_path, monkeypatch):
+    def fail_detect():
+        raise AssertionError("ワーカーでエンコーダを検出し直している")
+
+    monkeypatch.setattr(video_maker, "_detect_hwenc", fail_detect)
+    product_image = Image.new("RGB", (2, 2))
+    init_kwargs = {
+        "output_dir": str(tmp_path / "out"),
+        "temp_dir": str(tmp_path / "tmp"),
+        "vcodec": "h264_nvenc",
+    }
+    try:
+        video_maker._init_render_worker(init_kwargs, None, {"product-1": product_image})
+        assert video_maker._worker_maker.vcodec == "h264_nvenc"
+        assert video_maker._worker_maker._product_images["product-1"] is product_image
+    finally:
+        video_maker._worker_maker = None
@@ -0,0 +1,44 @@
+import wave
+
+from video import voice_utils
+from video.voice_utils import get_audio_duration
+
+
+def _write_wav(path, frames, framerate=8000):
+    with wave.open(str(path), "wb") as wf:
+        wf.setnchannels(1)
+        wf.setsampwidth(2)
+        wf.setframerate(framerate)
+        wf.writeframes(b"\x00\x00" * frames)
+
+
+def test_get_audio_duration_reads_wav_header(tmp_path):
+    path = tmp_path / "voice.wav"
+    _write_wav(path, 4000)
+    assert get_audio_duration(str(path)) == 0.5
+
+
+def test_get_audio_duration_missing_file_returns_zero(tmp_path):
+    assert get_audio_duration(str(tmp_path / "missing.wav")) == 0.0
+
+
+def test_failed_probe_is_not_cached(tmp_path, monkeypatch):
+    voice_utils._probe_audio_duration.cache_clear()
+    calls = []
+
+    class _Failed:
+        returncode = 1
+        stdout = ""
+
+    def fake_run(cmd, **kwargs):
+        calls.append(cmd)
+        return _Failed()
+
+    monkeypatch.setattr(voice_utils.subprocess, "run", fake_run)
+    path = tmp_path / "voice.mp3"
+    path.write_bytes(b"not audio")
+
+    assert get_audio_duration(str(path)) == 0.0
+    assert get_audio_duration(str(path)) == 0.0
+    # 失敗結果をキャッシュしないので毎回 ffprobe を呼び直す
+    assert len(calls) == 2
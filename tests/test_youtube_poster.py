@@ -0,0 +1,21 @@
+import pytest
+
+from social_posts.youtube_poster import _ISO_DUR
+
+
+@pytest.mark.parametrize("duration, expected", [
+    ("PT1H2M30S", ("1", "2", "30")),
+    ("PT59S", (None, None, "59")),
+    ("PT45.5S", (None, None, "45.5")),
+    ("PT3M", (None, "3", None)),
+    ("PT2H", ("2", None, None)),
+])
+def test_iso_duration_parses_components(duration, expected):
+    match = _ISO_DUR.match(duration)
+    assert match is not None
+    assert match.groups() == expected
+
+
+@pytest.mark.parametrize("duration", ["P1D", "1H2M", "PT1S2M", "PTxS"])
+def test_iso_duration_rejects_unsupported_formats(duration):
+    assert _ISO_DUR.match(duration) is None